@@ -1,11 +1,18 @@
 import json
 import os
+import hashlib
 import numpy as np
+from types import MappingProxyType
 from typing import Any, Generator
 
 PATH_INPUT = os.path.join(os.path.dirname(os.path.realpath(__file__)),'Datos Tesina','Input_JSON_Schedule_Optimization.json')
 PATH_INPUT_TEST = os.path.join(os.path.dirname(os.path.realpath(__file__)),'Datos Tesina','Input_JSON_Schedule_Optimization test.json')
 
+#codificacion del cromosoma, array int32 con forma (2, maquinas, periodos)
+GEN_VACIO : int = -1 #valor de una celda sin task_mode asignado
+CAPA_GEN : int = 0 #capa con el id del gen (producto, demanda, paso, task_mode)
+CAPA_INTERVALO : int = 1 #capa con el intervalo del task_mode
+
 def cargar_datos(archivo : str | os.PathLike) -> dict:
     """
     cargar_datos - 
@@ -45,6 +52,8 @@ class Datos:
     def __init__(self, path = PATH_INPUT):
         datos = cargar_datos(path)
         
+        self.path : str = os.path.realpath(path)
+        
         #crear diccionario de maquinas
         """
         self.machines : {
@@ -228,6 +237,187 @@ class Datos:
         """
         self.time = dict()
         self.time['time_leap'] = datos['configuration']['time_leap']
+        #cambios de turno ordenados para busqueda binaria
+        self.time_leap_ordenado : list[int] = sorted(self.time['time_leap'])
+        
+        #crear indices de task_modes
+        """
+        self.task_mode_task : {"task_mode_0" : "task_0", ...}
+        self.task_mode_duracion : {"task_mode_0" : cantidad de intervalos, ...}
+        self.task_mode_power : {"task_mode_0" : (t_0,t_1,...,t_a), ...}
+        self.task_maquina_task_mode : {("task_0", "Machine_0") : "task_mode_0", ...}
+        """
+        self.task_mode_task : dict[str, str] = dict()
+        self.task_mode_duracion : dict[str, int] = dict()
+        self.task_mode_power : dict[str, list[float]] = dict()
+        self.task_maquina_task_mode : dict[tuple[str, str], str] = dict()
+        
+        for task, task_mode_dict in self.tasks.items():
+            for task_mode, value in task_mode_dict.items():
+                #se conserva el primer task encontrado, igual que la busqueda lineal
+                self.task_mode_task.setdefault(task_mode, task)
+                self.task_mode_power.setdefault(task_mode, value['power'])
+                self.task_mode_duracion.setdefault(task_mode, len(value['power']))
+                
+                if 'machine' in value:
+                    self.task_maquina_task_mode.setdefault((task, value['machine']), task_mode)
+        
+        #crear indice de recetas
+        """
+        self.recetas : {
+            "product_0" : receta_producto("product_0"),
+            ...
+        }
+        """
+        self.recetas : dict[str, list[tuple[str, dict[str, list[str]], int]]] = {
+            producto : self.__crear_receta(producto=producto) for producto in self.products
+        }
+        
+        #crear opciones de cada paso de las recetas, utilizadas al inicializar individuos
+        """
+        self.receta_opciones : {
+            "product_0" : [
+                [("task_mode_0", duracion, ("machine_0", ...)), ...], #paso 0
+                ...
+            ],
+            ...
+        }
+        """
+        self.receta_opciones : dict[str, list[list[tuple[str, int, tuple[str, ...]]]]] = {
+            producto : [
+                [
+                    (task_mode, self.task_mode_duracion[task_mode], tuple(maquinas))
+                    for task_mode, maquinas in task_modes.items()
+                ]
+                for _, task_modes, _ in receta
+            ]
+            for producto, receta in self.recetas.items()
+        }
+        
+        #crear tabla de task modes alternativos en otras maquinas, utilizada al cambiar de maquina un task mode
+        """
+        self.task_mode_alternativas : {
+            "task_mode_0" : (("machine_1", "task_mode_1", duracion), ...),
+            ...
+        }
+        """
+        self.task_mode_alternativas : dict[str, tuple[tuple[str, str, int], ...]] = dict()
+        for task, task_mode_dict in self.tasks.items():
+            for task_mode in task_mode_dict:
+                self.task_mode_alternativas.setdefault(task_mode, tuple(
+                    (
+                        maquina
+                        , self.task_maquina_task_mode[(task, maquina)]
+                        , self.task_mode_duracion[self.task_maquina_task_mode[(task, maquina)]]
+                    )
+                    for task_mode_alternativo in task_mode_dict if task_mode_alternativo != task_mode
+                    for maquina, task_modes_maquina in self.machines.items()
+                    if (task_mode_alternativo in task_modes_maquina) and ((task, maquina) in self.task_maquina_task_mode)
+                ))
+        
+        #crear tabla de genes
+        """
+        self.genes : [
+            (producto, demanda, paso, task_mode), #gen 0
+            ...
+            (producto, demanda, paso, task_mode), #gen n
+        ]
+        
+        self.genes_id : {
+            (producto, demanda, paso, task_mode) : 0,
+            ...
+            (producto, demanda, paso, task_mode) : n
+        }
+        """
+        self.genes : list[tuple[str, int, int, str]] = list()
+        self.genes_id : dict[tuple[str, int, int, str], int] = dict()
+        
+        for producto, demanda in self.iterar_productos():
+            for _, task_modes, paso in self.receta_producto(producto=producto):
+                for task_mode in task_modes:
+                    self.genes_id[(producto, demanda, paso, task_mode)] = len(self.genes)
+                    self.genes.append((producto, demanda, paso, task_mode))
+        
+        #energia por periodo, la posicion `periodo - 1` corresponde al periodo
+        self.energia_solar_cantidad = np.zeros(len(self.periodos))
+        self.energia_socket_precio = np.zeros(len(self.periodos))
+        
+        for periodo in self.periodos:
+            self.energia_solar_cantidad[periodo - 1] = self.energy[periodo]['Solar']['amount']
+            self.energia_socket_precio[periodo - 1] = self.energy[periodo]['Socket Energy']['price']
+        
+        #tabla de potencia por (task_mode, intervalo)
+        #la ultima fila y la ultima columna son 0, se usan para GEN_VACIO (indice -1)
+        self.task_mode_id : dict[str, int] = {
+            task_mode : i for i, task_mode in enumerate(self.task_mode_power.keys())
+        }
+        
+        max_intervalos = max(self.task_mode_duracion.values())
+        self.potencia_task_mode = np.zeros(
+            (len(self.task_mode_id) + 1, max_intervalos + 1)
+        )
+        for task_mode, energy in self.task_mode_power.items():
+            self.potencia_task_mode[self.task_mode_id[task_mode], :len(energy)] = energy
+        
+        #task_mode de cada gen, el ultimo valor es la fila de GEN_VACIO
+        self.gen_task_mode = np.full(
+            len(self.genes) + 1
+            , len(self.task_mode_id)
+            , dtype = np.int32
+        )
+        for gen_id, (_, _, _, task_mode) in enumerate(self.genes):
+            self.gen_task_mode[gen_id] = self.task_mode_id[task_mode]
+        
+        #tabla de tareas (producto, demanda, paso), utilizada por el indice de viabilidad
+        self.tareas : list[tuple[str, int, int]] = list()
+        self.tareas_id : dict[tuple[str, int, int], int] = dict()
+        for producto, demanda in self.iterar_productos():
+            for _, _, paso in self.receta_producto(producto=producto):
+                self.tareas_id[(producto, demanda, paso)] = len(self.tareas)
+                self.tareas.append((producto, demanda, paso))
+        
+        #tarea de cada gen, el ultimo valor (GEN_VACIO) apunta a una tarea ficticia
+        self.gen_tarea = np.array(
+            [self.tareas_id[(producto, demanda, paso)] for producto, demanda, paso, _ in self.genes]
+            + [len(self.tareas)]
+            , dtype = np.int32
+        )
+        
+        #vecinos en la receta, -1 si no hay paso anterior o siguiente
+        self.tarea_anterior = np.full(len(self.tareas), -1, dtype = np.int32)
+        self.tarea_siguiente = np.full(len(self.tareas), -1, dtype = np.int32)
+        for (producto, demanda, paso), tarea in self.tareas_id.items():
+            if (producto, demanda, paso - 1) in self.tareas_id:
+                self.tarea_anterior[tarea] = self.tareas_id[(producto, demanda, paso - 1)]
+            if (producto, demanda, paso + 1) in self.tareas_id:
+                self.tarea_siguiente[tarea] = self.tareas_id[(producto, demanda, paso + 1)]
+        
+        #deadline del ultimo paso de cada producto demandado, np.inf si no tiene
+        self.tarea_deadline = np.full(len(self.tareas), np.inf)
+        for producto, demanda, deadline in self.iterar_deadlines():
+            ultimo_paso = self.receta_producto(producto=producto)[-1][2]
+            self.tarea_deadline[self.tareas_id[(producto, demanda, ultimo_paso)]] = deadline
+        
+        self.maquinas_nombre : list[str] = sorted(self.machines_id, key=self.machines_id.get)
+        
+        #la instancia es compartida por todos los individuos, ya no se puede modificar
+        for nombre, valor in list(vars(self).items()):
+            object.__setattr__(self, nombre, _congelar(valor))
+        
+        self.__congelado = True
+    
+    def __setattr__(self, nombre : str, valor : Any):
+        if getattr(self, "_Datos__congelado", False):
+            raise AttributeError(f"Datos es inmutable, no se puede asignar '{nombre}'")
+        
+        object.__setattr__(self, nombre, valor)
+    
+    def __delattr__(self, nombre : str):
+        raise AttributeError(f"Datos es inmutable, no se puede eliminar '{nombre}'")
+    
+    def __reduce__(self):
+        #al copiar o enviar a otro proceso se utiliza la instancia cargada de ese proceso
+        return (cargar_instancia, (self.path,))
     
     def energia_periodo(self, t : int) -> dict[str, dict[str, Any]]:
         """
@@ -277,6 +467,9 @@ class Datos:
         cada elemento de la lista es una actividad (o paso) y da la informacion de
         cuales maquinas y task_modes se pueden utilizar para completar ese paso.
         
+        La receta se crea al cargar los datos, el resultado es de solo lectura
+        (`tuple` y `MappingProxyType`).
+        
         Parameters
         ----------
         producto (str) :
@@ -304,6 +497,27 @@ class Datos:
             
         """
         
+        return self.recetas[producto]
+    
+    def __crear_receta(self, producto : str) -> list[tuple[str, dict[str, list[str]], int]]:
+        """
+        __crear_receta - 
+        
+        Crea la receta del producto, utilizada para llenar `self.recetas`.
+        Revisa `receta_producto` para más información.
+        
+        Parameters
+        ----------
+        producto (str) :
+            Nombre del producto
+        
+        Returns
+        -------
+        list[tuple[str, dict[str, list[str]], int]] :
+            lista con los pasos para crear el producto
+        
+        """
+        
         resultado = []
         producto_dict = self.products[producto]
 
@@ -356,7 +570,7 @@ class Datos:
                     task, task_modes , paso_num = paso #extender el paso
                     for task_mode, maquinas in task_modes.items(): #iterar entre el task_mode y las maquinas que lo pueden procesar
                         for maquina in maquinas: #iterar entre las maquinas
-                            for intervalo in range(len(self.tasks[task][task_mode]["power"])): #intervar entre el tiempo que se tarda en completar el task_mode
+                            for intervalo in range(self.task_mode_duracion[task_mode]): #intervar entre el tiempo que se tarda en completar el task_mode
                                 yield (producto, demanda, paso_num, task, task_mode, maquina, intervalo)
 
     def iterar_productos(self) -> Generator[tuple[str, int], Any, None]:
@@ -429,11 +643,10 @@ class Datos:
         
         """
         
-        for t, task_mode_dict in self.tasks.items():
-            if task_mode in task_mode_dict:
-                return t 
-        else:
+        if task_mode not in self.task_mode_task:
             raise ValueError(f"{task_mode} no encontrado en un task")
+        
+        return self.task_mode_task[task_mode]
      
     def intervalos(self, task_mode : str) -> list[int]:
         """
@@ -460,10 +673,7 @@ class Datos:
             
         
         """
-        for task in self.tasks:
-            if task_mode in self.tasks[task]:
-                
-                return self.tasks[task][task_mode]['power']
+        return self.task_mode_power.get(task_mode)
     
     def iterar_deadlines(self) -> Generator[tuple[str, int, int], Any, None]:
         """
@@ -506,13 +716,7 @@ class Datos:
         
         """
         
-        resultado = None
-        
-        for key, value in self.tasks[task].items():
-            if maquina == value["machine"]:
-                return key
-            
-        return resultado
+        return self.task_maquina_task_mode.get((task, maquina))
     
 def task_mode_a_str(
         producto : str
@@ -633,6 +837,166 @@ def str_a_energia(
     
     return energia
 
+def cromosoma_vacio(
+        maquinas : int
+        , periodos : int
+    ) -> np.ndarray:
+    """
+    cromosoma_vacio -
+    
+    Crea un cromosoma sin task_modes asignados.
+    
+    Parameters
+    ----------
+    maquinas (int) :
+        Cantidad de maquinas.
+    
+    periodos (int) :
+        Cantidad de periodos.
+    
+    Returns
+    -------
+    np.ndarray :
+        Array int32 con forma `(2, maquinas, periodos)` lleno de `GEN_VACIO`.
+        La capa `CAPA_GEN` guarda el id del gen y la capa `CAPA_INTERVALO`
+        el intervalo del task_mode.
+    
+    """
+    
+    return np.full(
+        shape = (2, maquinas, periodos),
+        fill_value = GEN_VACIO,
+        dtype = np.int32
+    )
+
+def cromosoma_a_str(
+        array : np.ndarray
+        , datos : Datos
+        , sep : str = "|"
+    ) -> np.ndarray:
+    """
+    cromosoma_a_str -
+    
+    Convierte un cromosoma codificado con enteros a su forma con str,
+    utilizada solo para exportar (csv y gráficas).
+    
+    Parameters
+    ----------
+    array (np.ndarray) :
+        Cromosoma con forma `(2, maquinas, periodos)`.
+    
+    datos (Datos) :
+        Una instancia de la clase Datos, contiene la tabla de genes.
+    
+    sep (str, optional, defaults to "|") :
+        El separador utilizado para guardar la información.
+    
+    Returns
+    -------
+    np.ndarray :
+        Array de objetos con forma `(maquinas, periodos)`, cada celda es `""` si
+        esta vacia o `"producto|demanda|task_mode|intervalo|paso"`.
+    
+    """
+    
+    resultado = np.full(
+        shape = array.shape[1:],
+        fill_value = "",
+        dtype = 'object'
+    )
+    
+    for maquina, periodo in zip(*np.nonzero(array[CAPA_GEN] != GEN_VACIO)):
+        producto, demanda, paso, task_mode = datos.genes[array[CAPA_GEN, maquina, periodo]]
+        
+        resultado[maquina, periodo] = task_mode_a_str(
+            producto=producto
+            , demanda=demanda
+            , task_mode=task_mode
+            , intervalo=int(array[CAPA_INTERVALO, maquina, periodo])
+            , paso=paso
+            , sep=sep
+        )
+    
+    return resultado
+
+def _congelar(valor : Any) -> Any:
+    """
+    _congelar - 
+    
+    Crea una version de solo lectura de `valor`, los diccionarios se cambian
+    por `MappingProxyType`, las listas por `tuple` y los `np.ndarray` no se pueden escribir.
+    
+    Parameters
+    ----------
+    valor (Any) :
+        Valor a congelar.
+    
+    Returns
+    -------
+    Any :
+        Valor de solo lectura.
+    
+    """
+    
+    if isinstance(valor, (dict, MappingProxyType)):
+        return MappingProxyType({k : _congelar(v) for k, v in valor.items()})
+    
+    if isinstance(valor, (list, tuple)):
+        return tuple(_congelar(v) for v in valor)
+    
+    if isinstance(valor, np.ndarray):
+        valor = valor.copy()
+        valor.setflags(write=False)
+    
+    return valor
+
+#instancias cargadas en este proceso, (path, hash del archivo) -> Datos
+_INSTANCIAS : dict[tuple[str, str], Datos] = dict()
+#ultimo estado conocido de cada archivo, path -> (st_mtime_ns, st_size, hash del archivo)
+_ARCHIVOS : dict[str, tuple[int, int, str]] = dict()
+
+def cargar_instancia(path : str | os.PathLike = PATH_INPUT) -> Datos:
+    """
+    cargar_instancia - 
+    
+    Regresa la instancia de `Datos` del archivo, compartida por todo el proceso.
+    
+    El archivo solo se lee y procesa la primera vez, o cuando cambia su contenido.
+    Las instancias se guardan por la ruta real del archivo y el hash (sha256) de su contenido.
+    
+    Parameters
+    ----------
+    path (str | os.PathLike, optional, defaults to PATH_INPUT) :
+        Ruta al archivo JSON con los datos.
+    
+    Returns
+    -------
+    Datos :
+        Instancia inmutable de los datos del problema.
+    
+    Raises
+    ------
+    FileNotFoundError :
+        Si no existe el archivo.
+    
+    """
+    
+    ruta = os.path.realpath(path)
+    estado = os.stat(ruta)
+    
+    #solo se calcula el hash si el archivo cambió desde la ultima revision
+    firma = _ARCHIVOS.get(ruta)
+    if (firma is None) or (firma[:2] != (estado.st_mtime_ns, estado.st_size)):
+        with open(ruta, 'rb') as f:
+            firma = (estado.st_mtime_ns, estado.st_size, hashlib.sha256(f.read()).hexdigest())
+        _ARCHIVOS[ruta] = firma
+    
+    llave = (ruta, firma[2])
+    if llave not in _INSTANCIAS:
+        _INSTANCIAS[llave] = Datos(path=ruta)
+    
+    return _INSTANCIAS[llave]
+
 def main():
     # Cargar datos desde un archivo JSON específico
     archivo = PATH_INPUT
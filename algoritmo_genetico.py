@@ -1,6 +1,7 @@
 import os
 from genetico.IndividuoA import IndividuoA
 from genetico.Poblacion import Poblacion
+from genetico.Islas import Islas
 from grid_search import (
     buscar_mejor_parametros
     , unzip_grid_search
@@ -621,6 +622,61 @@ def optimizacion_final_tesis():
 
     print("Terminado")
 
+def optimizacion_final_tesis_islas():
+    """
+    optimizacion_final_tesis_islas - 
+    
+    Función para ejecutar las cinco configuraciones de `optimizacion_final_tesis`
+    al mismo tiempo como islas, cada una en su propio proceso y con migración
+    de los mejores individuos cada 5 generaciones.
+    """
+    
+    dict_param, ubicacion = buscar_mejor_parametros()
+    print("Mejor simulación:", ubicacion)
+    print("Parámetros", dict_param)
+    
+    parametros = dict(
+        n=20
+        , probabilidad_mutacion=dict_param["p_mutacion"]
+        , p_optimizacion_deterministica=dict_param["p_optimizacion_deterministica"]
+        , p_saltar_periodo=dict_param["probabilidad_saltar_periodo"]
+        , peso_seleccion_paso=dict_param["peso_seleccion_paso"]
+        , peso_seleccion_demanda=dict_param["peso_seleccion_demanda"]
+        , peso_mutacion_mover_periodo=dict_param["peso_mover_periodo"]
+        , peso_mutacion_cambiar_task=dict_param["peso_cambiar_task"]
+        , intentos_mutacion=dict_param["intentos_mutacion"]
+        , prob_mutacion_mover_periodo_reducir=dict_param["probabilidad_reducir"]
+        , prob_mutacion_mover_periodo_completa=dict_param["probabilidad_completo"]
+    )
+    
+    islas = Islas(
+        parametros=[
+            dict(parametros, id_nombre="islas_promedio")
+            , dict(parametros, id_nombre="islas_ciclo_makespan"
+                , ciclo=dict(makespan=5,energia=5), iniciar_makespan=True)
+            , dict(parametros, id_nombre="islas_ciclo_energia"
+                , ciclo=dict(makespan=5,energia=5), iniciar_makespan=False)
+            , dict(parametros, id_nombre="islas_ciclo_10makespan_5energia"
+                , ciclo=dict(makespan=10,energia=5), iniciar_makespan=True)
+            , dict(parametros, id_nombre="islas_ciclo_10energia_5makespan"
+                , ciclo=dict(makespan=5,energia=10), iniciar_makespan=False)
+        ]
+        , generaciones_migracion=5
+        , n_migrantes=1
+        , topologia="anillo"
+        , generaciones=200
+        , tiempo=None
+        , id_nombre="islas_tesis"
+        , random_seed=12345
+    )
+    
+    islas.calcular_solucion(verbose=True
+        , path=os.path.join("Datos Tesina", "algoritmo genetico","Tesis")
+    )
+    islas.guardar(path=os.path.join("Datos Tesina", "algoritmo genetico","Tesis"))
+    
+    print("Terminado")
+
 def optimizacion_prueba():
     
     #dict_param, ubicacion = buscar_mejor_parametros()
@@ -1,4 +1,4 @@
-from Carga_Datos import Datos, PATH_INPUT, PATH_INPUT_TEST
+from Carga_Datos import cargar_instancia, PATH_INPUT, PATH_INPUT_TEST
 import numpy as np
 import glob
 import os
@@ -192,7 +192,7 @@ class ModeloMIP:
         self.path_log = os.path.join(self.path_base,"mip_schedule.log") #ubicacion del log
         
         self.modelo = gp.Model("MIP_Scheduling")
-        self.datos = Datos(path = path_datos)
+        self.datos = cargar_instancia(path = path_datos)
         
         self.modelo.setParam("LogFile", self.path_log)
         self.modelo.setParam("NodefileDir",self.path_base)
@@ -224,7 +224,7 @@ class ModeloMIP:
         
         lista_df = []
         
-        cambio_turnos : list[int] = self.datos.time['time_leap'] #ejemplo: [192,384,576,768,960]
+        cambio_turnos : list[int] = list(self.datos.time['time_leap']) #ejemplo: [192,384,576,768,960]
         cambio_turnos.append(max(self.datos.periodos))
         
         cambio_turnos_np = np.array(cambio_turnos)
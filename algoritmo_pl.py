@@ -1,4 +1,4 @@
-from Carga_Datos import Datos, PATH_INPUT
+from Carga_Datos import cargar_instancia, PATH_INPUT
 import gurobipy as gp
 import numpy as np
 import time
@@ -11,7 +11,7 @@ class ModeloLineal:
         
         self.modelo = gp.Model("Scheduling")
         
-        self.datos = Datos(path = PATH_INPUT)
+        self.datos = cargar_instancia(path = PATH_INPUT)
         
         self.delta = delta #un numero pequeño
         
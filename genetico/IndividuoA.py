@@ -1,13 +1,15 @@
 
 import pandas as pd
 import numpy as np
-from typing import Any
+from typing import Any, Literal
 import random as rand
+from bisect import bisect_left, bisect_right
 from graficas import (
     task_array_to_dataframe
     , grafica_gantt_plt
     , dataframe_to_array
 )
+from Carga_Datos import cromosoma_vacio
 from .IndividuoBase import IndividuoBase
 
 class IndividuoA(IndividuoBase):
@@ -18,6 +20,8 @@ class IndividuoA(IndividuoBase):
     de optimización.
     """
     
+    __slots__ = ()
+    
     def __init__(
             self
             , inicializar : bool = False
@@ -67,6 +71,7 @@ class IndividuoA(IndividuoBase):
                         df
                         , dict_maquinas=self.datos.machines_id
                         , periodos=max(self.datos.periodos)
+                        , input_path=self.INPUT_PATH
                     )
                     #print("Lectura de dataframe exitosa")
                     #ya se cargó exitosamente el cromosoma
@@ -143,7 +148,15 @@ class IndividuoA(IndividuoBase):
         if (peso_seleccion_demanda < 0):
             raise ValueError(f"peso_seleccion_demanda debe ser un número mayor o igual a 0, valor: {peso_seleccion_demanda}")
         
+        #cada intento inicia con un cromosoma vacio
+        self.cromosoma = cromosoma_vacio(
+            maquinas = len(self.maquinas.keys())
+            , periodos = len(self.periodos)
+        )
+        
         periodo = 1
+        #las maquinas se recorren en el orden de self.maquinas para que el resultado
+        #solo dependa de la semilla aleatoria
         maquinas_set = set(self.maquinas.keys())
         maquinas_en_periodo = set()
         
@@ -158,6 +171,7 @@ class IndividuoA(IndividuoBase):
                 tasks_a_agregar[producto] = dict()
                 tasks_a_agregar[producto]["demanda"] = dict()
                 tasks_a_agregar[producto]["receta"] = self.datos.receta_producto(producto=producto)
+                tasks_a_agregar[producto]["opciones"] = self.datos.receta_opciones[producto]
             
             tasks_a_agregar[producto]["demanda"][demanda] = dict()
             tasks_a_agregar[producto]["demanda"][demanda]["paso_actual"] = 0
@@ -172,7 +186,7 @@ class IndividuoA(IndividuoBase):
             if len(lista_productos_por_terminar) == 0: #se agregaron todos los productos
                 break
             
-            for maquina in maquinas_set: #revisar las maquinas en el periodo
+            for maquina in self.maquinas: #revisar las maquinas en el periodo
                 if not self._IndividuoBase__es_vacio_array( #revisa si la maquina esta ocupada
                         periodo=periodo
                         , maquina=maquina
@@ -228,19 +242,12 @@ class IndividuoA(IndividuoBase):
                     
                     hay_espacio = False
                     hay_maquinas = False
-                    for task_mode, maquinas in tasks_a_agregar[producto]["receta"][paso_actual][1].items():
+                    for task_mode, duracion, maquinas in tasks_a_agregar[producto]["opciones"][paso_actual]:
                         #revisa si hay suficientes periodos disponibles para agregar el task mode
-                        espacio_task_mode = (
-                            len(self.datos.intervalos(task_mode=task_mode)) 
-                            <= intervalos_time_leap
-                        )
+                        espacio_task_mode = duracion <= intervalos_time_leap
                         
                         #revisa si hay task mode en maquina faltante
-                        set_maquinas_task_mode = set()
-                        for maquina in maquinas:
-                            set_maquinas_task_mode.add(maquina)
-                            
-                        maquinas_agregar = maquinas_faltantes.intersection(set_maquinas_task_mode)
+                        maquinas_agregar = [maquina for maquina in maquinas if maquina in maquinas_faltantes]
                         if (espacio_task_mode) and (len(maquinas_agregar) != 0):
                             
                             if demanda not in demanda_info:
@@ -296,7 +303,7 @@ class IndividuoA(IndividuoBase):
                 )
                 
                 if agregado:
-                    tasks_a_agregar[producto]["demanda"][demanda]["pasos"][paso_actual] = periodo + len(self.datos.intervalos(task_mode=task_mode_seleccionado)) - 1
+                    tasks_a_agregar[producto]["demanda"][demanda_seleccionada]["pasos"][paso_actual] = periodo + self.datos.task_mode_duracion[task_mode_seleccionado] - 1
                     
                     tasks_a_agregar[producto]["demanda"][demanda_seleccionada]["paso_actual"] = paso_actual + 1
                     producto_agregado = True
@@ -322,6 +329,88 @@ class IndividuoA(IndividuoBase):
                 periodo = periodo + 1
                 continue
     
+    def seleccionar_task_mode_ocupado(
+            self
+            , array : np.ndarray[tuple[int, int], str] = None
+            , maquina : str = None
+            , ponderacion : Literal["energia", "retraso"] | None = None
+        ) -> tuple[str, int] | None:
+        """
+        seleccionar_task_mode_ocupado - 
+        
+        Selecciona aleatoriamente un task mode asignado, utilizando el indice
+        de task modes por maquina (`self.task_modes_por_maquina`), por lo que
+        nunca se selecciona un espacio vacio.
+        
+        Parameters
+        ----------
+        array (np.ndarray[tuple[int, int], str], optional, defaults to None) :
+            Array a revisar.
+            Si es None se utiliza `self.cromosoma`
+        
+        maquina (str, optional, defaults to None) :
+            Si no es None solo se seleccionan task modes de esta máquina.
+        
+        ponderacion (Literal["energia", "retraso"] | None, optional, defaults to None) :
+            Peso de cada task mode en la selección:
+            * None: todos los task modes tienen la misma probabilidad.
+            * "energia": proporcional al precio de la energia de la red electrica durante el task mode.
+            * "retraso": proporcional al periodo donde termina el task mode respecto al makespan,
+                los task modes que terminan cerca del makespan tienen mayor probabilidad.
+        
+        Returns
+        -------
+        tuple[str, int] | None :
+            `(maquina, periodo de inicio)` del task mode seleccionado,
+            None si no hay task modes asignados.
+        
+        Raises
+        ------
+        ValueError :
+            Si `ponderacion` no es un valor válido.
+        """
+        if ponderacion not in (None, "energia", "retraso"):
+            raise ValueError(f"ponderacion no válida: {ponderacion}")
+        
+        task_modes_por_maquina = self.task_modes_por_maquina(array=array)
+        maquinas = list(task_modes_por_maquina.keys()) if maquina is None else [maquina]
+        
+        if ponderacion is None:
+            #uniforme, primero la maquina con peso igual a su cantidad de task modes
+            cantidades = [len(task_modes_por_maquina[m][0]) for m in maquinas]
+            if sum(cantidades) == 0:
+                return None
+            maquina_seleccionada = rand.choices(maquinas, weights=cantidades, k=1)[0]
+            return maquina_seleccionada, rand.choice(task_modes_por_maquina[maquina_seleccionada][0])
+        
+        candidatos = [
+            (m, inicio, termina, gen_id)
+            for m in maquinas
+            for inicio, termina, gen_id in task_modes_por_maquina[m][1]
+        ]
+        if len(candidatos) == 0:
+            return None
+        
+        if ponderacion == "energia":
+            precio = self.datos.energia_socket_precio
+            pesos = [
+                float(np.dot(
+                    self.datos.potencia_task_mode[self.datos.gen_task_mode[gen_id], :termina - inicio + 1]
+                    , precio[inicio - 1:termina]
+                ))
+                for _, inicio, termina, gen_id in candidatos
+            ]
+        else:
+            makespan = max(termina for _, _, termina, _ in candidatos)
+            pesos = [termina / makespan for _, _, termina, _ in candidatos]
+        
+        #si todos los pesos son 0 (ej. energia gratis) se selecciona uniformemente
+        if sum(pesos) <= 0:
+            pesos = None
+        
+        maquina_seleccionada, inicio, _, _ = rand.choices(candidatos, weights=pesos, k=1)[0]
+        return maquina_seleccionada, inicio
+    
     def mutacion_mover_periodo(
             self
             , array : np.ndarray[tuple[int, int], str] = None
@@ -330,6 +419,7 @@ class IndividuoA(IndividuoBase):
             , probabilidad_reducir : float = 0.5
             , probabilidad_completo : float = 0.5
             , guardar_en_cromosoma : bool = True
+            , ponderacion : Literal["energia", "retraso"] | None = None
         ) -> tuple[np.ndarray[tuple[Any, ...], np.dtype[Any]], bool, int]:
         """
         mutacion_mover_periodo - 
@@ -348,7 +438,8 @@ class IndividuoA(IndividuoBase):
         
         periodo (int, optional, defaults to None) :
             Periodo donde se moverá el task mode.
-            Si es None se escoge un periodo aleatoriamente con igual probabilidad.
+            Si es None se escoge aleatoriamente un task mode asignado (en `maquina` si no es None),
+            revisa `self.seleccionar_task_mode_ocupado`.
         
         probabilidad_reducir (float, optional, defaults to 0.5) :
             Se genera un número aleatorio, si es menor a `probabilidad_reducir`
@@ -363,6 +454,10 @@ class IndividuoA(IndividuoBase):
         guardar_en_cromosoma (bool, optional, defaults to True) :
             Si la mutacion es viable se guardará el array resultado en `self.cromosoma` si True.
         
+        ponderacion (Literal["energia", "retraso"] | None, optional, defaults to None) :
+            Peso para seleccionar el task mode si `periodo` es None,
+            revisa `self.seleccionar_task_mode_ocupado`.
+        
         Returns
         -------
         tuple[np.ndarray[tuple[Any, ...], np.dtype[Any]], bool] :
@@ -371,7 +466,8 @@ class IndividuoA(IndividuoBase):
             * bool: si se pudo realizar la mutación o no.
             * int: motivo de falla o exito, 1 si la mutación fue exitosa, -1 si error en el cambio del task mode,
                     -2 si la mutación no es viable,
-                    -4 si el espacio seleccionado no tiene un task asignado
+                    -4 si el espacio seleccionado no tiene un task asignado,
+                    -5 si el task mode no se puede mover en la dirección seleccionada
         
         Raises
         ------
@@ -392,13 +488,18 @@ class IndividuoA(IndividuoBase):
         if array is None:
             array = self.cromosoma
         
+        #si no da un periodo, se selecciona aleatoriamente un task mode asignado
+        if periodo is None:
+            seleccion = self.seleccionar_task_mode_ocupado(
+                array=array, maquina=maquina, ponderacion=ponderacion
+            )
+            if seleccion is None:
+                return array, False, -4
+            maquina, periodo = seleccion
+        
         #si no da una maquina, se selecciona aleatoriamente una
         if maquina is None:
             maquina = rand.choice(list(self.maquinas.keys()))
-        
-        #si no da un periodo, se selecciona aleatoriamente uno
-        if periodo is None:
-            periodo = rand.choice(self.periodos)
 
         #se revisa si maquina-periodo seleccionados esta ocupada
         es_vacio = self._IndividuoBase__es_vacio_array(
@@ -418,23 +519,41 @@ class IndividuoA(IndividuoBase):
             , array = array
         )
         
+        #si se guarda en el cromosoma se modifica directamente dentro de una transaccion
+        en_lugar = guardar_en_cromosoma and (array is self.cromosoma)
+        if en_lugar:
+            self.iniciar_cambios()
+        
         #se mueve el task_mode
         try: #la mutacion fue exitosa
-            _,_ , resultado, array_resultado =self.mover_periodo_task_mode(
+            _, periodo_nuevo, resultado, array_resultado =self.mover_periodo_task_mode(
                 maquina=maquina
                 , periodo=periodo
                 , tipo_movimiento=(-1 if rand.random() < probabilidad_reducir else 1)
                 , completa=(True if rand.random() < probabilidad_completo else False)
                 , array=array
+                , en_lugar=en_lugar
             )
         except: #la mutacion no fue exitosa
+            if en_lugar:
+                self.revertir_cambios()
             return array, False, -1
         
+        #el task mode no se movio, no hay mutacion
+        if resultado and (periodo_nuevo == periodo):
+            if en_lugar:
+                self.revertir_cambios()
+            return array, False, -5
+        
         if resultado and self.es_viable(array_resultado)["todo"]["bool"]:
-            if guardar_en_cromosoma:
-                self.cromosoma = array_resultado.copy()
+            if en_lugar:
+                self.confirmar_cambios()
+            elif guardar_en_cromosoma:
+                self.cromosoma = array_resultado
             return array_resultado, True, 1
         else:
+            if en_lugar:
+                self.revertir_cambios()
             return array, False, -2
     
     def mutacion_cambiar_task_mode(
@@ -444,6 +563,7 @@ class IndividuoA(IndividuoBase):
             , periodo : int = None
             , guardar_en_cromosoma : bool = True
             , verbose : bool = False
+            , ponderacion : Literal["energia", "retraso"] | None = None
         ) -> tuple[np.ndarray[tuple[Any, ...], np.dtype[Any]], bool, int]:
         """
         mutacion_cambiar_task_mode - 
@@ -462,7 +582,8 @@ class IndividuoA(IndividuoBase):
         
         periodo (int, optional, defaults to None) :
             Periodo donde se moverá el task mode.
-            Si es None se escoge un periodo aleatoriamente con igual probabilidad.
+            Si es None se escoge aleatoriamente un task mode asignado (en `maquina` si no es None),
+            revisa `self.seleccionar_task_mode_ocupado`.
         
         guardar_en_cromosoma (bool, optional, defaults to True) :
             Si la mutacion es viable se guardará el array resultado en `self.cromosoma` si True.
@@ -470,6 +591,10 @@ class IndividuoA(IndividuoBase):
         verbose (bool, optional, defaults to False) :
             Si se imprime información adicional para debug.
         
+        ponderacion (Literal["energia", "retraso"] | None, optional, defaults to None) :
+            Peso para seleccionar el task mode si `periodo` es None,
+            revisa `self.seleccionar_task_mode_ocupado`.
+        
         Returns
         -------
         tuple[np.ndarray[tuple[Any, ...], np.dtype[Any]], bool] :
@@ -490,13 +615,18 @@ class IndividuoA(IndividuoBase):
             if verbose:
                 print("Utilizando cromosoma")
 
+        #si no da un periodo, se selecciona aleatoriamente un task mode asignado
+        if periodo is None:
+            seleccion = self.seleccionar_task_mode_ocupado(
+                array=array, maquina=maquina, ponderacion=ponderacion
+            )
+            if seleccion is None:
+                return array, False, -4
+            maquina, periodo = seleccion
+        
         #si no da una maquina, se selecciona aleatoriamente una
         if maquina is None:
             maquina = rand.choice(list(self.maquinas.keys()))
-
-        #si no da un periodo, se selecciona aleatoriamente uno
-        if periodo is None:
-            periodo = rand.choice(self.periodos)
         
         if verbose:
             print(f"Maquina:{maquina},Periodo:{periodo}")
@@ -527,11 +657,22 @@ class IndividuoA(IndividuoBase):
         if verbose:
             print(f"Producto:{producto},Demanda:{demanda},Task mode:{task_mode},Paso:{paso}")
         
+        #task modes alternativos del mismo task en otra maquina
+        alternativas = [
+            alternativa for alternativa in self.datos.task_mode_alternativas[task_mode]
+            if alternativa[0] != maquina
+        ]
+        #no hay maquina disponible a cambiar
+        if len(alternativas) == 0:
+            return array, False, -3
+        maquina_nueva, task_mode_nuevo, _ = rand.choice(alternativas) #se selecciona una maquina aleatoria
+        
         receta = self.datos.receta_producto(producto=producto)
         ultimo_paso = receta[-1][2]
         if verbose:
             print(f"Receta:{receta}\nUltimo paso:{ultimo_paso}")
         
+        #ventana entre el paso anterior y el paso siguiente
         if paso==ultimo_paso:
             maximo_periodo : int = max(self.periodos)
         else:
@@ -543,20 +684,11 @@ class IndividuoA(IndividuoBase):
         else:
             minimo_periodo : int = self._IndividuoBase__buscar_task_mode(
                 producto_buscar=producto, demanda_buscar=demanda, paso_buscar=paso-1,array=array,inicio=False)[1]+1 
-
-        _, dict_task_modes, _ = receta[paso]
-        lista_disponible = list()
-        for task_mode_receta in dict_task_modes:
-            if task_mode == task_mode_receta:
-                continue
-            for maquina_nueva in dict_task_modes[task_mode_receta]:
-                if maquina_nueva == maquina:
-                    continue
-                lista_disponible.append(maquina_nueva)
-        #no hay maquina disponible a cambiar
-        if len(lista_disponible) == 0:
-            return array, False, -3
-        maquina_nueva : str = rand.choice(lista_disponible) #se selecciona una maquina aleatoria
+        
+        #si se guarda en el cromosoma se modifica directamente dentro de una transaccion
+        en_lugar = guardar_en_cromosoma and (array is self.cromosoma)
+        if en_lugar:
+            self.iniciar_cambios()
         
         #intentar cambiar el task mode
         try:
@@ -568,16 +700,30 @@ class IndividuoA(IndividuoBase):
                 , array=array
                 , inicio=minimo_periodo
                 , termina=maximo_periodo
+                , en_lugar=en_lugar
+                , task_mode_nuevo=task_mode_nuevo
             )
         except:
             #el cambio no fue exitoso
+            if en_lugar:
+                self.revertir_cambios()
             return array, False, -1
         
-        if resultado and self.es_viable(array_resultado)["todo"]["bool"]:
-            if guardar_en_cromosoma:
-                self.cromosoma = array_resultado.copy()
+        #no hay periodo disponible en la ventana de la maquina nueva
+        if not resultado:
+            if en_lugar:
+                self.revertir_cambios()
+            return array, False, -1
+        
+        if self.es_viable(array_resultado)["todo"]["bool"]:
+            if en_lugar:
+                self.confirmar_cambios()
+            elif guardar_en_cromosoma:
+                self.cromosoma = array_resultado
             return array_resultado, True, 1
         else:
+            if en_lugar:
+                self.revertir_cambios()
             return array, False, -2
     
     def mutacion(
@@ -636,7 +782,7 @@ class IndividuoA(IndividuoBase):
             ["mover_periodo","cambiar_task"]
             , weights=[peso_mover_periodo,peso_cambiar_task]
             , k=1
-        )
+        )[0]
         
         array_resultado = self.cromosoma.copy()
         bool_resultado = False
@@ -676,7 +822,8 @@ class IndividuoA(IndividuoBase):
         2.- Se itera nuevamente todos los productos y pasos.
         2.1.- Si el paso para un producto esta asignado, se revisa el siguiente.
         2.2.- Si no esta asignado, se agrega un task mode aleatoriamente. Respentando los periodos de inicio del paso anterior.
-        3.- Si el descediente no es viable, se selecciona aleatoriamente la asignacion completa de uno de los ascedientes 
+        3.- Si el descediente no es viable, se repara con `self.reparar`.
+        4.- Si no se puede reparar, se selecciona aleatoriamente la asignacion completa de uno de los ascedientes 
             utilizando la probabilidad en `Probabilidad`.
         
         Probabilidad
@@ -698,7 +845,8 @@ class IndividuoA(IndividuoBase):
             Una tupla con elementos:
             * 1ro: Un individuo creado a partir de dos ascendientes.
             * 2do: Número que representa el origen del cromosoma, 1 si copia completamente la asignación de esta intancia,
-                2 si copia completamente la asignación de `padre`, 3 si es una combinación de los 2 ascedientes.
+                2 si copia completamente la asignación de `padre`, 3 si es una combinación de los 2 ascedientes,
+                4 si es una combinación de los 2 ascendientes que fue reparada.
         
         Raises
         ------
@@ -832,6 +980,7 @@ class IndividuoA(IndividuoBase):
                     maquina=maquina
                     , task_mode=task_mode
                     , inicio=periodo_minimo
+                    , primero=True
                 )
                 
                 if len(periodos_lista) == 0:
@@ -861,18 +1010,20 @@ class IndividuoA(IndividuoBase):
         if descendiente.es_viable()["todo"]["bool"]:
             #el descendiente es viable dar resultado
             return descendiente, 3
+        elif descendiente.reparar():
+            #el descendiente se pudo reparar
+            return descendiente, 4
         else:
             #el descendiente no es viable, por lo tanto se regresará aleatoriamente uno de los ascedenetes
             primero = rand.choices(
                 ["madre", "padre"], weights=probabilidad, k=1
             )[0]
             
+            #se regresa una copia, los cambios en el descendiente se hacen en el mismo array
             if primero == "madre":
-                descendiente.cromosoma = self.cromosoma
-                return descendiente, 1
+                return self.clone(), 1
             else:
-                descendiente.cromosoma = padre.cromosoma
-                return descendiente, 2
+                return padre.clone(), 2
 
     def grafica_gantt(
             self
@@ -1022,36 +1173,195 @@ class IndividuoA(IndividuoBase):
         """
         optimizacion_deterministica - 
         
-        Optimiza al individuo reduciendo el periodo todos los task modes
-        utilizando `mover_periodo_task_mode` con `completa = True`
-        """
+        Optimiza al individuo reduciendo el periodo todos los task modes,
+        equivalente a utilizar `mover_periodo_task_mode` con `completa = True`
+        en cada task mode hasta que ninguno se pueda mover.
         
-        df = self.dataframe()
+        Los task modes se revisan en orden de inicio y cada uno se mueve en un solo salto
+        al periodo `max(fin del paso anterior + 1, fin del task mode anterior en la maquina + 1,
+        inicio del turno)`, se conserva el orden de los task modes en cada maquina.
         
-        df.sort_values(by="Start", inplace=True)
+        Solo se optimiza si el individuo es viable.
+        
+        Parameters
+        ----------
+        save_path (str, optional, defaults to None) :
+            Si no es None se guarda el dataframe previo, ordenado por inicio, en esta ubicación.
+        """
         
         if save_path is not None:
+            df = self.dataframe()
+            df.sort_values(by="Start", inplace=True)
             df.to_csv(save_path, index=False)
         
-        #print(f"optimizacion deterministica")
-        #print(f"Aptitud previa {self.aptitud()}")
-        for idx, row in df.iterrows():
-            
-            periodo = int(row["Start"])-1
-            maquina = str(row["Maquina"])
-            
-            _, _, resultado, array_modificado = self.mover_periodo_task_mode(
-                maquina=maquina
-                , periodo=periodo
-                , tipo_movimiento=-1
-                , completa=True
-            )
-            
-            if resultado:
-                self.cromosoma = array_modificado
+        if not self.es_viable()["todo"]["bool"]:
+            return
+        
+        #(inicio, posicion de la maquina, maquina, termina, id del gen) ordenados por inicio
+        lista_task_modes = sorted(
+            (inicio, self.maquinas[maquina], maquina, termina, gen_id)
+            for maquina, (_, task_modes) in self.task_modes_por_maquina().items()
+            for inicio, termina, gen_id in task_modes
+        )
+        
+        turnos : list[int] = self.datos.time_leap_ordenado
+        fin_tarea : dict[int, int] = dict()
+        fin_maquina : dict[str, int] = {maquina : 0 for maquina in self.maquinas}
+        
+        #se modifica el cromosoma directamente, si hay un error se revierten los movimientos
+        self.iniciar_cambios()
+        try:
+            for inicio, _, maquina, termina, gen_id in lista_task_modes:
+                producto, demanda, paso, task_mode = self.datos.genes[gen_id]
+                tarea = self.datos.tareas_id[(producto, demanda, paso)]
+                anterior = self.datos.tarea_anterior[tarea]
+                
+                #el task mode no puede iniciar antes del ultimo cambio de turno previo a su inicio,
+                #un task mode de un solo periodo no cruza cambios de turno
+                posicion = bisect_left(turnos, inicio)
+                if (termina > inicio) and (posicion > 0):
+                    inicio_turno = turnos[posicion - 1] + 1
+                else:
+                    inicio_turno = min(self.periodos)
+                
+                periodo_nuevo = max(
+                    fin_tarea.get(anterior, 0) + 1 if anterior >= 0 else 0
+                    , fin_maquina[maquina] + 1
+                    , inicio_turno
+                )
+                
+                if periodo_nuevo < inicio:
+                    self.remover_task_mode(maquina=maquina, periodo=inicio)
+                    _, _, resultado, _ = self.agregar_task_mode(
+                        maquina=maquina
+                        , periodo=periodo_nuevo
+                        , producto=producto
+                        , paso=paso
+                        , demanda=demanda
+                        , task_mode=task_mode
+                    )
+                    
+                    if not resultado:
+                        raise ValueError(f"Error al agregar el task_mode {task_mode} en periodo = {periodo_nuevo}, maquina = {maquina}")
+                else:
+                    periodo_nuevo = inicio
+                
+                fin_tarea[tarea] = periodo_nuevo + termina - inicio
+                fin_maquina[maquina] = periodo_nuevo + termina - inicio
+        except:
+            self.revertir_cambios()
+            raise
+        self.confirmar_cambios()
+    
+    def reparar(self) -> bool:
+        """
+        reparar - 
+        
+        Repara el cromosoma de un individuo no viable utilizando los errores de `self.es_viable()`.
+        
+        Cada producto-demanda con un error (cambio de turno, pasos faltantes, pasos fuera de orden o deadline)
+        se recorre en el orden de la receta. Un paso se vuelve a colocar si no está asignado,
+        inicia antes de terminar el paso anterior o cruza un cambio de turno. Si el producto-demanda
+        no cumple el deadline se vuelven a colocar todos sus pasos.
+        Cada paso se coloca en la opción maquina-task_mode de la receta que termina primero,
+        iniciando despues del fin del paso anterior. Los demás task modes no se mueven.
+        
+        Los cambios se hacen en `self.cromosoma` dentro de una transacción, si el resultado
+        no es viable se revierten todos los cambios.
+        
+        Returns
+        -------
+        bool :
+            True si el individuo es viable al terminar, False en caso contrario.
+        """
+        
+        viable = self.es_viable()
+        if viable["todo"]["bool"]:
+            return True
+        
+        #productos-demanda a reparar, y si se deben volver a colocar todos sus pasos
+        reparar_todo : dict[tuple[str, int], bool] = dict()
+        for error in viable["cambio_turno"]["lista"]:
+            reparar_todo.setdefault((error["producto"], error["demanda"]), False)
+        for error in viable["produccion"]["lista"]:
+            llave = (error["producto"], error["demanda"])
+            reparar_todo[llave] = reparar_todo.get(llave, False) or (error["tipo"] == "deadline")
+        
+        #ubicacion de cada tarea (maquina, inicio, termina)
+        ubicacion : dict[int, tuple[str, int, int]] = dict()
+        for maquina, (_, task_modes) in self.task_modes_por_maquina().items():
+            for inicio, termina, gen_id in task_modes:
+                producto, demanda, paso, _ = self.datos.genes[gen_id]
+                ubicacion[self.datos.tareas_id[(producto, demanda, paso)]] = (maquina, inicio, termina)
+        
+        turnos : list[int] = self.datos.time_leap_ordenado
+        
+        self.iniciar_cambios()
+        try:
+            for (producto, demanda), todo in reparar_todo.items():
+                fin_anterior = 0
+                for paso, opciones in enumerate(self.datos.receta_opciones[producto]):
+                    tarea = self.datos.tareas_id[(producto, demanda, paso)]
+                    actual = ubicacion.get(tarea)
+                    
+                    if actual is not None:
+                        maquina, inicio, termina = actual
+                        posicion = bisect_left(turnos, inicio)
+                        cruza_turno = (posicion < len(turnos)) and (turnos[posicion] < termina)
+                        
+                        #el paso es valido, se conserva
+                        if (not todo) and (inicio > fin_anterior) and (not cruza_turno):
+                            fin_anterior = termina
+                            continue
+                        
+                        self.remover_task_mode(maquina=maquina, periodo=inicio)
+                    
+                    #opcion que termina primero
+                    mejor : tuple[int, str, str, int] = None
+                    for task_mode, duracion, maquinas in opciones:
+                        for maquina in maquinas:
+                            _, periodos = self.revisar_task_mode_en_maquina(
+                                maquina=maquina
+                                , task_mode=task_mode
+                                , inicio=fin_anterior + 1
+                                , primero=True
+                            )
+                            if len(periodos) == 0:
+                                continue
+                            termina = periodos[0] + duracion - 1
+                            if (mejor is None) or (termina < mejor[0]):
+                                mejor = (termina, maquina, task_mode, periodos[0])
+                    
+                    #no hay espacio para el paso, no se puede reparar
+                    if mejor is None:
+                        self.revertir_cambios()
+                        return False
+                    
+                    termina, maquina, task_mode, inicio = mejor
+                    _, _, resultado, _ = self.agregar_task_mode(
+                        maquina=maquina
+                        , periodo=inicio
+                        , producto=producto
+                        , paso=paso
+                        , demanda=demanda
+                        , task_mode=task_mode
+                    )
+                    if not resultado:
+                        raise ValueError(f"Error al agregar el task_mode {task_mode} en periodo = {inicio}, maquina = {maquina}")
+                    
+                    ubicacion[tarea] = (maquina, inicio, termina)
+                    fin_anterior = termina
+        except:
+            self.revertir_cambios()
+            raise
+        
+        if self.es_viable()["todo"]["bool"]:
+            self.confirmar_cambios()
+            return True
+        
+        self.revertir_cambios()
+        return False
         
-        #print(f"Aptitud despues {self.aptitud()}")
-
     def __probabilidades(
             self
             , aptitud_1 : float
@@ -1085,7 +1395,8 @@ class IndividuoA(IndividuoBase):
         2.- Se itera nuevamente todos los productos y pasos.
         2.1.- Si el paso para un producto esta asignado, se revisa el siguiente.
         2.2.- Si no esta asignado, se agrega un task mode aleatoriamente. Respentando los periodos de inicio del paso anterior.
-        3.- Si el descediente no es viable, se selecciona aleatoriamente la asignacion completa de uno de los ascedientes 
+        3.- Si el descediente no es viable, se repara con `self.reparar`.
+        4.- Si no se puede reparar, se selecciona aleatoriamente la asignacion completa de uno de los ascedientes 
             utilizando la probabilidad en `Probabilidad`.
         
         Probabilidad
@@ -1098,7 +1409,8 @@ class IndividuoA(IndividuoBase):
             Una tupla con elementos:
             * 1ro: Un individuo creado a partir de dos ascendientes.
             * 2do: Número que representa el origen del cromosoma, 1 si copia completamente la asignación de esta intancia,
-                2 si copia completamente la asignación de `padre`, 3 si es una combinación de los 2 ascedientes.
+                2 si copia completamente la asignación de `padre`, 3 si es una combinación de los 2 ascedientes,
+                4 si es una combinación de los 2 ascendientes que fue reparada.
         
         Raises
         ------
@@ -1111,7 +1423,7 @@ class IndividuoA(IndividuoBase):
             raise ValueError("padre debe ser una instancia de IndividuoA")
 
         #calcular lista de cortes
-        periodos_time_leap : list[int] = self.datos.time['time_leap']
+        periodos_time_leap : list[int] = list(self.datos.time['time_leap'])
         # lista: lista de límites superiores, p.ej. [192,384,576,768,960]
         lista_inicio : list[int] = [1] + [x + 1 for x in periodos_time_leap]
         # calcular paso para extender el último intervalo (si hay al menos 2 elementos)
@@ -1123,10 +1435,11 @@ class IndividuoA(IndividuoBase):
             for maquina in self.maquinas:
                 lista_opciones.append((maquina,lista_inicio[i],lista_final[i]))
 
-        #calcular probabilidades
-        df_madre = self.dataframe()
-        df_padre = padre.dataframe()
+        #task modes de cada ascendiente por maquina, ordenados por inicio
+        task_modes_madre = self.task_modes_por_maquina()
+        task_modes_padre = padre.task_modes_por_maquina()
         
+        #calcular probabilidades
         aptitud_madre = self.aptitud()
         aptitud_padre = padre.aptitud()
 
@@ -1191,17 +1504,17 @@ class IndividuoA(IndividuoBase):
             
             #datos ascendiente
             if ascendiente == "madre":
-                df_time_leap = df_padre.loc[(df_padre["Maquina"] == maquina) & (df_padre["Start"] >= periodo_inicio) & (df_padre["Start"] <= periodo_final)]
+                inicios, task_modes = task_modes_padre[maquina]
             else:
-                df_time_leap = df_madre.loc[(df_madre["Maquina"] == maquina) & (df_madre["Start"] >= periodo_inicio) & (df_madre["Start"] <= periodo_final)]
+                inicios, task_modes = task_modes_madre[maquina]
+            
+            #task modes que inician dentro del turno
+            desde = bisect_left(inicios, periodo_inicio)
+            hasta = bisect_right(inicios, periodo_final)
 
-            for _, fila in df_time_leap.iterrows():
-                maquina_fila = fila["Maquina"]
-                periodo_inicio_fila = int(fila["Start"])
-                producto_fila = str(fila["Producto"])
-                demanda_fila = int(fila["Demanda"])
-                paso_fila = int(fila["paso"])
-                task_mode_fila = str(fila["task_mode"])
+            for periodo_inicio_fila, _, gen_id in task_modes[desde:hasta]:
+                maquina_fila = maquina
+                producto_fila, demanda_fila, paso_fila, task_mode_fila = self.datos.genes[gen_id]
                 
                 #aun no se ha agregado este producto
                 if not revisa_paso(producto_input=producto_fila,demanda_input=demanda_fila,paso_input=paso_fila):
@@ -1245,6 +1558,7 @@ class IndividuoA(IndividuoBase):
                     maquina=maquina
                     , task_mode=task_mode
                     , inicio=periodo_minimo
+                    , primero=True
                 )
                 
                 if len(periodos_lista) == 0:
@@ -1274,16 +1588,18 @@ class IndividuoA(IndividuoBase):
         if descendiente.es_viable()["todo"]["bool"]:
             #el descendiente es viable dar resultado
             return descendiente, 3
+        elif descendiente.reparar():
+            #el descendiente se pudo reparar
+            return descendiente, 4
         else:
             #el descendiente no es viable, por lo tanto se regresará aleatoriamente uno de los ascedenetes
             primero = rand.choices(
                 ["madre", "padre"], weights=probabilidad, k=1
             )[0]
             
+            #se regresa una copia, los cambios en el descendiente se hacen en el mismo array
             if primero == "madre":
-                descendiente.cromosoma = self.cromosoma
-                return descendiente, 1
+                return self.clone(), 1
             else:
-                descendiente.cromosoma = padre.cromosoma
-                return descendiente, 2           
+                return padre.clone(), 2           
 
@@ -1,5 +1,14 @@
-from Carga_Datos import Datos, PATH_INPUT, task_mode_a_str, str_a_task_mode
+from Carga_Datos import (
+    PATH_INPUT
+    , cargar_instancia
+    , GEN_VACIO
+    , CAPA_GEN
+    , CAPA_INTERVALO
+    , cromosoma_vacio
+    , cromosoma_a_str
+)
 import numpy as np
+from bisect import bisect_left
 from typing import Any, Literal
 
 class IndividuoBase:
@@ -14,8 +23,27 @@ class IndividuoBase:
     * inicializar
     * mezcla
     * mutacion
+    
+    El individuo solo guarda el cromosoma, el estado por periodo, los objetivos
+    calculados y una referencia a la instancia compartida del problema (`self.datos`).
     """
     
+    __slots__ = (
+        "INPUT_PATH"
+        , "datos"
+        , "__cromosoma"
+        , "__cambio_pendiente"
+        , "__version"
+        , "__objetivos_cache"
+        , "__task_modes_cache"
+        , "__huecos"
+        , "__bitacora"
+        , "__marcas"
+        , "__energia_estado"
+        , "__ocupacion_estado"
+        , "__makespan_estado"
+    )
+    
     def __init__(self
             , input_path : str | None = None
         ):
@@ -31,51 +59,253 @@ class IndividuoBase:
             input_path = PATH_INPUT
         
         self.INPUT_PATH = input_path
-        self.datos = Datos(self.INPUT_PATH)
+        #instancia compartida del problema, contiene las tablas precalculadas
+        self.datos = cargar_instancia(self.INPUT_PATH)
+        
+        #cambio derivado de self.cromosoma pendiente de asignar, (array, [(inicio, termina), ...])
+        #se utiliza para actualizar el estado solo en los periodos modificados
+        self.__cambio_pendiente : tuple[np.ndarray, list[tuple[int, int]]] | None = None
+        
+        #version del cromosoma, aumenta con cada modificacion
+        #los objetivos se guardan junto con la version en la que se calcularon
+        self.__version : int = 0
+        self.__objetivos_cache : tuple[int, tuple[int, float]] | None = None
+        self.__task_modes_cache : tuple[int, dict] | None = None
+        
+        #bitacora de la transaccion activa, (maquina, periodo inicial, valores previos)
+        #las marcas son las posiciones en la bitacora donde inicia cada transaccion
+        self.__bitacora : list[tuple[int, int, np.ndarray]] | None = None
+        self.__marcas : list[int] = []
+        
+        #periodos libres de cada maquina, {posicion : (inicios, finales)}
+        #se calculan al consultarse y se eliminan al modificar la maquina
+        self.__huecos : dict[int, tuple[np.ndarray, np.ndarray]] = dict()
+        
+        self.cromosoma = cromosoma_vacio(
+            maquinas = len(self.maquinas.keys())
+            , periodos = len(self.periodos)
+        )
+    
+    @property
+    def maquinas(self) -> dict[str, int]:
+        """
+        maquinas - 
         
-        self.maquinas = self.datos.machines_id
+        Diccionario `{maquina : posicion en el cromosoma}`, se obtiene de `self.datos`.
+        """
+        return self.datos.machines_id
+    
+    @property
+    def periodos(self) -> list[int]:
+        """
+        periodos - 
         
-        self.periodos : list[int] = self.datos.periodos
+        Periodos del problema, se obtienen de `self.datos`.
+        """
+        return self.datos.periodos
+    
+    @property
+    def cambio_turno(self) -> list[int]:
+        """
+        cambio_turno - 
         
-        self.energia_solar_cantidad = np.zeros(
-            (len(self.periodos))
-        )
+        Periodos donde sucede un cambio de turno, se obtienen de `self.datos`.
+        """
+        return self.datos.time['time_leap']
+    
+    def clone(self) -> "IndividuoBase":
+        """
+        clone - 
         
-        self.energia_socket_precio = np.zeros(
-            (len(self.periodos))
-        )
+        Crea una copia del individuo sin volver a construirlo.
+        
+        Solo se copian el cromosoma y el estado por periodo, los objetivos calculados
+        y la instancia del problema se comparten. La transacción activa no se copia.
+        
+        Returns
+        -------
+        IndividuoBase :
+            Un individuo de la misma clase con una copia del cromosoma.
+        """
+        nuevo = object.__new__(type(self))
+        
+        nuevo.INPUT_PATH = self.INPUT_PATH
+        nuevo.datos = self.datos
+        nuevo.__cromosoma = self.__cromosoma.copy()
+        nuevo.__energia_estado = self.__energia_estado.copy()
+        nuevo.__ocupacion_estado = self.__ocupacion_estado.copy()
+        nuevo.__makespan_estado = self.__makespan_estado
+        nuevo.__version = self.__version
+        nuevo.__objetivos_cache = self.__objetivos_cache
+        nuevo.__task_modes_cache = self.__task_modes_cache
+        nuevo.__cambio_pendiente = None
+        nuevo.__bitacora = None
+        nuevo.__marcas = []
+        nuevo.__huecos = dict(self.__huecos)
+        
+        return nuevo
+    
+    def __getstate__(self) -> tuple[str, np.ndarray, tuple[int, float] | None]:
+        """
+        __getstate__ - 
+        
+        Forma compacta utilizada por `pickle`, solo se guarda el path de los datos,
+        el cromosoma y los objetivos calculados. La transacción activa no se guarda.
+        
+        Returns
+        -------
+        tuple[str, np.ndarray, tuple[int, float] | None] :
+            * Path de los datos
+            * Cromosoma
+            * Objetivos `(makespan, costo)` del cromosoma si ya se calcularon
+        """
+        objetivos = None
+        if (self.__objetivos_cache is not None) and (self.__objetivos_cache[0] == self.__version):
+            objetivos = self.__objetivos_cache[1]
+        
+        return self.INPUT_PATH, self.__cromosoma, objetivos
+    
+    def __setstate__(self, estado : tuple[str, np.ndarray, tuple[int, float] | None]):
+        """
+        __setstate__ - 
+        
+        Reconstruye el individuo a partir de `__getstate__`, la instancia del problema
+        se obtiene con `cargar_instancia` y el estado por periodo se recalcula.
+        """
+        input_path, cromosoma, objetivos = estado
+        
+        self.INPUT_PATH = input_path
+        self.datos = cargar_instancia(input_path)
+        self.__cambio_pendiente = None
+        self.__version = 0
+        self.__objetivos_cache = None
+        self.__task_modes_cache = None
+        self.__bitacora = None
+        self.__marcas = []
+        self.__huecos = dict()
+        
+        self.cromosoma = cromosoma
+        
+        if objetivos is not None:
+            self.__objetivos_cache = (self.__version, objetivos)
+    
+    @property
+    def cromosoma(self) -> np.ndarray:
+        """
+        cromosoma - 
+        
+        El scheduling del individuo, array con forma `(2, maquinas, periodos)`.
+        
+        Al asignar un array se actualiza el estado de energia y ocupacion por periodo.
+        Si el array fue creado por `mover_periodo_task_mode` o `__cambiar_task_mode`
+        a partir del cromosoma actual, solo se actualizan los periodos modificados.
+        """
+        return self.__cromosoma
+    
+    @cromosoma.setter
+    def cromosoma(self, valor : np.ndarray):
+        if (self.__bitacora is not None) and (valor is not self.__cromosoma):
+            raise ValueError("No es posible asignar el cromosoma durante una transacción")
+        
+        if (self.__cambio_pendiente is not None) and (valor is self.__cambio_pendiente[0]):
+            rangos = self.__cambio_pendiente[1]
+            self.__cromosoma = valor
+            self.__huecos.clear()
+            self.__actualizar_estado(rangos=rangos)
+        elif valor is not getattr(self, "_IndividuoBase__cromosoma", None):
+            self.__cromosoma = valor
+            self.__huecos.clear()
+            self.__recalcular_estado()
+        
+        self.__cambio_pendiente = None
+    
+    @property
+    def version(self) -> int:
+        """
+        version - 
+        
+        Número de modificaciones realizadas a `self.cromosoma`.
+        """
+        return self.__version
+    
+    def __recalcular_estado(self):
+        """
+        __recalcular_estado - 
+        
+        Calcula desde cero la energia utilizada, la cantidad de maquinas ocupadas
+        en cada periodo y el makespan de `self.cromosoma`.
+        """
+        
+        array = self.__cromosoma
+        
+        self.__energia_estado : np.ndarray = self.__energia_utilizada(array=array)
+        self.__ocupacion_estado : np.ndarray = (array[CAPA_GEN] != GEN_VACIO).sum(axis=0, dtype=np.int16)
+        self.__makespan_estado : int = self.__makespan(array=array)
+        
+        self.__version += 1
+    
+    def __actualizar_estado(self
+            , rangos : list[tuple[int, int]]
+        ):
+        """
+        __actualizar_estado - 
+        
+        Actualiza la energia utilizada, la cantidad de maquinas ocupadas y el makespan
+        de `self.cromosoma` solo en los periodos modificados.
+        
+        Parameters
+        ----------
+        rangos (list[tuple[int, int]]) :
+            Lista de `(periodo inicio, periodo termina)` modificados, ambos inclusive.
         
-        for periodo in self.periodos:
-            solar_cantidad = self.datos.energy[periodo]['Solar']['amount']
-            socket_precio = self.datos.energy[periodo]['Socket Energy']['price']
+        """
+        
+        array = self.__cromosoma
+        
+        for inicio, termina in rangos:
+            inicio = max(inicio, 1) - 1
+            termina = min(termina, len(self.periodos))
             
-            self.energia_solar_cantidad[periodo - 1] = solar_cantidad
-            self.energia_socket_precio[periodo - 1] = socket_precio
-        
-        self.task_mode_energy = dict()
-        for _, task_dict in self.datos.tasks.items():
-            for task_mode, energy in task_dict.items():
-                self.task_mode_energy[task_mode] = energy['power']
-        
-        self.cromosoma = np.full(
-            shape = (len(self.maquinas.keys()), len(self.periodos)),
-            fill_value = "",
-            dtype = 'object'
-        )
+            if inicio >= termina:
+                continue
+            
+            self.__energia_estado[inicio:termina] = self.__energia_utilizada(
+                array=array[:, :, inicio:termina]
+            )
+            self.__ocupacion_estado[inicio:termina] = (
+                array[CAPA_GEN, :, inicio:termina] != GEN_VACIO
+            ).sum(axis=0)
+            
+            #se ocupó un periodo despues del makespan
+            if termina > self.__makespan_estado:
+                ocupados = np.nonzero(self.__ocupacion_estado[inicio:termina])[0]
+                if ocupados.size > 0:
+                    self.__makespan_estado = max(
+                        self.__makespan_estado, inicio + int(ocupados[-1]) + 1
+                    )
+        
+        #el ultimo periodo ocupado quedo vacio, se busca el nuevo makespan hacia atras
+        if (self.__makespan_estado > 0) and (self.__ocupacion_estado[self.__makespan_estado - 1] == 0):
+            ocupados = np.nonzero(self.__ocupacion_estado[:self.__makespan_estado])[0]
+            self.__makespan_estado = int(ocupados[-1]) + 1 if ocupados.size > 0 else 0
         
-        self.cambio_turno : list[int] = self.datos.time['time_leap']
+        self.__version += 1
     
     def __modificar_array(self
             , array : np.ndarray
             , maquina : str
             , periodo : int
-            , valor : Any
+            , valor : tuple[int, int | np.ndarray]
+            , cantidad : int = 1
         ) -> np.ndarray[tuple[Any, ...], np.dtype[Any]]:
         """
-        __modificar_array - 
+        __modificar_array -
         
-        Modifica un `ndarray` en la posición `[maquina, periodo]`
-        con la variable `valor` dada.
+        Modifica un `ndarray` en las posiciones `[maquina, periodo:periodo + cantidad]`
+        con la variable `valor` dada, el array se modifica directamente.
+        
+        Si `array` es `self.cromosoma` y hay una transacción activa, se guardan
+        los valores previos en la bitacora para poder revertir el cambio.
         
         Parameters
         ----------
@@ -86,15 +316,20 @@ class IndividuoBase:
             Maquina donde se modificará el array
         
         periodo (int) :
-            Periodo donde se modificará el array
+            Periodo inicial donde se modificará el array
         
-        valor (Any) :
-            Valor que se cambiará en el array
+        valor (tuple[int, int | np.ndarray]) :
+            Gen que se cambiará en el array, `(id del gen, intervalo)`.
+            `(GEN_VACIO, GEN_VACIO)` para dejar la posición vacia.
+            El intervalo puede ser un array con un valor por periodo.
+        
+        cantidad (int, optional, defaults to 1) :
+            Cantidad de periodos consecutivos a modificar.
         
         Returns
         -------
         array :
-            Una copia del array `array` modificado
+            El array `array` modificado (no es una copia)
         
         Raises
         ------
@@ -112,15 +347,114 @@ class IndividuoBase:
         if maquina not in self.maquinas:
             raise ValueError(f'La maquina {maquina} no esta disponible')
         
-        if periodo not in self.periodos:
-            raise ValueError(f'Periodo {periodo} no es válido')
+        for periodo_revisar in (periodo, periodo + cantidad - 1):
+            if periodo_revisar not in self.periodos:
+                raise ValueError(f'Periodo {periodo_revisar} no es válido')
     
         if not isinstance(array, np.ndarray):
             raise TypeError(f'array no es de la clase correcta')
+        
+        posicion = self.maquinas[maquina]
+        inicio = periodo - 1
+        termina = inicio + cantidad
+        
+        if array is self.__cromosoma:
+            #se guardan los valores previos para poder revertir
+            if self.__bitacora is not None:
+                self.__bitacora.append((posicion, inicio, array[:, posicion, inicio:termina].copy()))
+            
+            self.__huecos.pop(posicion, None)
+        
+        array[CAPA_GEN, posicion, inicio:termina] = valor[0]
+        array[CAPA_INTERVALO, posicion, inicio:termina] = valor[1]
+        
+        return array
+    
+    @property
+    def en_transaccion(self) -> bool:
+        """
+        en_transaccion - 
+        
+        `True` si hay una transacción activa sobre `self.cromosoma`.
+        """
+        return self.__bitacora is not None
+    
+    def iniciar_cambios(self):
+        """
+        iniciar_cambios - 
+        
+        Inicia una transacción sobre `self.cromosoma`.
+        
+        Los cambios realizados con `agregar_task_mode`, `remover_task_mode`,
+        `mover_periodo_task_mode` y `__cambiar_task_mode` directamente en `self.cromosoma`
+        se guardan en una bitacora con los valores previos de los periodos modificados,
+        la transacción termina con `confirmar_cambios` o `revertir_cambios`.
+        
+        Las transacciones se pueden anidar, cada `iniciar_cambios` debe terminar
+        con su propio `confirmar_cambios` o `revertir_cambios`.
+        """
+        if self.__bitacora is None:
+            self.__bitacora = []
+        
+        self.__marcas.append(len(self.__bitacora))
     
-        array[self.maquinas[maquina], periodo - 1] = valor
+    def confirmar_cambios(self):
+        """
+        confirmar_cambios - 
+        
+        Termina la transacción mas reciente conservando los cambios realizados.
+        
+        Raises
+        ------
+        ValueError :
+            Si no hay una transacción activa.
         
-        return array.copy()
+        """
+        if self.__bitacora is None:
+            raise ValueError("No hay una transacción activa")
+        
+        self.__marcas.pop()
+        
+        #ya no hay transacciones que puedan revertir los cambios
+        if len(self.__marcas) == 0:
+            self.__bitacora = None
+    
+    def revertir_cambios(self):
+        """
+        revertir_cambios - 
+        
+        Termina la transacción mas reciente regresando `self.cromosoma`
+        al estado que tenía al llamar `iniciar_cambios`.
+        
+        Solo se restauran los periodos guardados en la bitacora, por lo tanto
+        no se copia el array completo.
+        
+        Raises
+        ------
+        ValueError :
+            Si no hay una transacción activa.
+        
+        """
+        if self.__bitacora is None:
+            raise ValueError("No hay una transacción activa")
+        
+        marca = self.__marcas.pop()
+        array = self.__cromosoma
+        
+        #se restauran los valores en orden inverso
+        rangos : list[tuple[int, int]] = []
+        while len(self.__bitacora) > marca:
+            posicion, inicio, valores = self.__bitacora.pop()
+            array[:, posicion, inicio:inicio + valores.shape[1]] = valores
+            rangos.append((inicio + 1, inicio + valores.shape[1]))
+            self.__huecos.pop(posicion, None)
+        
+        if len(self.__marcas) == 0:
+            self.__bitacora = None
+        
+        if len(rangos) > 0:
+            self.__actualizar_estado(rangos=rangos)
+        self.__cambio_pendiente = None
     
     def __es_vacio_array(self
             , maquina : str
@@ -131,10 +465,7 @@ class IndividuoBase:
         __es_vacio_array - 
         
         Revisa si la posicion `[maquina, periodo]` del `array`
-        tiene es vacio, se consideran vacios los siguientes valores:
-        * `False`
-        * `0`
-        * `""`
+        es vacio, es decir tiene el id de gen `GEN_VACIO`.
         
         Parameters
         ----------
@@ -157,9 +488,9 @@ class IndividuoBase:
         if array is None:
             array = self.cromosoma
         
-        valor = array[self.maquinas[maquina], periodo - 1]
+        valor = array[CAPA_GEN, self.maquinas[maquina], periodo - 1]
         
-        return not valor
+        return valor == GEN_VACIO
     
     def __gen(self
             , producto : str
@@ -167,10 +498,9 @@ class IndividuoBase:
             , task_mode : str
             , intervalo : int
             , paso : int
-            , sep : str = "|"
-        ) -> str:
+        ) -> tuple[int, int]:
         """
-        __gen - 
+        __gen -
         
         Crea el valor del gen para la información dado.
         
@@ -191,45 +521,31 @@ class IndividuoBase:
         paso (int) :
             Paso de la receta de producción del producto.
         
-        sep (str, optional, defaults to "|") :
-            Separador, que separa la información del gen.
-        
         Returns
         -------
-        str :
-            El valor del gen el cual contiene toda la información.
+        tuple[int, int] :
+            El valor del gen `(id del gen, intervalo)`, el id se busca en `self.datos.genes_id`.
         
         """
-        return task_mode_a_str(
-            producto=producto
-            , demanda=demanda
-            , task_mode=task_mode
-            , intervalo=intervalo
-            , paso=paso
-            , sep=sep
-        )
+        return self.datos.genes_id[(producto, int(demanda), int(paso), task_mode)], int(intervalo)
     
     def __gen_inverso(
             self
-            , gen : str
-            , sep : str = "|"
+            , gen : tuple[int, int] | np.ndarray
         )  -> tuple[str, int, str, int, int]:
         """
-        __gen_inverso - 
+        __gen_inverso -
         
         Obtiene la información guardada en el gen dado.
         
         Parameters
         ----------
-        gen (str) :
-            El valor del gen.
-        
-        sep (str, optional, defaults to "|") :
-            El separador utilizado para guardar la información en el gen.
+        gen (tuple[int, int] | np.ndarray) :
+            El valor del gen `(id del gen, intervalo)`.
         
         Returns
         -------
-        tuple[str, int, str, int] :
+        tuple[str, int, str, int, int] :
             Tuple con los siguientes elementos:
             * Producto
             * Demanda
@@ -239,12 +555,10 @@ class IndividuoBase:
         
         """
         
-        #print("__gen_inverso",gen) #TODO agregar verbose
+        gen_id, intervalo = gen
+        producto, demanda, paso, task_mode = self.datos.genes[gen_id]
         
-        return str_a_task_mode(
-            info=gen
-            , sep=sep
-        )
+        return producto, demanda, task_mode, int(intervalo), paso
     
     def __makespan(self
             , array : np.ndarray = None
@@ -268,51 +582,18 @@ class IndividuoBase:
         
         """
         if array is None:
-            array = self.cromosoma
+            return self.__makespan_estado
         
-        produccion : np.ndarray = np.apply_along_axis(np.any, 0, array != "")
+        produccion : np.ndarray = (array[CAPA_GEN] != GEN_VACIO).any(axis=0)
         
-        hay_produccion_indices = np.where(produccion)[0]
+        #el primer periodo con produccion contando desde el final
+        ultimo_desde_final = int(np.argmax(produccion[::-1]))
         
-        if hay_produccion_indices.size > 0:
-            return hay_produccion_indices[-1] + 1
+        if produccion[-1 - ultimo_desde_final]:
+            return produccion.size - ultimo_desde_final
         else:
             return 0
     
-    def __gen_a_energia_utilizada(
-            self
-            , gen : str
-            , sep : str = "|"
-        ) -> float:
-        """
-        __gen_a_energia_utilizada - 
-        
-        Regresa la cantidad de energia utilizada para le gen dado.
-        
-        Parameters
-        ----------
-        gen (str) :
-            El valor del gen.
-        
-        sep (str, optional, defaults to "|") :
-            El separador utilizado para guardar la información en el gen.
-        
-        Returns
-        -------
-        float :
-            * 0 si la maquina no es utilizada
-            * La cantidad de energia utilizada si la maquina es utilizada
-        
-        """
-        
-        if gen == "":
-            return 0
-        else:
-            _, _, task_mode, intervalo, _ = self.__gen_inverso(
-                gen=gen, sep=sep
-            )
-            return self.task_mode_energy[task_mode][intervalo]
-    
     def __energia_precio(self
             , array : np.ndarray = None
             , save : bool = False
@@ -339,13 +620,14 @@ class IndividuoBase:
 
         if save:
             np.savetxt(
-                "cromosoma.csv", array, delimiter=",", fmt="%s"
+                "cromosoma.csv", self.cromosoma_str(array=array), delimiter=",", fmt="%s"
                 , encoding="utf-8"
             )
 
-        energia_utilizada : np.ndarray = np.array(
-            [[self.__gen_a_energia_utilizada(i) for i in row] for row in array]
-        ).sum(axis=0)
+        if array is self.__cromosoma:
+            energia_utilizada : np.ndarray = self.__energia_estado
+        else:
+            energia_utilizada : np.ndarray = self.__energia_utilizada(array=array)
         
         if save:
             np.savetxt(
@@ -354,10 +636,10 @@ class IndividuoBase:
         
         if save:
             np.savetxt(
-                "energia_solar_cantidad.csv", self.energia_solar_cantidad, delimiter=","
+                "energia_solar_cantidad.csv", self.datos.energia_solar_cantidad, delimiter=","
             )
         
-        energia_socket = np.maximum(energia_utilizada - self.energia_solar_cantidad, 0)
+        energia_socket = np.maximum(energia_utilizada - self.datos.energia_solar_cantidad, 0)
         
         if save:
             np.savetxt(
@@ -366,11 +648,72 @@ class IndividuoBase:
         
         if save:
             np.savetxt(
-                "energia_socket_precio.csv", self.energia_socket_precio, delimiter=","
+                "energia_socket_precio.csv", self.datos.energia_socket_precio, delimiter=","
             )
         
-        return np.dot(energia_socket, self.energia_socket_precio)
-
+        return float(np.dot(energia_socket, self.datos.energia_socket_precio))
+    
+    def __energia_utilizada(self
+            , array : np.ndarray
+        ) -> np.ndarray:
+        """
+        __energia_utilizada - 
+        
+        Calcula la energia utilizada en cada periodo por todas las maquinas.
+        
+        Parameters
+        ----------
+        array (np.ndarray) :
+            Array a analizar.
+        
+        Returns
+        -------
+        np.ndarray :
+            Array con forma `(periodos,)` con la energia utilizada en cada periodo.
+        
+        """
+        
+        #los GEN_VACIO (-1) apuntan a la ultima fila y columna de la tabla, que son 0
+        task_modes = np.take(self.datos.gen_task_mode, array[CAPA_GEN])
+        
+        return self.datos.potencia_task_mode[task_modes, array[CAPA_INTERVALO]].sum(axis=0)
+    
+    def objetivos(
+            self
+            , array : np.ndarray = None
+        ) -> tuple[int, float]:
+        """
+        objetivos - 
+        
+        Calcula los dos objetivos del individuo en una sola llamada.
+        
+        Los objetivos de `self.cromosoma` se guardan y solo se calculan de nuevo
+        cuando cambia `self.version`.
+        
+        Parameters
+        ----------
+        array (np.ndarray, optional, defaults to None) :
+            Array a analizar.
+            Si es None se utiliza `self.cromosoma`
+        
+        Returns
+        -------
+        tuple[int, float] :
+            `(makespan, precio de la energia)`
+        
+        """
+        #el cromosoma actual utiliza el estado actualizado y se guarda por version
+        if (array is None) or (array is self.__cromosoma):
+            if (self.__objetivos_cache is None) or (self.__objetivos_cache[0] != self.__version):
+                self.__objetivos_cache = (
+                    self.__version
+                    , (self.__makespan_estado, self.__energia_precio())
+                )
+            
+            return self.__objetivos_cache[1]
+        
+        return self.__makespan(array=array), self.__energia_precio(array=array)
+    
     def aptitud(
             self
             , peso_makespan : float = 1
@@ -420,11 +763,160 @@ class IndividuoBase:
         if array is None:
             array = self.cromosoma
         
-        makespan = self.__makespan(array=array)
-        precio_energia = self.__energia_precio(array=array)
+        makespan, precio_energia = self.objetivos(array=array)
         
         return float(peso_makespan * makespan + peso_energia * precio_energia)
     
+    def task_modes_por_maquina(
+            self
+            , array : np.ndarray | None = None
+        ) -> dict[str, tuple[tuple[int, ...], tuple[tuple[int, int, int], ...]]]:
+        """
+        task_modes_por_maquina - 
+        
+        Lista de los task modes asignados en cada máquina, ordenados por periodo de inicio.
+        
+        Para `self.cromosoma` el resultado se guarda por version, no se debe modificar.
+        
+        Parameters
+        ----------
+        array (np.ndarray | None, optional, defaults to None) :
+            Array a analizar.
+            Si es None se utiliza `self.cromosoma`
+        
+        Returns
+        -------
+        dict[str, tuple[tuple[int, ...], tuple[tuple[int, int, int], ...]]] :
+            Diccionario `{maquina : (inicios, task_modes)}` donde:
+            * inicios: periodos de inicio ordenados, para buscar con `bisect`
+            * task_modes: `(periodo inicio, periodo termina, id del gen)` en el mismo orden,
+                ambos periodos inclusive
+        """
+        es_cromosoma = (array is None) or (array is self.__cromosoma)
+        if es_cromosoma:
+            if (self.__task_modes_cache is not None) and (self.__task_modes_cache[0] == self.__version):
+                return self.__task_modes_cache[1]
+            array = self.__cromosoma
+        
+        resultado = dict()
+        for maquina, posicion in self.maquinas.items():
+            #el inicio de cada task mode es el intervalo 0
+            inicios = np.flatnonzero(
+                (array[CAPA_GEN, posicion] != GEN_VACIO) & (array[CAPA_INTERVALO, posicion] == 0)
+            )
+            genes = array[CAPA_GEN, posicion, inicios]
+            
+            task_modes = tuple(
+                (
+                    int(inicio) + 1
+                    , int(inicio) + self.datos.task_mode_duracion[self.datos.genes[gen_id][3]]
+                    , int(gen_id)
+                )
+                for inicio, gen_id in zip(inicios, genes)
+            )
+            resultado[maquina] = (tuple(int(inicio) + 1 for inicio in inicios), task_modes)
+        
+        if es_cromosoma:
+            self.__task_modes_cache = (self.__version, resultado)
+        
+        return resultado
+    
+    def genoma_compacto(
+            self
+            , array : np.ndarray | None = None
+        ) -> np.ndarray:
+        """
+        genoma_compacto - 
+        
+        Representación compacta del cromosoma, una fila por task mode asignado.
+        Utilizada para enviar individuos entre procesos, revisa `self.cargar_genoma_compacto`.
+        
+        Parameters
+        ----------
+        array (np.ndarray | None, optional, defaults to None) :
+            Array a convertir.
+            Si es None se utiliza `self.cromosoma`
+        
+        Returns
+        -------
+        np.ndarray :
+            Array int32 con forma `(task modes, 3)`, cada fila es
+            `(posicion de la maquina, periodo de inicio, id del gen)`.
+        """
+        filas = [
+            (self.maquinas[maquina], inicio, gen_id)
+            for maquina, (_, task_modes) in self.task_modes_por_maquina(array=array).items()
+            for inicio, _, gen_id in task_modes
+        ]
+        return np.array(filas, dtype=np.int32).reshape(-1, 3)
+    
+    def cargar_genoma_compacto(
+            self
+            , genoma : np.ndarray
+        ):
+        """
+        cargar_genoma_compacto - 
+        
+        Reemplaza `self.cromosoma` con el cromosoma del genoma compacto dado.
+        
+        Parameters
+        ----------
+        genoma (np.ndarray) :
+            Genoma creado con `self.genoma_compacto`.
+        """
+        array = cromosoma_vacio(len(self.maquinas), len(self.periodos))
+        
+        for posicion, inicio, gen_id in genoma.tolist():
+            duracion = self.datos.task_mode_duracion[self.datos.genes[gen_id][3]]
+            array[CAPA_GEN, posicion, inicio - 1:inicio - 1 + duracion] = gen_id
+            array[CAPA_INTERVALO, posicion, inicio - 1:inicio - 1 + duracion] = np.arange(duracion)
+        
+        self.cromosoma = array
+    
+    def __indice_tareas(
+            self
+            , array : np.ndarray
+        ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        __indice_tareas - 
+        
+        Crea el indice de las tareas `(producto, demanda, paso)` del array,
+        cada posicion de los arrays resultado corresponde al id de `self.datos.tareas_id`.
+        
+        Parameters
+        ----------
+        array (np.ndarray) :
+            Array a revisar.
+        
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] :
+            * Primer periodo donde se procesa la tarea, `len(self.periodos) + 1` si no se procesa.
+            * Ultimo periodo donde se procesa la tarea, `0` si no se procesa.
+            * Posicion de la maquina donde se procesa la tarea, `-1` si no se procesa.
+            * Cantidad de task_modes asignados a la tarea.
+        
+        """
+        
+        #se agrega una tarea ficticia al final para las celdas vacias
+        cantidad_tareas = len(self.datos.tareas) + 1
+        
+        inicio = np.full(cantidad_tareas, len(self.periodos) + 1, dtype = np.int64)
+        termina = np.zeros(cantidad_tareas, dtype = np.int64)
+        maquina = np.full(cantidad_tareas, -1, dtype = np.int64)
+        
+        maquina_pos, periodo_pos = np.nonzero(array[CAPA_GEN] != GEN_VACIO)
+        tareas = self.datos.gen_tarea[array[CAPA_GEN, maquina_pos, periodo_pos]]
+        
+        np.minimum.at(inicio, tareas, periodo_pos + 1)
+        np.maximum.at(termina, tareas, periodo_pos + 1)
+        maquina[tareas] = maquina_pos
+        
+        es_inicio = array[CAPA_INTERVALO, maquina_pos, periodo_pos] == 0
+        cantidad = np.bincount(tareas[es_inicio], minlength = cantidad_tareas)
+        
+        return inicio[:-1], termina[:-1], maquina[:-1], cantidad[:-1]
+    
     def __revisar_cambio_turno(
             self
             , array : np.ndarray = None
@@ -461,45 +953,32 @@ class IndividuoBase:
 
         resultado = True
         lista_errores = list()
-
-        for periodo in self.cambio_turno:
-            for maquina, maquina_pos in self.maquinas.items():
-                array_a_revisar = array[maquina_pos, [periodo-1, periodo]]
-                
-                antes : str = array_a_revisar[0]
-                despues : str = array_a_revisar[1]
-                
-                #si un periodo es vacio entonces no importa si el otro periodo esta ocupado
-                if (antes == "") or (despues == ""):
-                    continue
-                    
-                producto_antes, demanda_antes, task_mode_antes, _, paso_antes =self.__gen_inverso(
-                    gen = antes
-                )
-                
-                producto_despues, demanda_despues, task_mode_despues, _, paso_despues =self.__gen_inverso(
-                    gen = despues
-                )
-                
-                #mismo producto
-                if (producto_antes == producto_despues) \
-                    and (demanda_antes == demanda_despues) \
-                    and (task_mode_antes == task_mode_despues) \
-                    and (paso_antes == paso_despues):
-                    
-                    #con solo un proceso que pase el cambio de turno, ya no es viable
-                    resultado = False
-                    
-                    lista_errores.append(
-                        {
-                            "producto" : producto_antes
-                            , "demanda" : demanda_antes
-                            , "task_mode" : task_mode_antes
-                            , "paso" : paso_antes
-                            , "periodo" : periodo
-                            , "maquina" : maquina
-                        }
-                    )
+        
+        #un task cruza el cambio de turno si el mismo gen esta antes y despues del cambio
+        periodos = np.array(self.cambio_turno, dtype=int)
+        antes : np.ndarray = array[CAPA_GEN][:, periodos - 1]
+        despues : np.ndarray = array[CAPA_GEN][:, periodos]
+        
+        errores = (antes != GEN_VACIO) & (antes == despues)
+        
+        for maquina_pos, periodo_pos in zip(*np.nonzero(errores)):
+            #con solo un proceso que pase el cambio de turno, ya no es viable
+            resultado = False
+            
+            producto, demanda, task_mode, _, paso = self.__gen_inverso(
+                gen = array[:, maquina_pos, periodos[periodo_pos] - 1]
+            )
+            
+            lista_errores.append(
+                {
+                    "producto" : producto
+                    , "demanda" : demanda
+                    , "task_mode" : task_mode
+                    , "paso" : paso
+                    , "periodo" : int(periodos[periodo_pos])
+                    , "maquina" : self.datos.maquinas_nombre[maquina_pos]
+                }
+            )
 
         return resultado, lista_errores
     
@@ -513,6 +992,7 @@ class IndividuoBase:
         Revisa si se cumple las condiciones de producción:
         * El deadline del producto si tiene.
         * Si el producto es procesado por todos los pasos
+        * Si cada paso inicia despues de terminar el paso anterior
         
         Parameters
         ----------
@@ -533,113 +1013,72 @@ class IndividuoBase:
             
         resultado = True
         revisar_list = list()
-        revisar_dict = dict()
         
-        for producto, demanda in self.datos.iterar_productos():
-            if producto not in revisar_dict:
-                revisar_dict[producto] = dict()
-
-            if demanda not in revisar_dict[producto]:
-                revisar_dict[producto][demanda] = dict()
-                
-                revisar_dict[producto][demanda]["receta"] = dict()
+        inicio, termina, maquina, _ = self.__indice_tareas(array=array)
+        asignada = termina > 0
         
-        #iterar en todos los genes
-        for periodo in self.periodos:
-            for maquina, maquina_pos in self.maquinas.items():
-                elemento = array[maquina_pos , periodo - 1]
+        #revisar deadline del ultimo paso
+        for tarea in np.nonzero(asignada & (termina > self.datos.tarea_deadline))[0]:
+            producto, demanda, _ = self.datos.tareas[tarea]
             
-                if elemento == "":
-                    continue
-                
-                producto, demanda, task_mode, intervalo, paso= self.__gen_inverso(
-                    gen = elemento
-                )
-                
-                #si no esta el dict de paso se agrega
-                if paso not in revisar_dict[producto][demanda]["receta"]:
-                    revisar_dict[producto][demanda]["receta"][paso] = dict()
-                    periodo_guardado = 0 #si no se tiene guardado un periodo se regresa 0
-                else:
-                    periodo_guardado = revisar_dict[producto][demanda]["receta"][paso]["periodo_final"]
-                
-                #se guarda el ultimo periodo donde se realiza el task_mode, es utilizado
-                #en la revisión del deadline
-                revisar_dict[producto][demanda]["receta"][paso] = {
-                    "maquina" : maquina
-                    , "task_mode" : task_mode
-                    , "periodo_final" : max(periodo, periodo_guardado)
+            resultado = False
+            revisar_list.append(
+                {
+                    "tipo" : "deadline"
+                    , "producto" : producto
+                    , "demanda" : demanda
+                    , "maquina" : self.datos.maquinas_nombre[maquina[tarea]]
+                    , "periodo_final_task_mode" : int(termina[tarea])
+                    , "periodo_deadline" : self.datos.tarea_deadline[tarea]
                 }
+            )
         
-        #iterar deadlines
-        for producto, demanda, deadline in self.datos.iterar_deadlines():
-            revisar_dict[producto][demanda]["deadline"] = deadline
+        #revisar que se procesen todos los pasos en orden,
+        #cada paso debe iniciar despues de terminar el paso anterior
+        anterior = self.datos.tarea_anterior
+        fuera_de_orden = asignada & (anterior >= 0) & asignada[anterior] & (inicio <= termina[anterior])
         
-        #iterar para revisar si se cumple produccion
-        for producto in revisar_dict:
-            receta = self.datos.receta_producto(producto=producto)
-            ultimo_paso = len(receta)
+        productos_error = dict.fromkeys(
+            self.datos.tareas[tarea][:2] for tarea in np.nonzero((~asignada) | fuera_de_orden)[0]
+        )
+        
+        for producto, demanda in productos_error:
+            resultado = False
             
-            for demanda in revisar_dict[producto]:
-                deadline = np.inf
-                
-                #revisar deadline
-                if "deadline" in revisar_dict[producto][demanda]:
-                    deadline = revisar_dict[producto][demanda]["deadline"]
-                
-                if ultimo_paso in revisar_dict[producto][demanda]["receta"]:
-                    if revisar_dict[producto][demanda]["receta"][ultimo_paso]["periodo_final"] > deadline:
-                        resultado = False
-                        revisar_list.append(
-                            {
-                                "tipo" : "deadline"
-                                , "producto" : producto
-                                , "demanda" : demanda
-                                , "maquina" : revisar_dict[producto][demanda]["receta"][ultimo_paso]["maquina"]
-                                , "periodo_final_task_mode" : revisar_dict[producto][demanda]["receta"][ultimo_paso]["periodo_final"]
-                                , "periodo_deadline" : deadline
-                            }
-                        )
-                
-                #revisar que se procesen todos los pasos en orden
-                dict_revisar_produccion = {
-                    "tipo" : "produccion"
-                    , "producto" : producto
-                    , "demanda" : demanda
-                    , "pasos_orden" : list()
-                    , "pasos_orden_bool" : True
-                    , "pasos_faltan" : list()
-                    , "pasos_faltan_bool" : True
-                }
-                
-                for paso in range(len(receta)):
-                    if paso not in revisar_dict[producto][demanda]["receta"]:
-                        resultado = False
-                        dict_revisar_produccion["pasos_faltan"].append(
-                            paso
-                        )
-                        dict_revisar_produccion["pasos_faltan_bool"] = False
-                    else:
-                        dict_revisar_produccion["pasos_orden"].append(
-                            {
-                                "paso" : paso
-                                , "periodo_final" : revisar_dict[producto][demanda]["receta"][paso]["periodo_final"]
-                            }
-                        )
+            dict_revisar_produccion = {
+                "tipo" : "produccion"
+                , "producto" : producto
+                , "demanda" : demanda
+                , "pasos_orden" : list()
+                , "pasos_orden_bool" : True
+                , "pasos_faltan" : list()
+                , "pasos_faltan_bool" : True
+            }
+            
+            for _, _, paso in self.datos.receta_producto(producto=producto):
+                tarea = self.datos.tareas_id[(producto, demanda, paso)]
                 
-                lista_orden = list()
-                for paso in dict_revisar_produccion["pasos_orden"]:
-                    lista_orden.append(paso["paso"])
+                if not asignada[tarea]:
+                    dict_revisar_produccion["pasos_faltan"].append(
+                        paso
+                    )
+                    dict_revisar_produccion["pasos_faltan_bool"] = False
+                    continue
                 
-                dict_revisar_produccion["pasos_orden_bool"] = all(lista_orden[i] < lista_orden[i+1] for i in range(len(lista_orden) - 1))
-        
-                #si no se cumple el orden
-                if not dict_revisar_produccion["pasos_orden_bool"]:
-                    resultado = False
+                dict_revisar_produccion["pasos_orden"].append(
+                    {
+                        "paso" : paso
+                        , "periodo_inicio" : int(inicio[tarea])
+                        , "periodo_final" : int(termina[tarea])
+                    }
+                )
                 
-                    revisar_list.append(
-                        dict_revisar_produccion
-                    )    
+                if fuera_de_orden[tarea]:
+                    dict_revisar_produccion["pasos_orden_bool"] = False
+            
+            revisar_list.append(
+                dict_revisar_produccion
+            )
         
         return resultado, revisar_list
 
@@ -748,7 +1187,7 @@ class IndividuoBase:
             * Maquina donde se ubica el task_mode agregado
             * Periodo donde se inicia el task_mode agregado
             * `True` si se agregó el task_mode, o `False` si no se agregó el task_mode
-            * Una copia del array `array` modificado, si no hubo modificacion se regresa una copia del array original
+            * El array `array`, se modifica directamente
         
         """
         if array is None:
@@ -767,32 +1206,36 @@ class IndividuoBase:
             
             #no es viable, un periodo ya esta ocupado
             if not es_viable:
-                return maquina, periodo, False, array.copy()
-        
-        #es viable, por lo tanto se agrega el task_mode
-        for i in range(len(intervalos)):
-            
-            gen = self.__gen(
-                    producto = producto
-                    , demanda = demanda
-                    , task_mode = task_mode
-                    , intervalo = i
-                    , paso = paso
-                )
-            
-            #print("gen a agregar:",gen) #TODO agregar verbose
-            
-            array_modificado = self.__modificar_array(
-                array
-                , maquina = maquina
-                , periodo = periodo + i
-                , valor = gen
+                return maquina, periodo, False, array
+        
+        #es viable, por lo tanto se agrega el task_mode en todos sus intervalos
+        gen_id, _ = self.__gen(
+                producto = producto
+                , demanda = demanda
+                , task_mode = task_mode
+                , intervalo = 0
+                , paso = paso
             )
         
-        #print("agregar_task_mode resultado",array_modificado) #TODO agregar verbose
+        #print("gen a agregar:",gen_id) #TODO agregar verbose
+        
+        self.__modificar_array(
+            array
+            , maquina = maquina
+            , periodo = periodo
+            , valor = (gen_id, np.arange(len(intervalos)))
+            , cantidad = len(intervalos)
+        )
+        
+        #print("agregar_task_mode resultado",array) #TODO agregar verbose
+        
+        #se modificó el cromosoma directamente, se actualiza el estado
+        if array is self.__cromosoma:
+            self.__actualizar_estado(rangos=[(periodo, periodo + len(intervalos) - 1)])
+            self.__cambio_pendiente = None
         
         #se agrego el task mode exitosamente
-        return maquina, periodo, True, array_modificado.copy()
+        return maquina, periodo, True, array
 
     def __buscar_inicio_task_mode(
             self
@@ -833,10 +1276,10 @@ class IndividuoBase:
         if array is None:
             array = self.cromosoma
         
-        gen = array[self.maquinas[maquina], periodo - 1]
+        gen = array[:, self.maquinas[maquina], periodo - 1]
         
         #es vacio por lo tanto no tiene inicio
-        if gen == "":
+        if gen[CAPA_GEN] == GEN_VACIO:
             return maquina, periodo
         
         _, _, _, intervalo, _ = self.__gen_inverso(
@@ -880,16 +1323,16 @@ class IndividuoBase:
             * Maquina donde se ubica el task_mode eliminado
             * Periodo donde se inicia el task_mode eliminado
             * `True` si se eliminó el task_mode, o `False` si no había task_mode a eliminar
-            * Una copia del array `array` modificado, si no hubo modificacion se regresa una copia del array original
+            * El array `array`, se modifica directamente
         
         """
         if array is None:
             array = self.cromosoma
         
-        gen = array[self.maquinas[maquina], periodo - 1]
+        gen = array[:, self.maquinas[maquina], periodo - 1]
         #es vacio por lo tanto no se puede borrar
-        if gen == "":
-            return maquina, periodo, False, array.copy()
+        if gen[CAPA_GEN] == GEN_VACIO:
+            return maquina, periodo, False, array
         
         
         maquina, periodo = self.__buscar_inicio_task_mode(
@@ -902,16 +1345,68 @@ class IndividuoBase:
         
         intervalos = self.datos.intervalos(task_mode=task_mode)
         
-        for i in range(len(intervalos)):    
-            array_modificado = self.__modificar_array(
-                array=array
-                , maquina = maquina
-                , periodo = periodo + i
-                , valor = ""
-            )
+        self.__modificar_array(
+            array=array
+            , maquina = maquina
+            , periodo = periodo
+            , valor = (GEN_VACIO, GEN_VACIO)
+            , cantidad = len(intervalos)
+        )
+        
+        #se modificó el cromosoma directamente, se actualiza el estado
+        if array is self.__cromosoma:
+            self.__actualizar_estado(rangos=[(periodo, periodo + len(intervalos) - 1)])
+            self.__cambio_pendiente = None
         
-        return maquina, periodo, True, array_modificado
+        return maquina, periodo, True, array
 
+    def __huecos_maquina(
+            self
+            , posicion : int
+            , array : np.ndarray = None
+        ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        __huecos_maquina - 
+        
+        Calcula los periodos libres consecutivos de una maquina, separados
+        en los periodos de cambio de turno (un periodo de cambio de turno no es libre).
+        
+        Para `self.cromosoma` el resultado se guarda hasta que se modifique la maquina.
+        
+        Parameters
+        ----------
+        posicion (int) :
+            Posición de la maquina en el array, `self.maquinas[maquina]`
+        
+        array (np.ndarray, optional, defaults to None) :
+            Array a revisar.
+            Si es None se utiliza `self.cromosoma`
+        
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray] :
+            * Periodo inicial de cada hueco, ordenados
+            * Periodo final de cada hueco (inclusive), ordenados
+        """
+        es_cromosoma = (array is None) or (array is self.__cromosoma)
+        if es_cromosoma:
+            huecos = self.__huecos.get(posicion)
+            if huecos is not None:
+                return huecos
+            array = self.__cromosoma
+        
+        libre = array[CAPA_GEN, posicion] == GEN_VACIO
+        libre[np.asarray(self.cambio_turno, dtype=int) - 1] = False
+        
+        #los huecos inician donde cambia de ocupado a libre y terminan donde cambia de libre a ocupado
+        cambios = np.diff(np.concatenate(([0], libre.astype(np.int8), [0])))
+        huecos = (np.flatnonzero(cambios == 1) + 1, np.flatnonzero(cambios == -1))
+        
+        if es_cromosoma:
+            self.__huecos[posicion] = huecos
+        
+        return huecos
+    
     def revisar_task_mode_en_maquina(
             self
             , maquina : str
@@ -919,6 +1414,7 @@ class IndividuoBase:
             , array : np.ndarray = None
             , inicio : int = None
             , termina : int = None
+            , primero : bool = False
         ) -> tuple[bool, list[int]]:
         """
         revisar_task_mode_en_maquina - 
@@ -951,6 +1447,10 @@ class IndividuoBase:
             Periodo final que se revisará.
             Si None se selecciona el ultimo periodo de los datos
         
+        primero (bool, optional, defaults to False) :
+            * `True` para regresar solo el primer periodo disponible
+            * `False` para regresar todos los periodos disponibles
+        
         Returns
         -------
         tuple[bool, list[int]] :
@@ -965,34 +1465,140 @@ class IndividuoBase:
         #revisa si la maquina puede procesar el task_mode:
         if task_mode not in self.datos.machines[maquina]:
             return False, list()
-
-        #revisa si es posible agregar el task_mode en la maquina
-        if array is None:
-            array = self.cromosoma
         
-        #se llena elementos temporales para evitar agregar un task en diferentes time leaps
-        array = array.copy()
-        for periodo in self.datos.time['time_leap']:
-            array[:,periodo-1] = "a"
+        intervalos : int = self.datos.task_mode_duracion[task_mode]
         
-        intervalos : int = len(self.datos.intervalos(task_mode=task_mode))
-        
-        posiciones = list()
-        #for periodo in self.periodos:
-        #    if all(array[self.maquinas[maquina],periodo - 1 + i] == "" for i in range(intervalos)):
-        #        posiciones.append(periodo)
         if inicio is None:
             inicio = min(self.periodos)
         
         if termina is None:
             termina = max(self.periodos)
         
-        for periodo in range(inicio, termina - intervalos + 1):
-            if all(array[self.maquinas[maquina],periodo - 1 + i] == "" for i in range(intervalos)):
-                posiciones.append(periodo)
+        #ultimo periodo de inicio revisado
+        ultimo_inicio = termina - intervalos
+        if inicio > ultimo_inicio:
+            return True, list()
+        
+        #huecos que pueden contener un task_mode que inicia en [inicio, ultimo_inicio]
+        inicios, finales = self.__huecos_maquina(posicion=self.maquinas[maquina], array=array)
+        desde = int(np.searchsorted(finales, inicio + intervalos - 1, side="left"))
+        hasta = int(np.searchsorted(inicios, ultimo_inicio, side="right"))
+        
+        if desde >= hasta:
+            return True, list()
+        
+        inicio_hueco = np.maximum(inicios[desde:hasta], inicio)
+        final_hueco = np.minimum(finales[desde:hasta], termina - 1)
+        cabe = (final_hueco - inicio_hueco + 1) >= intervalos
+        
+        if primero:
+            if not cabe.any():
+                return True, list()
+            return True, [int(inicio_hueco[np.argmax(cabe)])]
+        
+        posiciones = list()
+        for inicio_posible, final_posible in zip(inicio_hueco[cabe], final_hueco[cabe]):
+            posiciones.extend(range(int(inicio_posible), int(final_posible) - intervalos + 2))
 
         return True, posiciones
     
+    def __pasos_disponibles(
+            self
+            , maquina : str
+            , periodo : int
+            , intervalos : int
+            , tarea : int
+            , tipo_movimiento : Literal[-1,1]
+            , indice : tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+            , array : np.ndarray
+        ) -> int:
+        """
+        __pasos_disponibles - 
+        
+        Calcula cuantos periodos se puede mover un task_mode de un array viable,
+        el resultado es el mismo que moverlo un periodo a la vez hasta que
+        el siguiente periodo este ocupado o el movimiento no sea viable.
+        
+        Se revisan los periodos ocupados vecinos en la maquina, el fin del paso anterior,
+        el inicio del paso siguiente, la fecha limite y los cambios de turno.
+        
+        Parameters
+        ----------
+        maquina (str) :
+            Maquina donde se ubica el task_mode.
+        
+        periodo (int) :
+            Periodo donde inicia el task_mode.
+        
+        intervalos (int) :
+            Cantidad de intervalos del task_mode.
+        
+        tarea (int) :
+            Id de la tarea, `self.datos.tareas_id`.
+        
+        tipo_movimiento (Literal[-1,1]) :
+            * `-1` disminuyendo el periodo
+            * `1` aumentando el periodo
+        
+        indice (tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]) :
+            Resultado de `__indice_tareas`.
+        
+        array (np.ndarray) :
+            Array a revisar.
+        
+        Returns
+        -------
+        int :
+            Cantidad de periodos que se puede mover el task_mode.
+        """
+        
+        indice_inicio, indice_termina, _, _ = indice
+        turnos = self.datos.time_leap_ordenado
+        posicion = self.maquinas[maquina]
+        termina = periodo + intervalos - 1
+        
+        if tipo_movimiento == -1:
+            #periodos libres antes del inicio
+            ocupados = np.flatnonzero(array[CAPA_GEN, posicion, :periodo - 1][::-1] != GEN_VACIO)
+            pasos = int(ocupados[0]) if ocupados.size > 0 else periodo - 1
+            
+            anterior = self.datos.tarea_anterior[tarea]
+            if anterior >= 0:
+                pasos = min(pasos, periodo - int(indice_termina[anterior]) - 1)
+            
+            #no puede incluir el ultimo cambio de turno previo al inicio
+            indice_turno = bisect_left(turnos, periodo)
+            if (intervalos > 1) and (indice_turno > 0):
+                pasos = min(pasos, periodo - turnos[indice_turno - 1] - 1)
+        else:
+            #periodos libres despues del final
+            ocupados = np.flatnonzero(array[CAPA_GEN, posicion, termina:] != GEN_VACIO)
+            libres = int(ocupados[0]) if ocupados.size > 0 else len(self.periodos) - termina
+            
+            #paso a paso se revisa el periodo `termina + 2` antes de mover,
+            #si el siguiente periodo esta ocupado el movimiento no es posible y se genera un error al agregar
+            if libres == 0:
+                periodo_revisar = termina + 2
+                if (periodo_revisar in self.periodos) and (array[CAPA_GEN, posicion, periodo_revisar - 1] == GEN_VACIO):
+                    return 1
+                return 0
+            
+            pasos = libres - 1
+            
+            siguiente = self.datos.tarea_siguiente[tarea]
+            if siguiente >= 0:
+                pasos = min(pasos, int(indice_inicio[siguiente]) - termina - 1)
+            
+            if self.datos.tarea_deadline[tarea] < np.inf:
+                pasos = min(pasos, int(self.datos.tarea_deadline[tarea]) - termina)
+            
+            #no puede incluir el siguiente cambio de turno despues del final
+            indice_turno = bisect_left(turnos, termina)
+            if (intervalos > 1) and (indice_turno < len(turnos)):
+                pasos = min(pasos, turnos[indice_turno] - termina)
+        
+        return max(pasos, 0)
+    
     def mover_periodo_task_mode(
             self
             , maquina : str
@@ -1000,6 +1606,7 @@ class IndividuoBase:
             , tipo_movimiento : Literal[-1,1] = -1
             , completa : bool = True
             , array : np.ndarray = None
+            , en_lugar : bool = False
         ) -> tuple[str, int, bool, np.ndarray[tuple[Any, ...], np.dtype[Any]]] :
         """
         mover_periodo_task_mode - 
@@ -1028,6 +1635,11 @@ class IndividuoBase:
             Array a modificar.
             Si es None se utiliza `self.cromosoma`
         
+        en_lugar (bool, optional, defaults to False) :
+            * `True` para modificar `array` directamente, si `array` es `self.cromosoma`
+                se recomienda utilizarlo dentro de una transacción (`iniciar_cambios`)
+            * `False` para modificar una copia de `array`
+        
         Returns
         -------
         tuple[str, int, bool, np.ndarray[tuple[Any, ...], np.dtype[Any]]] :
@@ -1035,7 +1647,7 @@ class IndividuoBase:
             * Maquina donde se ubica el task_mode eliminado
             * Periodo donde se inicia el task_mode eliminado
             * `True` si se movió el task_mode, o `False` si no se movió el task_mode
-            * Una copia del array `array` modificado, si no hubo modificacion se regresa una copia del array original
+            * El array modificado, `array` si `en_lugar` o una copia de `array` en otro caso
         """
         
         if tipo_movimiento not in [-1,1]:
@@ -1044,12 +1656,12 @@ class IndividuoBase:
         if array is None:
             array = self.cromosoma
 
-        array_cambiado = array.copy()
-        array_revisar = array.copy()
+        #los pasos no viables se deshacen en el mismo array, no se copia en cada paso
+        array_revisar = array if en_lugar else array.copy()
         
-        gen = array_revisar[self.maquinas[maquina], periodo - 1]
+        gen = array_revisar[:, self.maquinas[maquina], periodo - 1]
         #es vacio por lo tanto no se puede mover
-        if gen == "":
+        if gen[CAPA_GEN] == GEN_VACIO:
             return maquina, periodo, False, array_revisar
         
         #busca el inicio del task_mode
@@ -1058,6 +1670,7 @@ class IndividuoBase:
             , periodo=periodo
             , array=array
         )
+        periodo_original = periodo
         
         producto, demanda, task_mode, _, paso = self.__gen_inverso(
             gen=gen
@@ -1069,62 +1682,131 @@ class IndividuoBase:
         intervalos : int = len(self.datos.intervalos(task_mode=task_mode))
         ajuste_intervalo = 0 if tipo_movimiento == -1 else intervalos
         
-        es_viable = True
-        while es_viable:
-            #calcula el periodo a revisar
-            periodo_revisar = periodo + tipo_movimiento + ajuste_intervalo
-            #no se puede revisar un periodo que no existe
-            if periodo_revisar not in self.periodos:
-                break
-
-            disponible = self.__es_vacio_array(
-                array=array_revisar
-                , maquina=maquina
-                , periodo=periodo_revisar
-            )
-            
-            #no hay espacio disponible para mover
-            if not disponible:
-                break
-            
-            #si es posible mover el task_mode 
-            #remover task_mode
-            _, _, actualizado, array_revisar = self.remover_task_mode(
+        #si el array es viable solo se revisa la tarea movida en cada paso,
+        #en caso contrario se revisa el array completo
+        tarea = self.datos.tareas_id[(producto, int(demanda), int(paso))]
+        indice = self.__indice_tareas(array=array)
+        revisar_tarea = (
+            indice[3][tarea] == 1
+            and self.es_viable(array)["todo"]["bool"]
+        )
+        
+        if revisar_tarea:
+            #se calcula directamente cuantos periodos se puede mover y se mueve en un solo cambio
+            pasos = self.__pasos_disponibles(
                 maquina=maquina
                 , periodo=periodo
+                , intervalos=intervalos
+                , tarea=tarea
+                , tipo_movimiento=tipo_movimiento
+                , indice=indice
                 , array=array_revisar
             )
+            if not completa:
+                pasos = min(pasos, 1)
             
-            if not actualizado:
-                raise ValueError(f"Error al remover el task_mode {task_mode} en periodo = {periodo}, maquina = {maquina}")
-            
-            #agregar task_mode en nueva posicion
-            _, _ , actualizado, array_revisar = self.agregar_task_mode(
-                maquina=maquina
-                , periodo=periodo + tipo_movimiento
-                , producto=producto
-                , paso=paso
-                , demanda=demanda
-                , task_mode=task_mode
-                , array=array_revisar
-            )
+            if pasos > 0:
+                _, _, actualizado, array_revisar = self.remover_task_mode(
+                    maquina=maquina
+                    , periodo=periodo
+                    , array=array_revisar
+                )
+                
+                if not actualizado:
+                    raise ValueError(f"Error al remover el task_mode {task_mode} en periodo = {periodo}, maquina = {maquina}")
+                
+                _, _ , actualizado, array_revisar = self.agregar_task_mode(
+                    maquina=maquina
+                    , periodo=periodo + tipo_movimiento * pasos
+                    , producto=producto
+                    , paso=paso
+                    , demanda=demanda
+                    , task_mode=task_mode
+                    , array=array_revisar
+                )
+                
+                if not actualizado:
+                    raise ValueError(f"Error al agregar el task_mode {task_mode} en periodo = {periodo + tipo_movimiento * pasos}, maquina = {maquina}")
+                
+                periodo += tipo_movimiento * pasos
+        else:
+            es_viable = True
+            while es_viable:
+                #calcula el periodo a revisar
+                periodo_revisar = periodo + tipo_movimiento + ajuste_intervalo
+                #no se puede revisar un periodo que no existe
+                if periodo_revisar not in self.periodos:
+                    break
+                
+                disponible = self.__es_vacio_array(
+                    array=array_revisar
+                    , maquina=maquina
+                    , periodo=periodo_revisar
+                )
             
-            if not actualizado:
-                raise ValueError(f"Error al agregar el task_mode {task_mode} en periodo = {periodo + tipo_movimiento}, maquina = {maquina}")
+                #no hay espacio disponible para mover
+                if not disponible:
+                    break
             
-            #revisar si es viable
-            es_viable = self.es_viable(array_revisar)["todo"]["bool"]
+                #si es posible mover el task_mode 
+                #remover task_mode
+                _, _, actualizado, array_revisar = self.remover_task_mode(
+                    maquina=maquina
+                    , periodo=periodo
+                    , array=array_revisar
+                )
             
-            if es_viable:
-                periodo += tipo_movimiento
+                if not actualizado:
+                    raise ValueError(f"Error al remover el task_mode {task_mode} en periodo = {periodo}, maquina = {maquina}")
             
-                array_cambiado = array_revisar.copy()
+                #agregar task_mode en nueva posicion
+                _, _ , actualizado, array_revisar = self.agregar_task_mode(
+                    maquina=maquina
+                    , periodo=periodo + tipo_movimiento
+                    , producto=producto
+                    , paso=paso
+                    , demanda=demanda
+                    , task_mode=task_mode
+                    , array=array_revisar
+                )
             
-            #si no es completa
-            if not completa:
-                break
+                if not actualizado:
+                    raise ValueError(f"Error al agregar el task_mode {task_mode} en periodo = {periodo + tipo_movimiento}, maquina = {maquina}")
+                
+                #revisar si es viable
+                es_viable = self.es_viable(array_revisar)["todo"]["bool"]
+                
+                if es_viable:
+                    periodo += tipo_movimiento
+                else:
+                    #se deshace el ultimo paso
+                    self.remover_task_mode(
+                        maquina=maquina
+                        , periodo=periodo + tipo_movimiento
+                        , array=array_revisar
+                    )
+                    self.agregar_task_mode(
+                        maquina=maquina
+                        , periodo=periodo
+                        , producto=producto
+                        , paso=paso
+                        , demanda=demanda
+                        , task_mode=task_mode
+                        , array=array_revisar
+                    )
+                
+                #si no es completa
+                if not completa:
+                    break
         
-        return maquina, periodo, True, array_cambiado
+        #el resultado se deriva del cromosoma, solo cambian los periodos recorridos
+        if (array is self.__cromosoma) and (not en_lugar):
+            self.__cambio_pendiente = (
+                array_revisar
+                , [(min(periodo, periodo_original), max(periodo, periodo_original) + intervalos - 1)]
+            )
+        
+        return maquina, periodo, True, array_revisar
     
     def __cambiar_task_mode(
             self
@@ -1134,6 +1816,8 @@ class IndividuoBase:
             , array : np.ndarray = None
             , inicio : int = None
             , termina : int = None
+            , en_lugar : bool = False
+            , task_mode_nuevo : str = None
         ) -> tuple[bool, np.ndarray[tuple[Any, ...], np.dtype[Any]]] :
         """
         __cambiar_task_mode - 
@@ -1167,20 +1851,26 @@ class IndividuoBase:
             Periodo final que se revisará.
             Si None se selecciona el ultimo periodo de los datos
         
+        en_lugar (bool, optional, defaults to False) :
+            * `True` para modificar `array` directamente, si `array` es `self.cromosoma`
+                se recomienda utilizarlo dentro de una transacción (`iniciar_cambios`)
+            * `False` para modificar una copia de `array`
+        
+        task_mode_nuevo (str, optional, defaults to None) :
+            El `task mode` a agregar en `maquina_nueva`, por ejemplo de `self.datos.task_mode_alternativas`.
+            Si es None se calcula con el `task` del `task mode` original.
+        
         Returns
         -------
         tuple[bool, np.ndarray[tuple[Any, ...], np.dtype[Any]]] :
-            * Si True se cambió el task mode exitosamente, False en otro caso
-            * Una copia del array `array` modificado, si no hubo modificacion se regresa una copia del array original
+            * Si True se cambió el task mode exitosamente, False si la posición está vacía,
+                la maquina nueva no puede procesar el `task` o no hay un periodo disponible
+                entre `inicio` y `termina`
+            * El array modificado, `array` si `en_lugar` o una copia de `array` en otro caso.
+                Si no se cambió el task mode se regresa `array` sin modificar
         
         Raises
         ------
-        ValueError :
-            Si la maquina nueva no puede procesar el tipo de `task` del `task mode` de origen.
-        
-        IndexError :
-            Si no hay un periodo disponible en la maquina nueva.
-        
         ValueError :
             No fue posible agregar el nuevo `task mode` en la maquina nueva.
         
@@ -1191,19 +1881,17 @@ class IndividuoBase:
         
         if array is None:
             array = self.cromosoma
-
-        array_revisar = array.copy()
         
-        gen = array_revisar[self.maquinas[maquina_origen], periodo_origen - 1]
+        gen = array[:, self.maquinas[maquina_origen], periodo_origen - 1]
         #es vacio por lo tanto no se puede mover
-        if gen == "":
-            return False, array_revisar
+        if gen[CAPA_GEN] == GEN_VACIO:
+            return False, array
         
         #busca el inicio del task_mode
         maquina_origen, periodo_origen = self.__buscar_inicio_task_mode(
             maquina=maquina_origen
             , periodo=periodo_origen
-            , array=array_revisar
+            , array=array
         )
         
         producto, demanda, task_mode, _, paso = self.__gen_inverso(
@@ -1211,13 +1899,16 @@ class IndividuoBase:
         )
         
         #calcular el task_mode nuevo a agregar
-        task = self.datos.obtener_task(task_mode=task_mode)
-        task_mode_nuevo = self.datos.obtener_task_mode(task=task, maquina=maquina_nueva)
+        if task_mode_nuevo is None:
+            task = self.datos.obtener_task(task_mode=task_mode)
+            task_mode_nuevo = self.datos.obtener_task_mode(task=task, maquina=maquina_nueva)
         
+        #la maquina nueva no puede procesar el task original
         if task_mode_nuevo is None:
-            raise ValueError(f"La maquina {maquina_nueva} no puede procesar el task '{task}' original")
+            return False, array
         
-        #revisar si es posible agregar el nuevo task en la otra maquina
+        #revisar si es posible agregar el nuevo task en la otra maquina,
+        #se revisa antes de copiar el array para utilizar los huecos guardados del cromosoma
         if inicio is None:
             inicio = min(self.periodos)
         
@@ -1227,22 +1918,22 @@ class IndividuoBase:
         bool_resultado, periodos_disponibles = self.revisar_task_mode_en_maquina(
             maquina=maquina_nueva
             , task_mode=task_mode_nuevo
-            , array=array_revisar
+            , array=array
             , inicio=inicio
             , termina=termina
+            , primero=True
         )
         
-        if not bool_resultado: #bool_resultado == False
-            raise IndexError(
-                "No hay periodos disponibles para "
-                ,f"agregar el task_mode {task_mode_nuevo} "
-                ,f"en la maquina {maquina_nueva}"
-            )
+        #no hay periodos disponibles en la ventana
+        if (not bool_resultado) or (len(periodos_disponibles) == 0):
+            return False, array
         
         #arbitrario, se selecciona el periodo minimo para minimizar el makespan
         #es posible cambiar el algoritmo de selección
         periodo_nuevo = min(periodos_disponibles)
         
+        array_revisar = array if en_lugar else array.copy()
+        
         #agregar task mode nuevo
         maquina_nueva, periodo_nuevo, bool_agregar, array_revisar = self.agregar_task_mode(
             maquina=maquina_nueva
@@ -1273,6 +1964,16 @@ class IndividuoBase:
                 , f" en periodo {periodo_origen}, maquina {maquina_origen}"
             )
         
+        #el resultado se deriva del cromosoma, solo cambian los periodos de ambos task_modes
+        if (array is self.__cromosoma) and (not en_lugar):
+            self.__cambio_pendiente = (
+                array_revisar
+                , [
+                    (periodo_nuevo, periodo_nuevo + len(self.datos.intervalos(task_mode=task_mode_nuevo)) - 1)
+                    , (periodo_origen, periodo_origen + len(self.datos.intervalos(task_mode=task_mode)) - 1)
+                ]
+            )
+        
         return True, array_revisar
     
     def __buscar_ocupado(
@@ -1330,12 +2031,12 @@ class IndividuoBase:
         if array is None:
             array = self.cromosoma
         
-        gen = array[self.maquinas[maquina], periodo - 1]
+        gen = array[:, self.maquinas[maquina], periodo - 1]
         
         maquina_inicio = maquina
         periodo_inicio = periodo
         
-        if gen != "": #el periodo actual esta ocupado
+        if gen[CAPA_GEN] != GEN_VACIO: #el periodo actual esta ocupado
             maquina, periodo = self.__buscar_inicio_task_mode(
                 maquina=maquina
                 , periodo=periodo
@@ -1346,7 +2047,7 @@ class IndividuoBase:
                 return maquina, periodo, True
             
             else: #NO se considera el task mode actual, por lo tanto se busca el siguiente task mode    
-                gen= array[self.maquinas[maquina], periodo - 1] #ya se revisó, no es vacio
+                gen= array[:, self.maquinas[maquina], periodo - 1] #ya se revisó, no es vacio
                 _,_, task_mode,_,_=self.__gen_inverso(gen=gen)
                 #si el tipo de moviento es -1 se busca a la izquierda este ajuste es 0
                 #si el tipo de movimiento es 1 se busca a la derecha este ajuste es igual a la cantidad
@@ -1384,7 +2085,7 @@ class IndividuoBase:
             , periodo : int
             , maquina : str
             , array : np.ndarray = None
-        ) -> str:
+        ) -> np.ndarray:
         """
         obtener_gen - 
         
@@ -1404,15 +2105,45 @@ class IndividuoBase:
         
         Returns
         -------
-        str :
-            El gen ubicado en maquina, periodo
+        np.ndarray :
+            El gen ubicado en maquina, periodo, `[id del gen, intervalo]`
+        
+        """
+        
+        if array is None:
+            array = self.cromosoma
+        
+        return array[:, self.maquinas[maquina], periodo - 1]
+    
+    def cromosoma_str(
+            self
+            , array : np.ndarray = None
+        ) -> np.ndarray:
+        """
+        cromosoma_str - 
+        
+        Regresa el cromosoma con genes en forma de str `"producto|demanda|task_mode|intervalo|paso"`.
+        
+        Solo se utiliza para exportar el cromosoma (csv y gráficas), el resto de los
+        metodos utilizan el cromosoma codificado con enteros.
+        
+        Parameters
+        ----------
+        array (np.ndarray, optional, defaults to None) :
+            Array a convertir.
+            Si es None se utiliza `self.cromosoma`
+        
+        Returns
+        -------
+        np.ndarray :
+            Array de str con forma `(maquinas, periodos)`, `""` si no hay task_mode asignado.
         
         """
         
         if array is None:
             array = self.cromosoma
         
-        return array[self.maquinas[maquina], periodo - 1]
+        return cromosoma_a_str(array=array, datos=self.datos)
     
     def __buscar_task_mode(
             self
@@ -1469,41 +2200,21 @@ class IndividuoBase:
             if verbose:
                 print("Utilizando cromosoma")
         
-        periodo_maximo = max(self.periodos)
-        for maquina in self.maquinas:
+        #se recorren los task modes de cada maquina en orden de periodo,
+        #incluyendo los que inician en el periodo 1
+        for maquina, (_, task_modes) in self.task_modes_por_maquina(array=array).items():
             if verbose:
                 print(f"Revisando Maquina:{maquina}")
-            periodo = 1
-            while periodo <= periodo_maximo:
-                maquina, periodo, bool_encontrado= self.__buscar_ocupado(
-                    maquina=maquina
-                    , periodo=periodo
-                    , tipo_movimiento=1
-                    , considerar_actual=False
-                    ,array=array
-                )
+            for periodo, termina, gen_id in task_modes:
+                producto, demanda, paso, _ = self.datos.genes[gen_id]
                 if verbose:
-                    print(f"Revisando,Maquina:{maquina},Periodo:{periodo}")
-                
-                if not bool_encontrado:
-                    break
-                
-                gen = self.obtener_gen(periodo=periodo,maquina=maquina,array=array)
-                if verbose:
-                    print(f"Gen Revisando:{gen}")
-                
-                producto , demanda, task_mode, _, paso = self.__gen_inverso(
-                    gen=gen
-                )
+                    print(f"Revisando,Maquina:{maquina},Periodo:{periodo},Gen:{gen_id}")
                 
                 if (producto==producto_buscar) and (demanda==demanda_buscar) and (paso==paso_buscar):
-                    maquina, periodo = self.__buscar_inicio_task_mode(maquina=maquina, periodo=periodo, array=array)
                     if inicio:
                         return maquina, periodo
                     else:
-                        return maquina, periodo + len(self.datos.intervalos(task_mode=task_mode))
-                
-                #periodo += 1
+                        return maquina, termina + 1
         
         raise ValueError("No se encontró el task mode buscado")
     
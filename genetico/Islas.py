@@ -0,0 +1,426 @@
+import numpy as np
+import random as rand
+import multiprocessing as mp
+import os
+import time
+from .IndividuoA import IndividuoA
+from .Poblacion import Poblacion
+
+def _individuo_desde_genoma(
+        genoma : np.ndarray
+        , input_path : str = None
+    ) -> IndividuoA:
+    """
+    _individuo_desde_genoma -
+    
+    Crea un individuo a partir de un genoma compacto (`IndividuoA.genoma_compacto`).
+    
+    Parameters
+    ----------
+    genoma (np.ndarray) :
+        Genoma compacto del individuo.
+    
+    input_path (str, optional, defaults to None) :
+        Path donde se ubican los datos a procesar
+    
+    Returns
+    -------
+    IndividuoA :
+        El individuo con el cromosoma del genoma.
+    """
+    individuo = IndividuoA(input_path=input_path)
+    individuo.cargar_genoma_compacto(genoma)
+    return individuo
+
+def _correr_isla(
+        conexion
+        , kwargs_poblacion : dict
+        , kwargs_simulacion : dict
+        , checkpoint : str | None
+        , generaciones_iniciales : int
+        , n_migrantes : int
+        , path : str | None
+    ):
+    """
+    _correr_isla -
+    
+    Proceso de una isla. Crea la población y en cada época avanza las generaciones indicadas
+    con `Poblacion.avanzar`, envía sus mejores genomas por `conexion` y espera la respuesta:
+    * `("migrar", genomas, generaciones)`: agrega los migrantes y continua con otra época.
+    * `("terminar", None, 0)`: guarda los resultados de la población con `Poblacion.guardar` y termina.
+    
+    Parameters
+    ----------
+    conexion (multiprocessing.connection.Connection) :
+        Conexión con el proceso principal.
+    
+    kwargs_poblacion (dict) :
+        Parámetros de `Poblacion`.
+    
+    kwargs_simulacion (dict) :
+        Parámetros de `Poblacion.preparar_simulacion`.
+    
+    checkpoint (str | None) :
+        Revisa `Poblacion.calcular_solucion`.
+    
+    generaciones_iniciales (int) :
+        Generaciones de la primera época.
+    
+    n_migrantes (int) :
+        Cantidad de mejores individuos enviados en cada época.
+    
+    path (str | None) :
+        Ubicacion donde se guarda la información de la población, revisa `Poblacion.guardar`.
+    """
+    poblacion = Poblacion(**kwargs_poblacion)
+    poblacion.preparar_simulacion(**kwargs_simulacion)
+    input_path = kwargs_poblacion.get("input_path")
+    
+    generaciones_epoca = generaciones_iniciales
+    while True:
+        terminado = poblacion.avanzar(generaciones=generaciones_epoca, checkpoint=checkpoint)
+        
+        #los mejores individuos con la aptitud promedio, la misma medida en todas las islas
+        _, _, aptitudes = poblacion.aptitud_lote()
+        mejores = np.argsort(aptitudes, kind="stable")[:max(n_migrantes, 1)]
+        conexion.send((
+            [poblacion.individuos[i].genoma_compacto() for i in mejores]
+            , [float(aptitudes[i]) for i in mejores]
+            , terminado
+        ))
+        
+        mensaje, genomas, generaciones_epoca = conexion.recv()
+        if mensaje == "terminar":
+            break
+        
+        poblacion.reemplazar_peores(
+            [_individuo_desde_genoma(genoma, input_path=input_path) for genoma in genomas]
+        )
+    
+    poblacion.cerrar_procesos()
+    poblacion.guardar(path=path)
+    conexion.close()
+
+class Islas():
+    
+    def __init__(self
+            , parametros : list[dict]
+            , generaciones_migracion : int = 5
+            , n_migrantes : int = 1
+            , topologia : str = "anillo"
+            , generaciones : int = None
+            , tiempo : float = 3600
+            , id_nombre : str = "islas"
+            , random_seed : int = None
+            , input_path : str = None
+        ):
+        """
+        __init__ -
+        
+        Modelo de islas, cada isla es una `Poblacion` independiente que se procesa
+        en su propio proceso. Cada `generaciones_migracion` generaciones las islas
+        envían sus mejores individuos a otra isla, donde reemplazan a los peores.
+        
+        Parameters
+        ----------
+        parametros (list[dict]) :
+            Parámetros de `Poblacion` de cada isla, una isla por elemento.
+            Cada diccionario puede tener las llaves `ciclo`, `iniciar_makespan`, `checkpoint`
+            y `generaciones_checkpoint`, revisa `Poblacion.calcular_solucion`.
+            Los criterios de convergencia se revisan en cada isla por separado,
+            una isla terminada conserva su población y sigue recibiendo migrantes.
+            El checkpoint de una isla se continua con `Poblacion.reanudar`, sin migración.
+            `generaciones`, `tiempo` e `input_path` se toman de este objeto,
+            si no tiene `random_seed` se genera a partir de `random_seed`
+            y si no tiene `id_nombre` se utiliza `f"{id_nombre}_isla_{i}"`.
+        
+        generaciones_migracion (int, optional, defaults to 5) :
+            Número de generaciones entre migraciones. Debe ser un número entero mayor a 0.
+        
+        n_migrantes (int, optional, defaults to 1) :
+            Número de individuos que envía cada isla en cada migración.
+            Debe ser un número entero mayor o igual a 0, con 0 no hay migración.
+        
+        topologia (str, optional, defaults to "anillo") :
+            Destino de los migrantes:
+            * "anillo": la isla `i` envía a la isla `i + 1`.
+            * "aleatoria": en cada migración se escoge aleatoriamente un destino distinto para cada isla.
+        
+        generaciones (int, optional, defaults to None) :
+            Número total de generaciones de cada isla. Debe ser None o un número entero mayor a 0.
+        
+        tiempo (float, optional, defaults to 3600) :
+            Tiempo total en segundos. Debe ser None o un número mayor a 0.
+            Se revisa en cada migración.
+            `generaciones` y `tiempo` no pueden ser ambos None al mismo tiempo.
+        
+        id_nombre (str, optional, defaults to "islas") :
+            str que identifica las islas.
+        
+        random_seed (int, optional, defaults to None) :
+            Semilla para generar la semilla de cada isla y la topología aleatoria.
+        
+        input_path (str, optional, defaults to None) :
+            Path donde se ubican los datos a procesar
+        
+        Raises
+        ------
+        ValueError :
+            Si alguno de los parámetros no cumple con su rango de valores permitidos.
+        """
+        
+        if not isinstance(id_nombre,str):
+            raise ValueError(f"id_nombre tiene que ser str")
+        
+        if len(parametros) == 0:
+            raise ValueError(f"parametros debe tener al menos una isla")
+        
+        if (generaciones is None) and (tiempo is None):
+            raise ValueError(f"generaciones y tiempo no pueden ser ambos None")
+        
+        if (generaciones is not None) and (generaciones <= 0):
+            raise ValueError(f"generaciones debe ser un número entero mayor a 0")
+        
+        if (tiempo is not None) and (tiempo <= 0):
+            raise ValueError(f"tiempo debe ser un número mayor a 0")
+        
+        if generaciones_migracion <= 0:
+            raise ValueError(f"generaciones_migracion debe ser un número entero mayor a 0, valor actual={generaciones_migracion}")
+        
+        if n_migrantes < 0:
+            raise ValueError(f"n_migrantes debe ser mayor o igual a 0, valor actual={n_migrantes}")
+        
+        if topologia not in ("anillo", "aleatoria"):
+            raise ValueError(f"topologia debe ser 'anillo' o 'aleatoria', valor actual={topologia}")
+        
+        self.id = id_nombre
+        self.generaciones_migracion = generaciones_migracion
+        self.n_migrantes = n_migrantes
+        self.topologia = topologia
+        self.cantidad_maxima_generaciones = generaciones
+        self.tiempo_maximo = tiempo
+        self.input_path = input_path
+        
+        self.__rand = rand.Random(random_seed)
+        
+        #(kwargs de Poblacion, kwargs de Poblacion.preparar_simulacion, checkpoint) de cada isla
+        self.islas : list[tuple[dict, dict, str | None]] = list()
+        for i, parametros_isla in enumerate(parametros):
+            kwargs_poblacion = dict(parametros_isla)
+            kwargs_simulacion = {
+                "ciclo" : kwargs_poblacion.pop("ciclo", None)
+                , "iniciar_makespan" : kwargs_poblacion.pop("iniciar_makespan", None)
+                , "generaciones_checkpoint" : kwargs_poblacion.pop("generaciones_checkpoint", 10)
+            }
+            checkpoint = kwargs_poblacion.pop("checkpoint", None)
+            
+            if kwargs_simulacion["generaciones_checkpoint"] <= 0:
+                raise ValueError(f"generaciones_checkpoint debe ser un número entero mayor a 0, valor actual={kwargs_simulacion['generaciones_checkpoint']}")
+            
+            kwargs_poblacion["generaciones"] = generaciones
+            kwargs_poblacion["tiempo"] = tiempo
+            kwargs_poblacion["input_path"] = input_path
+            kwargs_poblacion.setdefault("id_nombre", f"{id_nombre}_isla_{i}")
+            semilla = self.__rand.randrange(2**32)
+            kwargs_poblacion.setdefault("random_seed", semilla)
+            
+            self.islas.append((kwargs_poblacion, kwargs_simulacion, checkpoint))
+        
+        #incumbente global
+        self.genoma_incumbente : np.ndarray | None = None
+        self.aptitud_incumbente : float = float("inf")
+        self.isla_incumbente : int | None = None
+        
+        #(generacion, tiempo, aptitud incumbente, isla incumbente) en cada migración
+        self.historial : list[tuple[int, float, float, int]] = list()
+    
+    def __destinos(self) -> list[int]:
+        """
+        __destinos -
+        
+        Calcula la isla destino de los migrantes de cada isla.
+        
+        Returns
+        -------
+        list[int] :
+            La posición `i` es la isla que recibe los migrantes de la isla `i`.
+        """
+        cantidad = len(self.islas)
+        if self.topologia == "anillo" or cantidad <= 2:
+            return [(i + 1) % cantidad for i in range(cantidad)]
+        
+        #permutacion aleatoria sin puntos fijos, ninguna isla se envía a sí misma
+        destinos = list(range(cantidad))
+        while any(i == destino for i, destino in enumerate(destinos)):
+            self.__rand.shuffle(destinos)
+        return destinos
+    
+    def calcular_solucion(self
+            , verbose : bool = False
+            , path : str = None
+        ):
+        """
+        calcular_solucion -
+        
+        Corre las islas en procesos separados hasta llegar al límite de generaciones o de tiempo,
+        o hasta que todas las islas terminen por un criterio de convergencia.
+        Al terminar cada isla guarda sus resultados con `Poblacion.guardar`.
+        
+        Parameters
+        ----------
+        verbose (bool, optional, defaults to False) :
+            Si se imprime el progreso en la consola.
+        
+        path (str, optional, defaults to None) :
+            Ubicacion donde cada isla guarda su información, revisa `Poblacion.guardar`.
+        """
+        time_start = time.time()
+        
+        def generaciones_epoca(generacion_actual : int) -> int:
+            if self.cantidad_maxima_generaciones is None:
+                return self.generaciones_migracion
+            return min(self.generaciones_migracion, self.cantidad_maxima_generaciones - generacion_actual)
+        
+        generacion = 0
+        conexiones = list()
+        procesos = list()
+        try:
+            for kwargs_poblacion, kwargs_simulacion, checkpoint in self.islas:
+                conexion, conexion_isla = mp.Pipe()
+                proceso = mp.Process(
+                    target=_correr_isla
+                    , args=(
+                        conexion_isla
+                        , kwargs_poblacion
+                        , kwargs_simulacion
+                        , checkpoint
+                        , generaciones_epoca(generacion)
+                        , self.n_migrantes
+                        , path
+                    )
+                )
+                proceso.start()
+                #si la isla falla, recv termina con EOFError en lugar de esperar
+                conexion_isla.close()
+                conexiones.append(conexion)
+                procesos.append(proceso)
+            
+            while True:
+                #se reciben en el orden de las islas
+                reportes = [conexion.recv() for conexion in conexiones]
+                generacion += generaciones_epoca(generacion)
+                
+                for isla, (genomas, aptitudes, _) in enumerate(reportes):
+                    if aptitudes[0] < self.aptitud_incumbente:
+                        self.aptitud_incumbente = aptitudes[0]
+                        self.genoma_incumbente = genomas[0]
+                        self.isla_incumbente = isla
+                
+                self.historial.append(
+                    (generacion, time.time() - time_start, self.aptitud_incumbente, self.isla_incumbente)
+                )
+                
+                if verbose:
+                    print(
+                        f"Generación {generacion}|" + f"Valor optimo: {self.aptitud_incumbente}|" + f"Isla: {self.isla_incumbente}|"
+                        + f"Tiempo total: {time.time() - time_start:.2f} segundos"
+                        , end=f"\r"
+                    )
+                
+                #revisar si terminar
+                terminar = False
+                if self.cantidad_maxima_generaciones is not None:
+                    if generacion >= self.cantidad_maxima_generaciones:
+                        terminar = True
+                if self.tiempo_maximo is not None:
+                    if time.time() - time_start > self.tiempo_maximo:
+                        terminar = True
+                if all(terminado for _, _, terminado in reportes):
+                    terminar = True
+                
+                if terminar:
+                    for conexion in conexiones:
+                        conexion.send(("terminar", None, 0))
+                    break
+                
+                #migracion
+                migrantes = [list() for _ in self.islas]
+                if self.n_migrantes > 0 and len(self.islas) > 1:
+                    for isla, destino in enumerate(self.__destinos()):
+                        migrantes[destino].extend(reportes[isla][0][:self.n_migrantes])
+                
+                for conexion, genomas in zip(conexiones, migrantes):
+                    conexion.send(("migrar", genomas, generaciones_epoca(generacion)))
+            
+            for proceso in procesos:
+                proceso.join()
+        finally:
+            for proceso in procesos:
+                if proceso.is_alive():
+                    proceso.terminate()
+    
+    def incumbente(self) -> IndividuoA:
+        """
+        incumbente -
+        
+        Crea el individuo incumbente global, el mejor individuo enviado por todas las islas.
+        
+        Returns
+        -------
+        IndividuoA :
+            El mejor individuo encontrado.
+        
+        Raises
+        ------
+        ValueError :
+            Si no hay incumbente porque no se ha corrido `self.calcular_solucion`.
+        """
+        if self.genoma_incumbente is None:
+            raise ValueError(f"no hay incumbente, primero se debe correr `Islas.calcular_solucion`")
+        
+        return _individuo_desde_genoma(self.genoma_incumbente, input_path=self.input_path)
+    
+    def guardar(self, path : str = None):
+        """
+        guardar -
+        
+        Guarda el resumen de las islas y la evolución del incumbente global.
+        Cada isla guarda sus resultados al terminar `self.calcular_solucion`.
+        
+        Parameters
+        ----------
+        path (str, optional, defaults to None) :
+            Ubicacion donde se guardará la informacion. No el nombre del archivo.
+            Archivo guardado en `os.path.join(path,f"{self.id}.txt")`
+        
+        Raises
+        ------
+        ValueError :
+            Si no se ha corrido `self.calcular_solucion`, revisa `self.incumbente`.
+        """
+        individuo = self.incumbente()
+        
+        if path is None:
+            path = os.path.join("Datos Tesina", "algoritmo genetico")
+        # Crear las carpetas si no existen
+        if not os.path.exists(path):
+            os.makedirs(path, exist_ok=True)
+        
+        with open(os.path.join(path,f"{self.id}.txt"),"w", encoding="utf-8") as archivo:
+            archivo.write(f"nombre: {self.id}")
+            archivo.write(f"\nresultado: {individuo.aptitud()}")
+            archivo.write(f"\nmakespan={individuo.aptitud(peso_energia=0)},energia={individuo.aptitud(peso_makespan=0)}")
+            archivo.write(f"\nisla_incumbente: {self.islas[self.isla_incumbente][0]["id_nombre"]}")
+            archivo.write(f"\nParámetros")
+            archivo.write(f"\ncantidad_islas: {len(self.islas)}")
+            archivo.write(f"\ngeneraciones_migracion: {self.generaciones_migracion}")
+            archivo.write(f"\nn_migrantes: {self.n_migrantes}")
+            archivo.write(f"\ntopologia: {self.topologia}")
+            archivo.write(f"\ncantidad_maxima_generaciones: {self.cantidad_maxima_generaciones}")
+            archivo.write(f"\ntiempo_maximo: {self.tiempo_maximo}")
+            archivo.write(f"\n\nIncumbente por migracion")
+            for generacion, tiempo, aptitud, isla in self.historial:
+                archivo.write(f"\nGeneracion {generacion}")
+                archivo.write(f"\naptitud {aptitud}")
+                archivo.write(f"\nisla {isla}")
+                archivo.write(f"\ntiempo (segundos) {tiempo:.4f}")
@@ -0,0 +1,346 @@
+import random as rand
+import time
+import copy
+from .IndividuoA import IndividuoA
+
+#nombre del operador : metodo de IndividuoA que realiza la mutacion
+OPERADORES : dict[str, str] = {
+    "mover_periodo" : "mutacion_mover_periodo"
+    , "cambiar_task" : "mutacion_cambiar_task_mode"
+}
+
+#costo nominal de cada operador, proporcional al tiempo promedio medido por intento
+#se utiliza en lugar del tiempo para que la recompensa no dependa de la velocidad del equipo
+COSTOS : dict[str, float] = {
+    "mover_periodo" : 1.5
+    , "cambiar_task" : 1.0
+}
+
+class OperadoresMutacion():
+    
+    def __init__(self
+            , pesos : dict[str, float] = None
+            , adaptativo : bool = True
+            , tasa_aprendizaje : float = 0.3
+            , probabilidad_minima : float = 0.1
+            , costos : dict[str, float] = None
+        ):
+        """
+        __init__ -
+        
+        Registro de los operadores de mutación. Guarda los intentos, éxitos, mejora de aptitud
+        y tiempo de cada operador, y si es adaptativo actualiza la probabilidad de seleccionar
+        cada operador con la regla de "adaptive pursuit".
+        
+        La recompensa de una mutación es el cambio relativo de la aptitud, `mejora / |aptitud inicial|`,
+        limitado a [0,1]: una mutación que no se aplica o que empeora la aptitud tiene recompensa 0.
+        La recompensa se divide entre el costo nominal del operador (`COSTOS`) y no entre el tiempo medido,
+        para que los resultados se puedan reproducir con la misma semilla aleatoria.
+        El tiempo medido solo se guarda en las estadísticas.
+        
+        Parameters
+        ----------
+        pesos (dict[str, float], optional, defaults to None) :
+            Peso inicial de cada operador de `OPERADORES`.
+            Si es None todos los operadores tienen el mismo peso.
+            Un operador con peso 0 nunca se selecciona.
+        
+        adaptativo (bool, optional, defaults to True) :
+            Si se actualizan las probabilidades de selección con las recompensas obtenidas.
+            Si es False se utilizan siempre los pesos iniciales.
+        
+        tasa_aprendizaje (float, optional, defaults to 0.3) :
+            Tasa utilizada para actualizar la calidad estimada y las probabilidades de los operadores.
+            Debe ser un número entre (0,1]
+        
+        probabilidad_minima (float, optional, defaults to 0.1) :
+            Probabilidad mínima de seleccionar un operador con peso mayor a 0.
+            Debe ser un número entre [0, 1/número de operadores activos)
+        
+        costos (dict[str, float], optional, defaults to None) :
+            Costo nominal de cada operador de `OPERADORES`, los operadores que no se incluyen
+            utilizan el valor de `COSTOS`. Debe ser un número mayor a 0.
+        
+        Raises
+        ------
+        ValueError :
+            Si alguno de los parámetros no cumple con su rango de valores permitidos.
+        """
+        
+        if pesos is None:
+            pesos = {nombre : 1 for nombre in OPERADORES}
+        
+        for nombre, peso in pesos.items():
+            if nombre not in OPERADORES:
+                raise ValueError(f"operador de mutacion desconocido: {nombre}")
+            if peso < 0:
+                raise ValueError(f"el peso de {nombre} debe ser mayor o igual a 0, valor actual={peso}")
+        
+        total = sum(pesos.values())
+        if total <= 0:
+            raise ValueError(f"al menos un operador debe tener peso mayor a 0")
+        
+        self.activos = [nombre for nombre in OPERADORES if pesos.get(nombre, 0) > 0]
+        
+        if (tasa_aprendizaje <= 0) or (tasa_aprendizaje > 1):
+            raise ValueError(f"tasa_aprendizaje debe ser un valor entre (0,1], valor actual={tasa_aprendizaje}")
+        
+        if (probabilidad_minima < 0) or (probabilidad_minima * len(self.activos) >= 1):
+            raise ValueError(f"probabilidad_minima debe ser un valor entre [0, 1/{len(self.activos)}), valor actual={probabilidad_minima}")
+        
+        self.costos : dict[str, float] = dict(COSTOS)
+        if costos is not None:
+            for nombre, costo in costos.items():
+                if nombre not in OPERADORES:
+                    raise ValueError(f"operador de mutacion desconocido: {nombre}")
+                if costo <= 0:
+                    raise ValueError(f"el costo de {nombre} debe ser mayor a 0, valor actual={costo}")
+            self.costos.update(costos)
+        
+        self.adaptativo = adaptativo
+        self.tasa_aprendizaje = tasa_aprendizaje
+        self.probabilidad_minima = probabilidad_minima
+        
+        self.probabilidades : dict[str, float] = {
+            nombre : pesos.get(nombre, 0) / total for nombre in OPERADORES
+        }
+        self.calidades : dict[str, float] = {nombre : 0.0 for nombre in OPERADORES}
+        self.estadisticas : dict[str, dict[str, float]] = {
+            nombre : {"intentos" : 0, "exitos" : 0, "mejora" : 0.0, "tiempo" : 0.0}
+            for nombre in OPERADORES
+        }
+        
+        #resultados registrados, solo se guardan en las copias (revisa `self.copia`)
+        self.eventos : list[tuple[str, bool, float, float, float]] | None = None
+    
+    def copia(self) -> "OperadoresMutacion":
+        """
+        copia - 
+        
+        Crea una copia independiente del registro que guarda sus resultados en `eventos`,
+        para aplicar mutaciones en otro proceso y despues combinarlas con `self.combinar`.
+        
+        Returns
+        -------
+        OperadoresMutacion :
+            Copia del registro con `eventos` vacio.
+        """
+        nuevo = copy.deepcopy(self)
+        nuevo.eventos = list()
+        return nuevo
+    
+    def estado(self) -> dict:
+        """
+        estado - 
+        
+        Regresa el estado del registro con tipos de JSON (dict, list, str y números),
+        para guardarlo y recuperarlo con `OperadoresMutacion.desde_estado`.
+        
+        Returns
+        -------
+        dict :
+            Los atributos del registro, sin `eventos`.
+        """
+        return {
+            "activos" : list(self.activos)
+            , "adaptativo" : self.adaptativo
+            , "tasa_aprendizaje" : self.tasa_aprendizaje
+            , "probabilidad_minima" : self.probabilidad_minima
+            , "costos" : dict(self.costos)
+            , "probabilidades" : dict(self.probabilidades)
+            , "calidades" : dict(self.calidades)
+            , "estadisticas" : copy.deepcopy(self.estadisticas)
+        }
+    
+    @classmethod
+    def desde_estado(cls
+            , estado : dict
+        ) -> "OperadoresMutacion":
+        """
+        desde_estado - 
+        
+        Crea un registro a partir del resultado de `self.estado`.
+        
+        Parameters
+        ----------
+        estado (dict) :
+            Estado del registro.
+        
+        Returns
+        -------
+        OperadoresMutacion :
+            Registro con las mismas probabilidades, calidades y estadísticas.
+        """
+        nuevo = cls(
+            pesos={nombre : 1 for nombre in estado["activos"]}
+            , adaptativo=estado["adaptativo"]
+            , tasa_aprendizaje=estado["tasa_aprendizaje"]
+            , probabilidad_minima=estado["probabilidad_minima"]
+            , costos=estado["costos"]
+        )
+        nuevo.probabilidades = dict(estado["probabilidades"])
+        nuevo.calidades = dict(estado["calidades"])
+        nuevo.estadisticas = copy.deepcopy(estado["estadisticas"])
+        return nuevo
+    
+    def combinar(self
+            , eventos : list[tuple[str, bool, float, float, float]]
+        ):
+        """
+        combinar - 
+        
+        Registra en orden los resultados guardados en una copia del registro.
+        
+        Parameters
+        ----------
+        eventos (list[tuple[str, bool, float, float, float]]) :
+            Los `eventos` de una copia creada con `self.copia`.
+        """
+        for nombre, exito, mejora, tiempo, aptitud_inicial in eventos:
+            self.registrar(
+                nombre=nombre
+                , exito=exito
+                , mejora=mejora
+                , tiempo=tiempo
+                , aptitud_inicial=aptitud_inicial
+            )
+    
+    def seleccionar(self) -> str:
+        """
+        seleccionar -
+        
+        Selecciona aleatoriamente un operador con las probabilidades actuales.
+        
+        Returns
+        -------
+        str :
+            Nombre del operador seleccionado.
+        """
+        return rand.choices(
+            self.activos
+            , weights=[self.probabilidades[nombre] for nombre in self.activos]
+            , k=1
+        )[0]
+    
+    def registrar(self
+            , nombre : str
+            , exito : bool
+            , mejora : float
+            , tiempo : float
+            , aptitud_inicial : float = 1
+        ):
+        """
+        registrar -
+        
+        Registra el resultado de una mutación y, si es adaptativo, actualiza
+        las probabilidades de selección.
+        
+        Parameters
+        ----------
+        nombre (str) :
+            Nombre del operador.
+        
+        exito (bool) :
+            Si la mutación fue aplicada.
+        
+        mejora (float) :
+            Reducción de la aptitud del individuo (valor positivo es mejor).
+        
+        tiempo (float) :
+            Tiempo en segundos que tomó la mutación.
+        
+        aptitud_inicial (float, optional, defaults to 1) :
+            Aptitud del individuo antes de la mutación, utilizada para la mejora relativa.
+        """
+        if self.eventos is not None:
+            self.eventos.append((nombre, exito, mejora, tiempo, aptitud_inicial))
+        
+        estadistica = self.estadisticas[nombre]
+        estadistica["intentos"] += 1
+        estadistica["exitos"] += int(exito)
+        estadistica["mejora"] += mejora
+        estadistica["tiempo"] += tiempo
+        
+        if not self.adaptativo:
+            return
+        
+        recompensa = 0.0
+        if exito:
+            #cambio relativo con signo, limitado a [0,1], por unidad de costo del operador
+            recompensa = min(max(mejora / max(abs(aptitud_inicial), 1e-12), 0.0), 1.0) / self.costos[nombre]
+        
+        self.calidades[nombre] += self.tasa_aprendizaje * (recompensa - self.calidades[nombre])
+        
+        #adaptive pursuit, los mejores operadores se acercan a la probabilidad maxima y el resto a la minima
+        #en caso de empate la probabilidad maxima se divide entre los mejores
+        calidad_maxima = max(self.calidades[x] for x in self.activos)
+        mejores = [x for x in self.activos if self.calidades[x] == calidad_maxima]
+        probabilidad_maxima = (1 - (len(self.activos) - len(mejores)) * self.probabilidad_minima) / len(mejores)
+        for operador in self.activos:
+            objetivo = probabilidad_maxima if operador in mejores else self.probabilidad_minima
+            self.probabilidades[operador] += self.tasa_aprendizaje * (objetivo - self.probabilidades[operador])
+    
+    def mutar(self
+            , individuo : IndividuoA
+            , kwargs_operadores : dict[str, dict] = None
+        ) -> bool:
+        """
+        mutar -
+        
+        Selecciona un operador, lo aplica al cromosoma del individuo y registra el resultado.
+        
+        Parameters
+        ----------
+        individuo (IndividuoA) :
+            El individuo a mutar.
+        
+        kwargs_operadores (dict[str, dict], optional, defaults to None) :
+            kwargs de cada operador, con el nombre del operador como llave.
+        
+        Returns
+        -------
+        bool :
+            True si la mutación fue aplicada correctamente, False en caso contrario.
+        """
+        nombre = self.seleccionar()
+        kwargs = dict() if kwargs_operadores is None else kwargs_operadores.get(nombre, dict())
+        
+        aptitud_inicial = individuo.aptitud()
+        inicio = time.perf_counter()
+        _, exito, _ = getattr(individuo, OPERADORES[nombre])(**kwargs)
+        tiempo = time.perf_counter() - inicio
+        
+        mejora = (aptitud_inicial - individuo.aptitud()) if exito else 0.0
+        
+        self.registrar(
+            nombre=nombre
+            , exito=exito
+            , mejora=mejora
+            , tiempo=tiempo
+            , aptitud_inicial=aptitud_inicial
+        )
+        
+        return exito
+    
+    def resumen(self) -> list[str]:
+        """
+        resumen -
+        
+        Genera las líneas de texto con las estadísticas de cada operador.
+        
+        Returns
+        -------
+        list[str] :
+            Una línea por operador.
+        """
+        lineas = []
+        for nombre in OPERADORES:
+            estadistica = self.estadisticas[nombre]
+            lineas.append(
+                f"{nombre}: intentos={estadistica["intentos"]}"
+                f",exitos={estadistica["exitos"]}"
+                f",mejora={estadistica["mejora"]}"
+                f",tiempo={estadistica["tiempo"]:.4f}"
+                f",probabilidad={self.probabilidades[nombre]:.4f}"
+            )
+        return lineas
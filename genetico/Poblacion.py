@@ -2,7 +2,138 @@ import numpy as np
 import random as rand
 import os
 import time
+import copy
+import json
+from concurrent.futures import ProcessPoolExecutor
+from Carga_Datos import (
+    cargar_instancia
+    , PATH_INPUT
+    , GEN_VACIO
+    , CAPA_GEN
+)
 from .IndividuoA import IndividuoA
+from .OperadoresMutacion import OperadoresMutacion
+
+def _inicializar_trabajador(input_path : str):
+    """
+    _inicializar_trabajador - 
+    
+    Carga los datos del problema al iniciar cada proceso del ProcessPoolExecutor,
+    los individuos recibidos por el proceso utilizan la misma instancia.
+    
+    Parameters
+    ----------
+    input_path (str) :
+        Path donde se ubican los datos a procesar
+    """
+    cargar_instancia(PATH_INPUT if input_path is None else input_path)
+
+def _crear_individuo(semilla : int
+        , kwargs_inicializar : dict
+        , input_path : str
+    ) -> IndividuoA:
+    """
+    _crear_individuo - 
+    
+    Crea e inicializa un individuo con su propia semilla aleatoria.
+    Es una función de módulo para poder enviarla a los procesos de un ProcessPoolExecutor.
+    
+    Parameters
+    ----------
+    semilla (int) :
+        Semilla aleatoria del individuo.
+    
+    kwargs_inicializar (dict) :
+        Parámetros de la inicialización del individuo.
+    
+    input_path (str) :
+        Path donde se ubican los datos a procesar
+    
+    Returns
+    -------
+    IndividuoA :
+        El individuo inicializado.
+    """
+    return IndividuoA(inicializar=True
+        ,kwargs_inicializar=kwargs_inicializar
+        ,random_seed=semilla
+        ,input_path=input_path
+    )
+
+def _crear_descendientes_par(poblacion : "Poblacion"
+        , madre : IndividuoA
+        , padre : IndividuoA
+        , semilla : int
+        , kwargs_descendientes : dict
+    ) -> tuple[list[IndividuoA], list[tuple[str, bool, float, float, float]]]:
+    """
+    _crear_descendientes_par - 
+    
+    Crea los descendientes de un par de ascendientes con su propia semilla aleatoria.
+    Es una función de módulo para poder enviarla a los procesos de un ProcessPoolExecutor.
+    
+    Parameters
+    ----------
+    poblacion (Poblacion) :
+        Copia de la población creada con `Poblacion.copia_trabajador`.
+    
+    madre (IndividuoA) :
+        Una instancia de `IndividuoA`
+    
+    padre (IndividuoA) :
+        Una instancia de `IndividuoA`
+    
+    semilla (int) :
+        Semilla aleatoria del par.
+    
+    kwargs_descendientes (dict) :
+        Parámetros de `Poblacion.crear_descendientes`.
+    
+    Returns
+    -------
+    tuple[list[IndividuoA], list[tuple[str, bool, float, float, float]]] :
+        * Los descendientes regresados por `Poblacion.crear_descendientes`.
+        * Los resultados de las mutaciones, revisa `OperadoresMutacion.combinar`.
+    """
+    hijos = poblacion.crear_descendientes(
+        madre=madre
+        , padre=padre
+        , semilla=semilla
+        , **kwargs_descendientes
+    )
+    return hijos, poblacion.operadores_mutacion.eventos
+
+#atributos de la poblacion guardados en los checkpoints, revisa `Poblacion.reanudar`
+_ATRIBUTOS_CHECKPOINT : tuple[str, ...] = (
+    "id"
+    , "cantidad_individuos"
+    , "p_mutacion"
+    , "cantidad_maxima_generaciones"
+    , "tiempo_maximo"
+    , "p_optimizacion_deterministica"
+    , "params_inicializar"
+    , "params_mutacion"
+    , "intentos_mutacion"
+    , "params_mutacion_mover_periodos"
+    , "ponderacion_mutacion"
+    , "procesos"
+    , "input_path"
+    , "pesos_aptitud"
+    , "generaciones_sin_mejora"
+    , "mejora_relativa_minima"
+    , "ventana_mejora"
+    , "diversidad_minima"
+    , "cota_inferior"
+    , "accion_convergencia"
+    , "proporcion_reinicio"
+    , "eventos_convergencia"
+    , "seleccion"
+    , "tamano_torneo"
+    , "presion_ranking"
+    , "reemplazo"
+    , "proporcion_estado_estable"
+    , "evaluaciones"
+)
 
 class Poblacion():
     
@@ -23,6 +154,21 @@ class Poblacion():
             , id_nombre : str = None
             , random_seed : int = None
             , input_path : str = None
+            , procesos : int = 1
+            , mutacion_adaptativa : bool = True
+            , ponderacion_mutacion : str = None
+            , generaciones_sin_mejora : int = None
+            , mejora_relativa_minima : float = None
+            , ventana_mejora : int = 10
+            , diversidad_minima : float = None
+            , cota_inferior : float = None
+            , accion_convergencia : str = "terminar"
+            , proporcion_reinicio : float = 0.5
+            , seleccion : str = "aleatoria"
+            , tamano_torneo : int = 2
+            , presion_ranking : float = 1.5
+            , reemplazo : str = "generacional"
+            , proporcion_estado_estable : float = 0.2
         ):
         """
         __init__ - 
@@ -105,6 +251,82 @@ class Poblacion():
         input_path (str, optional, defaults to None) :
             Path donde se ubican los datos a procesar
         
+        procesos (int, optional, defaults to 1) :
+            Número de procesos utilizados para inicializar los individuos y crear los descendientes de cada generación.
+            Si es 1 todo se procesa en el proceso actual, si es None se utiliza `os.cpu_count()`.
+            Cada individuo y cada par de ascendientes tiene su propia semilla, por lo que el resultado
+            no depende del número de procesos.
+            Los procesos se conservan entre generaciones, revisa `self.cerrar_procesos`.
+        
+        mutacion_adaptativa (bool, optional, defaults to True) :
+            Si las probabilidades de seleccionar cada tipo de mutación se adaptan durante la ejecución
+            según la mejora de la aptitud por unidad de costo de cada operador. Los pesos `peso_mutacion_*` son las probabilidades iniciales.
+            Si es False siempre se utilizan los pesos `peso_mutacion_*`.
+            Revisa `OperadoresMutacion` para más información.
+        
+        ponderacion_mutacion (str, optional, defaults to None) :
+            Peso para seleccionar el task mode asignado que se muta.
+            None selecciona con igual probabilidad, "energia" según el precio de la energia del task mode,
+            "retraso" según que tan cerca del makespan termina el task mode.
+            Revisa `IndividuoA.seleccionar_task_mode_ocupado` para más información.
+        
+        generaciones_sin_mejora (int, optional, defaults to None) :
+            Criterio de convergencia, número de generaciones sin mejorar el incumbente.
+            Debe ser None o un número entero mayor a 0. Si es None no se utiliza.
+        
+        mejora_relativa_minima (float, optional, defaults to None) :
+            Criterio de convergencia, mejora relativa mínima del incumbente en las últimas
+            `ventana_mejora` generaciones. Debe ser None o un número mayor o igual a 0. Si es None no se utiliza.
+        
+        ventana_mejora (int, optional, defaults to 10) :
+            Número de generaciones utilizadas en `mejora_relativa_minima`. Debe ser un número entero mayor a 0.
+        
+        diversidad_minima (float, optional, defaults to None) :
+            Criterio de convergencia, diversidad mínima de la población, revisa `self.diversidad`.
+            Debe ser None o un número entre [0,1]. Si es None no se utiliza.
+        
+        cota_inferior (float, optional, defaults to None) :
+            Criterio de convergencia, la simulación termina cuando la aptitud promedio del incumbente
+            es menor o igual a la cota, sin importar `accion_convergencia`. Si es None no se utiliza.
+        
+        accion_convergencia (str, optional, defaults to "terminar") :
+            Acción cuando se cumple un criterio de convergencia:
+            * "terminar": termina la simulación.
+            * "reiniciar": reemplaza los peores individuos por individuos nuevos (`IndividuoA.inicializar`)
+                y los criterios se vuelven a revisar desde esa generación.
+        
+        proporcion_reinicio (float, optional, defaults to 0.5) :
+            Proporción de los individuos que se reemplazan al reiniciar. Debe ser un número entre (0,1].
+        
+        Los criterios de convergencia utilizan el incumbente con la aptitud promedio
+        (`makespan` más `costo`), sin importar la medida optimizada en cada generación.
+        El criterio y la acción se guardan en `self.eventos_convergencia`.
+        
+        seleccion (str, optional, defaults to "aleatoria") :
+            Selección de los ascendientes de cada generación:
+            * "aleatoria": se revuelve la población y se forman pares con los vecinos.
+            * "torneo": cada ascendiente es el mejor de `tamano_torneo` individuos escogidos aleatoriamente.
+            * "ranking": selección proporcional a la posición en la población ordenada por aptitud (ranking lineal).
+            * "sus": stochastic universal sampling, proporcional a la diferencia con la peor aptitud.
+        
+        tamano_torneo (int, optional, defaults to 2) :
+            Número de individuos en cada torneo. Debe ser un número entero mayor o igual a 1.
+        
+        presion_ranking (float, optional, defaults to 1.5) :
+            Presión de selección del ranking lineal, el número esperado de veces que se selecciona el mejor individuo.
+            Debe ser un número entre [1,2], 1 es selección uniforme.
+        
+        reemplazo (str, optional, defaults to "generacional") :
+            Reemplazo de la población con los descendientes:
+            * "generacional": los descendientes reemplazan a toda la población.
+            * "elitista": (μ+λ) se conservan los mejores `n` individuos entre la población y los descendientes.
+            * "estado_estable": se crean los descendientes de `proporcion_estado_estable` de la población
+                y reemplazan a los peores individuos, revisa `self.reemplazar_peores`.
+        
+        proporcion_estado_estable (float, optional, defaults to 0.2) :
+            Proporción de la población reemplazada en cada generación con `reemplazo="estado_estable"`,
+            al menos un par de ascendientes. Debe ser un número entre (0,1].
+        
         Raises
         ------
         ValueError :
@@ -148,6 +370,45 @@ class Poblacion():
         if intentos_mutacion < 0:
             raise ValueError(f"intentos_mutacion debe ser mayor o igual a 0, valor actual={intentos_mutacion}")
         
+        if ponderacion_mutacion not in (None, "energia", "retraso"):
+            raise ValueError(f"ponderacion_mutacion debe ser None, 'energia' o 'retraso', valor actual={ponderacion_mutacion}")
+        
+        if (procesos is not None) and (procesos < 1):
+            raise ValueError(f"procesos debe ser None o un número entero mayor o igual a 1, valor actual={procesos}")
+        
+        if (generaciones_sin_mejora is not None) and (generaciones_sin_mejora <= 0):
+            raise ValueError(f"generaciones_sin_mejora debe ser None o un número entero mayor a 0, valor actual={generaciones_sin_mejora}")
+        
+        if (mejora_relativa_minima is not None) and (mejora_relativa_minima < 0):
+            raise ValueError(f"mejora_relativa_minima debe ser None o un número mayor o igual a 0, valor actual={mejora_relativa_minima}")
+        
+        if ventana_mejora <= 0:
+            raise ValueError(f"ventana_mejora debe ser un número entero mayor a 0, valor actual={ventana_mejora}")
+        
+        if (diversidad_minima is not None) and ((diversidad_minima < 0) or (diversidad_minima > 1)):
+            raise ValueError(f"diversidad_minima debe ser None o un valor entre [0,1], valor actual={diversidad_minima}")
+        
+        if accion_convergencia not in ("terminar", "reiniciar"):
+            raise ValueError(f"accion_convergencia debe ser 'terminar' o 'reiniciar', valor actual={accion_convergencia}")
+        
+        if (proporcion_reinicio <= 0) or (proporcion_reinicio > 1):
+            raise ValueError(f"proporcion_reinicio debe ser un valor entre (0,1], valor actual={proporcion_reinicio}")
+        
+        if seleccion not in ("aleatoria", "torneo", "ranking", "sus"):
+            raise ValueError(f"seleccion debe ser 'aleatoria', 'torneo', 'ranking' o 'sus', valor actual={seleccion}")
+        
+        if tamano_torneo < 1:
+            raise ValueError(f"tamano_torneo debe ser un número entero mayor o igual a 1, valor actual={tamano_torneo}")
+        
+        if (presion_ranking < 1) or (presion_ranking > 2):
+            raise ValueError(f"presion_ranking debe ser un valor entre [1,2], valor actual={presion_ranking}")
+        
+        if reemplazo not in ("generacional", "elitista", "estado_estable"):
+            raise ValueError(f"reemplazo debe ser 'generacional', 'elitista' o 'estado_estable', valor actual={reemplazo}")
+        
+        if (proporcion_estado_estable <= 0) or (proporcion_estado_estable > 1):
+            raise ValueError(f"proporcion_estado_estable debe ser un valor entre (0,1], valor actual={proporcion_estado_estable}")
+        
         self.id = id_nombre
         
         self.cantidad_individuos = n
@@ -169,29 +430,136 @@ class Poblacion():
         
         self.intentos_mutacion = intentos_mutacion
         
+        self.operadores_mutacion = OperadoresMutacion(
+            pesos={
+                "mover_periodo" : peso_mutacion_mover_periodo
+                , "cambiar_task" : peso_mutacion_cambiar_task
+            }
+            , adaptativo=mutacion_adaptativa
+        )
+        
         self.params_mutacion_mover_periodos = {
             "probabilidad_reducir" : prob_mutacion_mover_periodo_reducir
             , "probabilidad_completo" : prob_mutacion_mover_periodo_completa
         }
         
+        self.ponderacion_mutacion = ponderacion_mutacion
+        
+        self.generaciones_sin_mejora = generaciones_sin_mejora
+        self.mejora_relativa_minima = mejora_relativa_minima
+        self.ventana_mejora = ventana_mejora
+        self.diversidad_minima = diversidad_minima
+        self.cota_inferior = cota_inferior
+        self.accion_convergencia = accion_convergencia
+        self.proporcion_reinicio = proporcion_reinicio
+        #(generacion, criterio, accion) de cada criterio de convergencia cumplido
+        self.eventos_convergencia : list[tuple[int, str, str]] = list()
+        
+        self.seleccion = seleccion
+        self.tamano_torneo = tamano_torneo
+        self.presion_ranking = presion_ranking
+        self.reemplazo = reemplazo
+        self.proporcion_estado_estable = proporcion_estado_estable
+        #número de individuos creados y evaluados, incluye la inicialización
+        self.evaluaciones : int = n
+        
+        self.procesos = procesos if procesos is not None else os.cpu_count()
+        self.input_path = input_path
+        self.__executor : ProcessPoolExecutor | None = None
+        
         inicio = time.time()
         
-        self.individuos: list[IndividuoA] = [
-            IndividuoA(inicializar=True
-                ,kwargs_inicializar=self.params_inicializar
-                ,input_path=input_path
-            ) for _ in range(self.cantidad_individuos)
-        ]
+        #semillas de cada individuo y de las generaciones
+        semillas = [rand.randrange(2**32) for _ in range(self.cantidad_individuos)]
+        semilla_generaciones = rand.randrange(2**32)
+        
+        if self.procesos == 1:
+            self.individuos: list[IndividuoA] = [
+                _crear_individuo(semilla, self.params_inicializar, input_path) for semilla in semillas
+            ]
+        else:
+            self.individuos: list[IndividuoA] = list(self.__obtener_executor().map(
+                _crear_individuo
+                , semillas
+                , [self.params_inicializar] * self.cantidad_individuos
+                , [input_path] * self.cantidad_individuos
+            ))
+        
+        #las generaciones continuan con la misma secuencia sin importar el número de procesos
+        rand.seed(semilla_generaciones)
+        np.random.seed(semilla_generaciones)
+        
+        self.pesos_aptitud : tuple[float, float] = (1, 1)
         
-        self.aptitudes = [[individuo.aptitud() for individuo in self.individuos]]
+        makespan, costo, aptitudes = self.aptitud_lote()
         
-        self.makespan = [[individuo.aptitud(peso_makespan=1,peso_energia=0) for individuo in self.individuos]]
-        self.costo = [[individuo.aptitud(peso_makespan=0,peso_energia=1) for individuo in self.individuos]]
+        self.aptitudes = [aptitudes.tolist()]
+        
+        self.makespan = [makespan.tolist()]
+        self.costo = [costo.tolist()]
         
         self.tiempos= [time.time()-inicio]
         self.individuo_incumbente : IndividuoA = None
         self.medida_busqueda = ["inicializar"]
+        
+        #posicion de la simulacion, revisa `self.calcular_solucion`
+        self.__estado_simulacion : dict | None = None
 
+    def __obtener_executor(self) -> ProcessPoolExecutor:
+        """
+        __obtener_executor - 
+        
+        Regresa el ProcessPoolExecutor de la población, se crea la primera vez que se utiliza.
+        
+        Returns
+        -------
+        ProcessPoolExecutor :
+            Executor con `self.procesos` procesos, cada uno con los datos del problema cargados.
+        """
+        if self.__executor is None:
+            self.__executor = ProcessPoolExecutor(
+                max_workers=self.procesos
+                , initializer=_inicializar_trabajador
+                , initargs=(self.input_path,)
+            )
+        return self.__executor
+    
+    def cerrar_procesos(self):
+        """
+        cerrar_procesos - 
+        
+        Termina los procesos del ProcessPoolExecutor de la población si existen.
+        Si se crea otra generación se vuelven a crear.
+        """
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+    
+    def copia_trabajador(self) -> "Poblacion":
+        """
+        copia_trabajador - 
+        
+        Crea una copia de la población sin individuos ni historial, con una copia
+        del registro de operadores de mutación. Es la información necesaria para
+        crear los descendientes de un par en otro proceso.
+        
+        Returns
+        -------
+        Poblacion :
+            Copia de la población.
+        """
+        copia = copy.copy(self)
+        copia.individuos = list()
+        copia.aptitudes = list()
+        copia.makespan = list()
+        copia.costo = list()
+        copia.tiempos = list()
+        copia.medida_busqueda = list()
+        copia.individuo_incumbente = None
+        copia.__executor = None
+        copia.operadores_mutacion = self.operadores_mutacion.copia()
+        return copia
+    
     def mutar_individuo(self
             , individuo : IndividuoA
             , intentos : int = 1
@@ -217,11 +585,15 @@ class Poblacion():
         
         for _ in range(intentos):
             if rand.random() < self.p_mutacion:
-                individuo.mutacion(
-                    peso_mover_periodo=self.params_mutacion["peso_mover_periodo"]
-                    , peso_cambiar_task=self.params_mutacion["peso_cambiar_task"]
-                    , kwargs_mover_periodo=self.params_mutacion_mover_periodos
-                    , intentos_maximo=self.intentos_mutacion
+                self.operadores_mutacion.mutar(
+                    individuo
+                    , kwargs_operadores={
+                        "mover_periodo" : {
+                            **self.params_mutacion_mover_periodos
+                            , "ponderacion" : self.ponderacion_mutacion
+                        }
+                        , "cambiar_task" : {"ponderacion" : self.ponderacion_mutacion}
+                    }
                 )
 
         return individuo
@@ -236,6 +608,7 @@ class Poblacion():
             , verbose : bool = False
             , peso_makespan : float = 1
             , peso_energia : float = 1
+            , semilla : int = None
         ) -> list[IndividuoA]:
         """
         crear_descendientes - 
@@ -264,6 +637,9 @@ class Poblacion():
         n_descendientes_creados (int, optional, defaults to 4) :
             Número de descendientes creados en total. 
         
+        semilla (int, optional, defaults to None) :
+            Si no es None se asigna esta semilla aleatoria antes de crear los descendientes.
+        
         Returns
         -------
         list[IndividuoA] :
@@ -279,6 +655,10 @@ class Poblacion():
         if n_descendientes_regresados > n_descendientes_creados:
             raise ValueError("n_descendientes_regresados debe ser menor o igual a n_descendientes_creados")
         
+        if semilla is not None:
+            rand.seed(semilla)
+            np.random.seed(semilla)
+        
         hijos = []
         aptitudes_hijos = []
         
@@ -320,11 +700,27 @@ class Poblacion():
         
         Realiza los pasos de cruce y mutación.
         
+        Cada par de ascendientes se procesa de forma independiente con su propia semilla,
+        en `self.procesos` procesos, y los resultados se combinan en el orden de los pares.
+        
+        Los ascendientes se escogen según `self.seleccion` y los descendientes
+        se agregan a la población según `self.reemplazo`.
+        
         Revisa `self.crear_descendientes` y `self.mutar_individuo` para más información.
         """
         
-        generacion_actual = self.individuos.copy()
-        rand.shuffle(generacion_actual)
+        #aptitudes de la poblacion actual con los pesos de esta generacion
+        aptitudes_actual = None
+        if (self.seleccion != "aleatoria") or (self.reemplazo == "elitista"):
+            _, _, aptitudes_actual = self.aptitud_lote(
+                peso_makespan=peso_makespan
+                , peso_energia=peso_energia
+            )
+        
+        if self.reemplazo == "estado_estable":
+            cantidad_pares = max(1, int(round(self.proporcion_estado_estable * self.cantidad_individuos / 2)))
+        else:
+            cantidad_pares = self.cantidad_individuos // 2
         
         generacion_nueva: list[IndividuoA] = []
         
@@ -332,43 +728,74 @@ class Poblacion():
             print("*"*10)
             print("Creando generacion nueva")
         
-        while len(generacion_nueva) != self.cantidad_individuos:
-            madre = generacion_actual.pop(0)
-            padre = generacion_actual.pop(0)
-            
-            if verbose:
+        #pares de ascendientes, cada par tiene su propia semilla y copia de la poblacion
+        madres, padres = self.__seleccionar_ascendientes(cantidad_pares, aptitudes_actual)
+        semillas = [rand.randrange(2**32) for _ in madres]
+        copias = [self.copia_trabajador() for _ in madres]
+        kwargs_descendientes = {
+            "probabilidad_optimizacion_deterministica" : self.p_optimizacion_deterministica
+            , "n_descendientes_creados" : 4
+            , "peso_energia" : peso_energia
+            , "peso_makespan" : peso_makespan
+            , "verbose" : verbose
+        }
+        
+        if verbose:
+            for madre, padre in zip(madres, padres):
                 print(f"Aptitud madre {madre.aptitud(peso_makespan=peso_makespan,peso_energia=peso_energia):.2f}")
                 print(f"Aptitud padre {padre.aptitud(peso_makespan=peso_makespan,peso_energia=peso_energia):.2f}")
-            
-            hijos_nuevos: list[IndividuoA] = self.crear_descendientes(
-                madre=madre
-                ,padre=padre
-                ,probabilidad_optimizacion_deterministica=self.p_optimizacion_deterministica
-                ,n_descendientes_creados=4
-                ,peso_energia=peso_energia
-                ,peso_makespan=peso_makespan
-                ,verbose=verbose
-            )
-            
+        
+        argumentos = (copias, madres, padres, semillas, [kwargs_descendientes] * len(madres))
+        if self.procesos == 1:
+            #se conserva el estado aleatorio, igual que al utilizar otros procesos
+            estado_rand = rand.getstate()
+            estado_np = np.random.get_state()
+            resultados = list(map(_crear_descendientes_par, *argumentos))
+            rand.setstate(estado_rand)
+            np.random.set_state(estado_np)
+        else:
+            resultados = list(self.__obtener_executor().map(_crear_descendientes_par, *argumentos))
+        
+        #los resultados se combinan en el orden de los pares
+        for hijos_nuevos, eventos in resultados:
+            self.operadores_mutacion.combinar(eventos)
             for hijo in hijos_nuevos:
                 if verbose:
                     print(f"Aptitud hijo {hijo.aptitud(peso_makespan=peso_makespan,peso_energia=peso_energia):.2f}")
                 generacion_nueva.append(hijo)
-
+            
             if verbose:
                 print(f"Cantidad individuos {len(generacion_nueva)}")
         
-        self.individuos = generacion_nueva
-        
-        aptitudes_nuevas = [individuo.aptitud(
-            peso_makespan=peso_makespan, peso_energia=peso_energia
-            ) for individuo in self.individuos]
+        self.evaluaciones += cantidad_pares * kwargs_descendientes["n_descendientes_creados"]
+        self.pesos_aptitud = (peso_makespan, peso_energia)
         
-        makespan_nuevas = [individuo.aptitud(
-            peso_makespan=1,peso_energia=0) for individuo in self.individuos]
-        
-        costo_nuevas = [individuo.aptitud(
-            peso_makespan=0,peso_energia=1) for individuo in self.individuos]
+        if self.reemplazo == "generacional":
+            self.individuos = generacion_nueva
+        elif self.reemplazo == "elitista":
+            #(μ+λ) se conservan los mejores entre la poblacion actual y los descendientes
+            _, _, aptitudes_nuevas = self.aptitud_lote(
+                peso_makespan=peso_makespan
+                , peso_energia=peso_energia
+                , individuos=generacion_nueva
+            )
+            candidatos = self.individuos + generacion_nueva
+            mejores = np.argsort(
+                np.concatenate([aptitudes_actual, aptitudes_nuevas])
+                , kind="stable"
+            )[:self.cantidad_individuos]
+            self.individuos = [candidatos[i] for i in mejores]
+        else:
+            self.reemplazar_peores(generacion_nueva)
+        
+        #makespan y costo de todos los individuos en lote
+        makespan_nuevas, costo_nuevas, aptitudes_nuevas = self.aptitud_lote(
+            peso_makespan=peso_makespan
+            , peso_energia=peso_energia
+        )
+        aptitudes_nuevas = aptitudes_nuevas.tolist()
+        makespan_nuevas = makespan_nuevas.tolist()
+        costo_nuevas = costo_nuevas.tolist()
         if verbose:
             print("Aptitudes nueva generacion")
             print(aptitudes_nuevas)
@@ -377,11 +804,72 @@ class Poblacion():
         self.makespan.append(makespan_nuevas)
         self.costo.append(costo_nuevas)
 
+    def __seleccionar_ascendientes(self
+            , cantidad_pares : int
+            , aptitudes : np.ndarray | None = None
+        ) -> tuple[list[IndividuoA], list[IndividuoA]]:
+        """
+        __seleccionar_ascendientes - 
+        
+        Escoge los pares de ascendientes según `self.seleccion`.
+        
+        Parameters
+        ----------
+        cantidad_pares (int) :
+            Número de pares de ascendientes.
+        
+        aptitudes (np.ndarray | None, optional, defaults to None) :
+            Aptitudes de la población actual, revisa `self.aptitud_lote`.
+            No se utiliza con la selección "aleatoria".
+        
+        Returns
+        -------
+        tuple[list[IndividuoA], list[IndividuoA]] :
+            `(madres, padres)`, el par `i` es `(madres[i], padres[i])`.
+        """
+        n = len(self.individuos)
+        cantidad = 2 * cantidad_pares
+        
+        if self.seleccion == "aleatoria":
+            generacion_actual = self.individuos.copy()
+            rand.shuffle(generacion_actual)
+            seleccionados = generacion_actual[:cantidad]
+            return seleccionados[0::2], seleccionados[1::2]
+        
+        if self.seleccion == "torneo":
+            indices = []
+            for _ in range(cantidad):
+                participantes = rand.sample(range(n), min(self.tamano_torneo, n))
+                indices.append(min(participantes, key=lambda i: aptitudes[i]))
+        
+        elif self.seleccion == "ranking":
+            #posicion 0 es el mejor individuo
+            posiciones = np.empty(n, dtype=np.int64)
+            posiciones[np.argsort(aptitudes, kind="stable")] = np.arange(n)
+            s = self.presion_ranking
+            pesos = (2 - s) / n + 2 * (s - 1) * (n - 1 - posiciones) / (n * max(n - 1, 1))
+            indices = rand.choices(range(n), weights=pesos.tolist(), k=cantidad)
+        
+        else:
+            #stochastic universal sampling, al minimizar el valor es la diferencia con la peor aptitud
+            valores = np.max(aptitudes) - aptitudes + 1e-12
+            distancia = float(np.sum(valores)) / cantidad
+            punteros = rand.uniform(0, distancia) + distancia * np.arange(cantidad)
+            indices = np.searchsorted(np.cumsum(valores), punteros, side="right")
+            indices = np.minimum(indices, n - 1).tolist()
+            #los punteros estan ordenados, se revuelven para formar los pares
+            rand.shuffle(indices)
+        
+        seleccionados = [self.individuos[i] for i in indices]
+        return seleccionados[0::2], seleccionados[1::2]
+    
     def calcular_solucion(
             self
             , verbose : bool = False
             , ciclo : dict[str,int] | None = None
             , iniciar_makespan : bool | None = None
+            , checkpoint : str = None
+            , generaciones_checkpoint : int = 10
         ):
         """
         calcular_solucion - 
@@ -412,11 +900,69 @@ class Poblacion():
             con `energia`.
             Si es None se fija a iniciar con `makespan` si se utiliza el ciclo.
         
+        checkpoint (str, optional, defaults to None) :
+            Archivo .npz donde se guarda el estado de la simulación cada `generaciones_checkpoint`
+            generaciones y al terminar. Si es None no se guarda.
+            La simulación se continua con `Poblacion.reanudar`.
+        
+        generaciones_checkpoint (int, optional, defaults to 10) :
+            Número de generaciones entre cada checkpoint. Debe ser un número entero mayor a 0.
+            Se guarda en el checkpoint y `Poblacion.reanudar` lo conserva.
+        
+        """
+        
+        self.preparar_simulacion(
+            ciclo=ciclo
+            , iniciar_makespan=iniciar_makespan
+            , generaciones_checkpoint=generaciones_checkpoint
+        )
+        
+        if verbose:
+            print("Iniciando")
+            print("*"*20)
+        
+        self.avanzar(
+            verbose=verbose
+            , checkpoint=checkpoint
+        )
+        
+        #terminar los procesos utilizados para crear las generaciones
+        self.cerrar_procesos()
+    
+    def preparar_simulacion(
+            self
+            , ciclo : dict[str,int] | None = None
+            , iniciar_makespan : bool | None = None
+            , generaciones_checkpoint : int = 10
+        ):
+        """
+        preparar_simulacion - 
+        
+        Fija la posición inicial de la simulación, la primera generación y medida del ciclo,
+        sin crear generaciones. Las generaciones se crean con `self.avanzar`.
+        
+        Parameters
+        ----------
+        ciclo (dict[str,int] | None, optional, defaults to None) :
+            Revisa `self.calcular_solucion`.
+        
+        iniciar_makespan (bool | None, optional, defaults to None) :
+            Revisa `self.calcular_solucion`.
+        
+        generaciones_checkpoint (int, optional, defaults to 10) :
+            Revisa `self.calcular_solucion`.
+        
+        Raises
+        ------
+        ValueError :
+            Si `generaciones_checkpoint` no es mayor a 0.
         """
         
-        time_start = time.time()
-        generacion = 1
-        ciclo_iteracion = 1
+        if generaciones_checkpoint <= 0:
+            raise ValueError(f"generaciones_checkpoint debe ser un número entero mayor a 0, valor actual={generaciones_checkpoint}")
+        
+        generaciones_makespan = 0
+        generaciones_energia = 0
         
         if ciclo is not None:
             generaciones_makespan = ciclo.get("makespan",1)
@@ -438,16 +984,84 @@ class Poblacion():
         else:
             medida = "promedio"
         
-        if verbose:
-            print("Iniciando")
-            print("*"*20)
-
-        continuar = True
-        while continuar:
+        #posicion de la simulacion, se guarda en los checkpoints
+        self.__estado_simulacion = {
+            "generacion" : 1
+            , "ciclo_iteracion" : 1
+            , "medida" : medida
+            , "usar_ciclo" : ciclo is not None
+            , "generaciones_makespan" : generaciones_makespan
+            , "generaciones_energia" : generaciones_energia
+            , "tiempo_transcurrido" : 0.0
+            , "terminado" : False
+            , "generacion_reinicio" : 0
+            , "generaciones_checkpoint" : generaciones_checkpoint
+        }
+    
+    def avanzar(
+            self
+            , generaciones : int | None = None
+            , verbose : bool = False
+            , checkpoint : str = None
+        ) -> bool:
+        """
+        avanzar - 
+        
+        Crea generaciones desde la posición guardada en `self.__estado_simulacion`,
+        con el ciclo de medidas, los criterios de convergencia y los checkpoints.
+        Se detiene al crear `generaciones` generaciones o al terminar la simulación
+        (límite de generaciones, de tiempo o criterio de convergencia).
+        
+        La posición se conserva entre llamadas, por ejemplo para migrar individuos
+        entre llamadas (revisa `Islas`).
+        
+        Parameters
+        ----------
+        generaciones (int | None, optional, defaults to None) :
+            Número máximo de generaciones creadas. Si es None se crean hasta terminar la simulación.
+        
+        verbose (bool, optional, defaults to False) :
+            Si se imprime el progreso en la consola.
+        
+        checkpoint (str, optional, defaults to None) :
+            Revisa `self.calcular_solucion`.
+        
+        Returns
+        -------
+        bool :
+            Si la simulación terminó.
+        
+        Raises
+        ------
+        ValueError :
+            Si la simulación no se ha preparado con `self.preparar_simulacion` o `generaciones` es menor a 0.
+        """
+        if self.__estado_simulacion is None:
+            raise ValueError(f"la simulación no se ha preparado, revisa `Poblacion.preparar_simulacion`")
+        
+        if (generaciones is not None) and (generaciones < 0):
+            raise ValueError(f"generaciones debe ser None o un número entero mayor o igual a 0, valor actual={generaciones}")
+        
+        estado = self.__estado_simulacion
+        
+        generacion = estado["generacion"]
+        generaciones_checkpoint = estado["generaciones_checkpoint"]
+        ciclo_iteracion = estado["ciclo_iteracion"]
+        medida = estado["medida"]
+        usar_ciclo = estado["usar_ciclo"]
+        generaciones_makespan = estado["generaciones_makespan"]
+        generaciones_energia = estado["generaciones_energia"]
+        
+        #el tiempo de la simulacion incluye el tiempo de las llamadas anteriores y antes del checkpoint
+        time_start = time.time() - estado["tiempo_transcurrido"]
+        
+        creadas = 0
+        continuar = not estado["terminado"]
+        while continuar and ((generaciones is None) or (creadas < generaciones)):
             inicio_generacion = time.time()
             
             #sí se utilizará ciclo
-            if ciclo is not None:
+            if usar_ciclo:
                 if medida == "makespan":
                     peso_makespan = 1
                     peso_energia = 0
@@ -475,9 +1089,10 @@ class Poblacion():
             
             generacion += 1
             ciclo_iteracion += 1
+            creadas += 1
             
             #revisar siguiente ciclo
-            if ciclo is not None:
+            if usar_ciclo:
                 if medida == "energia":
                     if ciclo_iteracion > generaciones_energia:
                         ciclo_iteracion = 1
@@ -494,6 +1109,287 @@ class Poblacion():
             if self.tiempo_maximo is not None:
                 if time.time() - time_start > self.tiempo_maximo:
                     continuar = False
+            
+            #revisar criterios de convergencia
+            if continuar:
+                criterio = self.__revisar_convergencia(estado["generacion_reinicio"])
+                if criterio is not None:
+                    if (criterio == "cota_inferior") or (self.accion_convergencia == "terminar"):
+                        accion = "terminar"
+                        continuar = False
+                    else:
+                        accion = "reiniciar"
+                        self.reiniciar_peores(self.proporcion_reinicio)
+                        estado["generacion_reinicio"] = len(self.aptitudes) - 1
+                    
+                    self.eventos_convergencia.append((generacion - 1, criterio, accion))
+                    if verbose:
+                        print(f"\nGeneración {generacion - 1}: criterio de convergencia {criterio}, {accion}")
+            
+            estado["generacion"] = generacion
+            estado["ciclo_iteracion"] = ciclo_iteracion
+            estado["medida"] = medida
+            estado["tiempo_transcurrido"] = time.time() - time_start
+            estado["terminado"] = not continuar
+            
+            if checkpoint is not None:
+                if (not continuar) or ((generacion - 1) % generaciones_checkpoint == 0):
+                    self.__guardar_checkpoint(checkpoint)
+        
+        return estado["terminado"]
+    
+    def __revisar_convergencia(self
+            , generacion_reinicio : int = 0
+        ) -> str | None:
+        """
+        __revisar_convergencia - 
+        
+        Revisa los criterios de convergencia con el historial desde `generacion_reinicio`.
+        
+        Parameters
+        ----------
+        generacion_reinicio (int, optional, defaults to 0) :
+            Posición en el historial desde donde se revisan los criterios.
+        
+        Returns
+        -------
+        str | None :
+            Nombre del primer criterio cumplido ("cota_inferior", "sin_mejora", "mejora_relativa" o "diversidad"),
+            None si no se cumple ninguno.
+        """
+        #incumbente de la aptitud promedio en cada generacion
+        mejores = np.min(
+            np.array(self.makespan[generacion_reinicio:]) + np.array(self.costo[generacion_reinicio:])
+            , axis=1
+        )
+        incumbentes = np.minimum.accumulate(mejores)
+        
+        if self.cota_inferior is not None:
+            if incumbentes[-1] <= self.cota_inferior:
+                return "cota_inferior"
+        
+        if self.generaciones_sin_mejora is not None:
+            if len(incumbentes) > self.generaciones_sin_mejora:
+                if incumbentes[-1] >= incumbentes[-1 - self.generaciones_sin_mejora]:
+                    return "sin_mejora"
+        
+        if self.mejora_relativa_minima is not None:
+            if len(incumbentes) > self.ventana_mejora:
+                anterior = incumbentes[-1 - self.ventana_mejora]
+                mejora = (anterior - incumbentes[-1]) / max(abs(anterior), 1e-12)
+                if mejora < self.mejora_relativa_minima:
+                    return "mejora_relativa"
+        
+        if self.diversidad_minima is not None:
+            if self.diversidad() < self.diversidad_minima:
+                return "diversidad"
+        
+        return None
+    
+    def diversidad(self) -> float:
+        """
+        diversidad - 
+        
+        Calcula la diversidad de la población, el promedio de la distancia entre cada par de individuos.
+        La distancia es la proporción de periodos con distinto gen entre los periodos asignados
+        en al menos uno de los dos cromosomas.
+        
+        Returns
+        -------
+        float :
+            Valor entre [0,1], 0 cuando todos los individuos son iguales.
+        """
+        genomas = self.genomas
+        genes = genomas[:, CAPA_GEN].reshape(len(genomas), -1)
+        asignados = genes != GEN_VACIO
+        
+        distancias = []
+        for i in range(len(genes) - 1):
+            diferentes = np.count_nonzero(genes[i] != genes[i + 1:], axis=1)
+            ocupados = np.count_nonzero(asignados[i] | asignados[i + 1:], axis=1)
+            distancias.append(diferentes / np.maximum(ocupados, 1))
+        
+        if len(distancias) == 0:
+            return 0.0
+        return float(np.mean(np.concatenate(distancias)))
+    
+    def reiniciar_peores(self
+            , proporcion : float = 0.5
+        ):
+        """
+        reiniciar_peores - 
+        
+        Reemplaza la proporción de individuos con peor aptitud por individuos nuevos,
+        inicializados con los mismos parámetros que la población. Revisa `self.reemplazar_peores`.
+        
+        Parameters
+        ----------
+        proporcion (float, optional, defaults to 0.5) :
+            Proporción de individuos reemplazados, al menos uno. Debe ser un número entre (0,1].
+        """
+        cantidad = max(1, int(round(proporcion * self.cantidad_individuos)))
+        semillas = [rand.randrange(2**32) for _ in range(cantidad)]
+        
+        if self.procesos == 1:
+            #la inicializacion asigna la semilla de cada individuo, se conserva el estado aleatorio
+            estado_rand = rand.getstate()
+            estado_np = np.random.get_state()
+            nuevos = [
+                _crear_individuo(semilla, self.params_inicializar, self.input_path) for semilla in semillas
+            ]
+            rand.setstate(estado_rand)
+            np.random.set_state(estado_np)
+        else:
+            nuevos = list(self.__obtener_executor().map(
+                _crear_individuo
+                , semillas
+                , [self.params_inicializar] * cantidad
+                , [self.input_path] * cantidad
+            ))
+        
+        self.evaluaciones += cantidad
+        self.reemplazar_peores(nuevos)
+    
+    def __guardar_checkpoint(self, path : str):
+        """
+        __guardar_checkpoint - 
+        
+        Guarda el estado de la simulación en un archivo .npz comprimido:
+        genomas compactos, historial de cada generación, estados aleatorios de `random` y `numpy`,
+        posición del ciclo y registro de operadores de mutación.
+        
+        Se escribe en un archivo temporal que después reemplaza a `path`,
+        por lo que el archivo anterior se conserva si la escritura se interrumpe.
+        
+        Parameters
+        ----------
+        path (str) :
+            Archivo donde se guarda el checkpoint.
+        """
+        carpeta = os.path.dirname(path)
+        # Crear las carpetas si no existen
+        if carpeta and not os.path.exists(carpeta):
+            os.makedirs(carpeta, exist_ok=True)
+        
+        genomas = [individuo.genoma_compacto() for individuo in self.individuos]
+        
+        _, rand_estado, rand_gauss = rand.getstate()
+        _, np_llaves, np_posicion, np_tiene_gauss, np_gauss = np.random.get_state()
+        
+        parametros = {nombre : getattr(self, nombre) for nombre in _ATRIBUTOS_CHECKPOINT}
+        parametros["operadores_mutacion"] = self.operadores_mutacion.estado()
+        parametros["estado_simulacion"] = self.__estado_simulacion
+        
+        temporal = f"{path}.tmp"
+        with open(temporal, "wb") as archivo:
+            np.savez_compressed(
+                archivo
+                , genomas=np.concatenate(genomas)
+                , longitudes=np.array([len(genoma) for genoma in genomas], dtype=np.int64)
+                , aptitudes=np.array(self.aptitudes, dtype=np.float64)
+                , makespan=np.array(self.makespan, dtype=np.float64)
+                , costo=np.array(self.costo, dtype=np.float64)
+                , tiempos=np.array(self.tiempos, dtype=np.float64)
+                , medida_busqueda=np.array(self.medida_busqueda, dtype=np.str_)
+                , rand_estado=np.array(rand_estado, dtype=np.int64)
+                , rand_gauss=np.array([] if rand_gauss is None else [rand_gauss], dtype=np.float64)
+                , np_llaves=np_llaves
+                , np_posicion=np.array([np_posicion, np_tiene_gauss], dtype=np.int64)
+                , np_gauss=np.array([np_gauss], dtype=np.float64)
+                , parametros=np.array(json.dumps(parametros, ensure_ascii=False, default=lambda x: x.item()))
+            )
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, path)
+    
+    @classmethod
+    def reanudar(cls
+            , path : str
+            , verbose : bool = False
+            , generaciones_checkpoint : int | None = None
+        ) -> "Poblacion":
+        """
+        reanudar - 
+        
+        Crea la población guardada en un checkpoint de `calcular_solucion` y continua
+        la simulación, con el mismo resultado que la simulación sin interrumpir
+        (excepto cuando el límite es de tiempo). El checkpoint se sigue actualizando en `path`.
+        
+        Parameters
+        ----------
+        path (str) :
+            Archivo del checkpoint.
+        
+        verbose (bool, optional, defaults to False) :
+            Si se imprime el progreso en la consola.
+        
+        generaciones_checkpoint (int | None, optional, defaults to None) :
+            Número de generaciones entre cada checkpoint. Debe ser None o un número entero mayor a 0.
+            Si es None se utiliza el valor guardado en el checkpoint, el de `calcular_solucion`.
+        
+        Returns
+        -------
+        Poblacion :
+            La población al terminar la simulación.
+        """
+        if (generaciones_checkpoint is not None) and (generaciones_checkpoint <= 0):
+            raise ValueError(f"generaciones_checkpoint debe ser None o un número entero mayor a 0, valor actual={generaciones_checkpoint}")
+        
+        with np.load(path, allow_pickle=False) as datos:
+            parametros = json.loads(str(datos["parametros"]))
+            
+            poblacion = cls.__new__(cls)
+            for nombre in _ATRIBUTOS_CHECKPOINT:
+                setattr(poblacion, nombre, parametros[nombre])
+            poblacion.pesos_aptitud = tuple(poblacion.pesos_aptitud)
+            poblacion.eventos_convergencia = [tuple(evento) for evento in poblacion.eventos_convergencia]
+            poblacion.operadores_mutacion = OperadoresMutacion.desde_estado(parametros["operadores_mutacion"])
+            poblacion.__estado_simulacion = parametros["estado_simulacion"]
+            if generaciones_checkpoint is not None:
+                poblacion.__estado_simulacion["generaciones_checkpoint"] = generaciones_checkpoint
+            poblacion.__executor = None
+            poblacion.individuo_incumbente = None
+            
+            poblacion.individuos = list()
+            for genoma in np.split(datos["genomas"], np.cumsum(datos["longitudes"])[:-1]):
+                individuo = IndividuoA(input_path=poblacion.input_path)
+                individuo.cargar_genoma_compacto(genoma)
+                poblacion.individuos.append(individuo)
+            
+            poblacion.aptitudes = datos["aptitudes"].tolist()
+            poblacion.makespan = datos["makespan"].tolist()
+            poblacion.costo = datos["costo"].tolist()
+            poblacion.tiempos = datos["tiempos"].tolist()
+            poblacion.medida_busqueda = datos["medida_busqueda"].tolist()
+            
+            rand_gauss = datos["rand_gauss"]
+            rand.setstate((
+                3
+                , tuple(int(x) for x in datos["rand_estado"])
+                , float(rand_gauss[0]) if len(rand_gauss) > 0 else None
+            ))
+            np_posicion, np_tiene_gauss = datos["np_posicion"]
+            np.random.set_state((
+                "MT19937"
+                , datos["np_llaves"]
+                , int(np_posicion)
+                , int(np_tiene_gauss)
+                , float(datos["np_gauss"][0])
+            ))
+        
+        if verbose:
+            print(f"Reanudando en la generación {poblacion.__estado_simulacion['generacion']}")
+            print("*"*20)
+        
+        poblacion.avanzar(
+            verbose=verbose
+            , checkpoint=path
+        )
+        
+        #terminar los procesos utilizados para crear las generaciones
+        poblacion.cerrar_procesos()
+        
+        return poblacion
     
     def incumbente(self) -> IndividuoA:
         """
@@ -506,13 +1402,95 @@ class Poblacion():
         IndividuoA :
             El mejor individuo de la generacion actual
         """
-        lista_individuos = self.individuos.copy()
-        lista_aptitudes = self.aptitudes[-1]
+        _, _, aptitudes = self.aptitud_lote(
+            peso_makespan=self.pesos_aptitud[0]
+            , peso_energia=self.pesos_aptitud[1]
+        )
         
-        self.individuo_incumbente : IndividuoA = min(zip(lista_individuos, lista_aptitudes), key=lambda x: x[1])[0]
+        self.individuo_incumbente : IndividuoA = self.individuos[int(np.argmin(aptitudes))]
         
         return self.individuo_incumbente
     
+    def reemplazar_peores(self
+            , individuos : list[IndividuoA]
+        ):
+        """
+        reemplazar_peores - 
+        
+        Reemplaza los individuos con peor aptitud de la generación actual por `individuos`,
+        por ejemplo los migrantes de otra población. La aptitud se calcula con los pesos
+        de la última generación (`self.pesos_aptitud`).
+        
+        Parameters
+        ----------
+        individuos (list[IndividuoA]) :
+            Individuos que se agregan a la población, debe tener como máximo `self.cantidad_individuos` elementos.
+        """
+        if len(individuos) == 0:
+            return
+        
+        _, _, aptitudes = self.aptitud_lote(
+            peso_makespan=self.pesos_aptitud[0]
+            , peso_energia=self.pesos_aptitud[1]
+        )
+        
+        #posiciones de los peores individuos, de peor a mejor
+        peores = np.argsort(aptitudes, kind="stable")[::-1][:len(individuos)]
+        for posicion, individuo in zip(peores, individuos):
+            self.individuos[posicion] = individuo
+    
+    @property
+    def genomas(self) -> np.ndarray:
+        """
+        genomas - 
+        
+        Cromosomas de todos los individuos, forma `(n, capas, maquinas, periodos)`.
+        Se crea en cada consulta a partir de `self.individuos`, que son la fuente de verdad.
+        """
+        return np.stack([individuo.cromosoma for individuo in self.individuos])
+    
+    def aptitud_lote(self
+            , peso_makespan : float = 1
+            , peso_energia : float = 1
+            , individuos : list[IndividuoA] = None
+        ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        aptitud_lote - 
+        
+        Calcula el makespan, el precio de la energia y la aptitud de todos los individuos a la vez.
+        Los objetivos se toman de `IndividuoA.objetivos`, que se guardan en cada individuo
+        y solo se calculan de nuevo cuando cambia su cromosoma, y la aptitud se calcula
+        con operaciones de numpy sobre todos los individuos.
+        
+        Parameters
+        ----------
+        peso_makespan (float, optional, defaults to 1) :
+            El peso que se considera para el `makespan`.
+        
+        peso_energia (float, optional, defaults to 1) :
+            El peso que se considera para el `precio de la energia`.
+        
+        individuos (list[IndividuoA], optional, defaults to None) :
+            Individuos a evaluar.
+            Si es None se utiliza `self.individuos`
+        
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray] :
+            Arrays con forma `(n,)`:
+            * makespan de cada individuo.
+            * precio de la energia de cada individuo.
+            * aptitud de cada individuo, `peso_makespan * makespan + peso_energia * precio de la energia`.
+        """
+        if individuos is None:
+            individuos = self.individuos
+        
+        objetivos = np.array([individuo.objetivos() for individuo in individuos], dtype=float)
+        makespan = objetivos[:, 0]
+        costo = objetivos[:, 1]
+        
+        return makespan, costo, peso_makespan * makespan + peso_energia * costo
+    
     def guardar(self, path : str = None):
         """
         guardar - 
@@ -584,3 +1562,24 @@ class Poblacion():
                     archivo.write(f"\noptimizando: {self.medida_busqueda[g]}")
                 else:
                     archivo.write("\noptimizando: otro")
+            archivo.write(f"\n\nOperadores mutacion")
+            archivo.write(f"\nponderacion_mutacion: {self.ponderacion_mutacion}")
+            for linea in self.operadores_mutacion.resumen():
+                archivo.write(f"\n{linea}")
+            archivo.write(f"\n\nConvergencia")
+            archivo.write(f"\ngeneraciones_sin_mejora: {self.generaciones_sin_mejora}")
+            archivo.write(f"\nmejora_relativa_minima: {self.mejora_relativa_minima}")
+            archivo.write(f"\nventana_mejora: {self.ventana_mejora}")
+            archivo.write(f"\ndiversidad_minima: {self.diversidad_minima}")
+            archivo.write(f"\ncota_inferior: {self.cota_inferior}")
+            archivo.write(f"\naccion_convergencia: {self.accion_convergencia}")
+            archivo.write(f"\nproporcion_reinicio: {self.proporcion_reinicio}")
+            for generacion, criterio, accion in self.eventos_convergencia:
+                archivo.write(f"\nGeneracion {generacion}: {criterio}, {accion}")
+            archivo.write(f"\n\nSeleccion")
+            archivo.write(f"\nseleccion: {self.seleccion}")
+            archivo.write(f"\ntamano_torneo: {self.tamano_torneo}")
+            archivo.write(f"\npresion_ranking: {self.presion_ranking}")
+            archivo.write(f"\nreemplazo: {self.reemplazo}")
+            archivo.write(f"\nproporcion_estado_estable: {self.proporcion_estado_estable}")
+            archivo.write(f"\nevaluaciones: {self.evaluaciones}")
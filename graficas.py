@@ -1,6 +1,6 @@
 import numpy as np
 import pandas as pd
-from Carga_Datos import Datos, str_a_task_mode, task_mode_a_str, PATH_INPUT
+from Carga_Datos import cargar_instancia, PATH_INPUT, GEN_VACIO, CAPA_GEN, cromosoma_vacio
 from matplotlib.patches import Patch
 import matplotlib.pyplot as plt
 from matplotlib.colors import ListedColormap
@@ -98,58 +98,60 @@ def task_array_to_dataframe(
         , input_path : str = PATH_INPUT
     ) -> pd.DataFrame:
     
-    datos = Datos(path = input_path)
+    datos = cargar_instancia(path = input_path)
     
     machines_dict = datos.machines_id
     
-    df = pd.DataFrame(
-        columns=["Maquina", "Start", "End","Producto","Demanda","task_mode","paso"]
-    )
+    filas_maquina = list()
+    filas_start = list()
+    filas_end = list()
+    filas_gen = list()
     
+    #cada fila es un gen en una maquina, en orden de maquina y primer periodo ocupado
     for maquina, num_maq in machines_dict.items():
-        for periodo in range(len(datos.periodos)):
-            
-            valor : str = array[num_maq, periodo]
-            
-            if valor == "":
-                continue
-            
-            producto, demanda, task_mode, intervalo, paso = str_a_task_mode(
-                valor
-            )
-            
-            demanda = str(demanda)
-            paso = str(paso)
-            
-            fila = df.loc[
-                (df["Maquina"] == maquina) &
-                (df["Producto"] == producto) &
-                (df["Demanda"] == demanda) &
-                (df["task_mode"] == task_mode) &
-                (df["paso"] == paso)
-            ].copy()
-            
-            if fila.empty:
-                #vacia
-                df.loc[len(df)] = [
-                    maquina
-                    , periodo
-                    , periodo
-                    , producto
-                    , demanda
-                    , task_mode
-                    , paso
-                ]
-                
-            else:
-                #tiene datos
-                valor = fila["End"] + 1
-                df.loc[fila.index, "End"] = valor
+        genes_maquina : np.ndarray = array[CAPA_GEN, num_maq]
+        
+        ocupados = np.flatnonzero(genes_maquina != GEN_VACIO)
+        if ocupados.size == 0:
+            continue
+        
+        genes, primer_indice, cantidad = np.unique(
+            genes_maquina[ocupados], return_index=True, return_counts=True
+        )
+        orden = np.argsort(primer_indice, kind="stable")
+        
+        filas_maquina.extend([maquina] * len(orden))
+        filas_start.append(ocupados[primer_indice[orden]])
+        filas_end.append(ocupados[primer_indice[orden]] + cantidad[orden] - 1)
+        filas_gen.append(genes[orden])
+    
+    if len(filas_maquina) > 0:
+        filas_start = np.concatenate(filas_start).astype(np.int64)
+        filas_end = np.concatenate(filas_end).astype(np.int64)
+        filas_gen = np.concatenate(filas_gen)
+    
+    #(producto, demanda, paso, task_mode) de cada fila
+    informacion = [datos.genes[gen_id] for gen_id in filas_gen]
+    
+    productos = [producto for producto, _, _, _ in informacion]
+    demandas = [str(demanda) for _, demanda, _, _ in informacion]
+    task_modes = [task_mode for _, _, _, task_mode in informacion]
+    pasos = [str(paso) for _, _, paso, _ in informacion]
+    
+    df = pd.DataFrame({
+        "Maquina" : filas_maquina
+        , "Start" : np.asarray(filas_start, dtype=np.int64) + 1
+        , "End" : np.asarray(filas_end, dtype=np.int64) + 1
+        , "Producto" : productos
+        , "Demanda" : demandas
+        , "task_mode" : task_modes
+        , "paso" : pasos
+    })
     
-    df["End"] = df["End"] + 1
-    df["Start"] = df["Start"] + 1
     df["delta"] = df["End"] - df["Start"]
-    df["Activity"] = df[["Maquina","Producto","Demanda","task_mode","paso"]].agg('|'.join, axis=1)
+    df["Activity"] = [
+        "|".join(fila) for fila in zip(filas_maquina, productos, demandas, task_modes, pasos)
+    ]
     
     return df
 
@@ -157,7 +159,8 @@ def dataframe_to_array(
         df : pd.DataFrame
         , dict_maquinas : dict[str, int]
         , periodos : int
-    ) -> np.ndarray[tuple[int, int], str]:
+        , input_path : str = PATH_INPUT
+    ) -> np.ndarray[tuple[int, int, int], np.dtype[np.int32]]:
     
     if periodos <= 0:
         raise ValueError("Cantidad de periodos no válida")
@@ -165,12 +168,11 @@ def dataframe_to_array(
     if not set(["Maquina", "Start","Producto","Demanda","task_mode","paso"]).issubset(df.columns):
         raise ValueError('Las columnas de df deben ser: ["Maquina", "Start","Producto","Demanda","task_mode","paso"]')
     
-    datos = Datos()
+    datos = cargar_instancia(path = input_path)
     
-    array = np.full(
-        shape = (len(dict_maquinas.keys()), periodos),
-        fill_value = "",
-        dtype = 'object'
+    array = cromosoma_vacio(
+        maquinas = len(dict_maquinas.keys())
+        , periodos = periodos
     )
     
     for idx, row in df.iterrows():
@@ -182,17 +184,10 @@ def dataframe_to_array(
         paso = row["paso"]
         
         intervalos = datos.intervalos(task_mode=task_mode)
+        gen_id = datos.genes_id[(producto, int(demanda), int(paso), task_mode)]
         
         for i in range(len(intervalos)):
-            valor = task_mode_a_str(
-                producto=producto
-                , demanda=demanda
-                , task_mode=task_mode
-                , intervalo=i
-                , paso=paso
-            )
-            
-            array[dict_maquinas[maquina], periodo + i] = valor
+            array[:, dict_maquinas[maquina], periodo + i] = (gen_id, i)
     return array
 
 def grafica_gantt_plt(
@@ -0,0 +1,134 @@
+import unittest
+import numpy as np
+from Carga_Datos import PATH_INPUT_TEST, GEN_VACIO, CAPA_GEN
+from genetico.IndividuoA import IndividuoA
+
+SEMILLAS = (0, 1, 2)
+
+def _mover_a_periodo_libre(
+        individuo : IndividuoA
+        , maquina : str
+        , inicio : int
+        , minimo : int
+    ) -> np.ndarray:
+    """
+    _mover_a_periodo_libre -
+    
+    Mueve el task mode que inicia en `inicio` de `maquina` al primer hueco de la misma
+    máquina que inicia después de `minimo`, sin revisar si el resultado es viable.
+    
+    Returns
+    -------
+    np.ndarray :
+        Genoma compacto con el task mode movido.
+    """
+    genoma = individuo.genoma_compacto()
+    posicion = individuo.maquinas[maquina]
+    fila = np.nonzero((genoma[:, 0] == posicion) & (genoma[:, 1] == inicio))[0][0]
+    
+    duracion = int(np.count_nonzero(individuo.cromosoma[CAPA_GEN, posicion] == genoma[fila, 2]))
+    libres = individuo.cromosoma[CAPA_GEN, posicion] == GEN_VACIO
+    for nuevo in range(minimo, len(libres) - duracion + 1):
+        if libres[nuevo - 1:nuevo - 1 + duracion].all():
+            genoma[fila, 1] = nuevo
+            return genoma
+    raise AssertionError(f"no hay un hueco despues del periodo {minimo} en {maquina}")
+
+class TestEsViable(unittest.TestCase):
+
+    def test_individuos_inicializados_viables(self):
+        for semilla in SEMILLAS:
+            individuo = IndividuoA(inicializar=True, random_seed=semilla, input_path=PATH_INPUT_TEST)
+            self.assertTrue(individuo.es_viable()["todo"]["bool"], semilla)
+    
+    def test_deadline_del_ultimo_paso(self):
+        individuo = IndividuoA(inicializar=True, random_seed=0, input_path=PATH_INPUT_TEST)
+        producto, demanda, deadline = next(iter(individuo.datos.iterar_deadlines()))
+        
+        df = individuo.dataframe()
+        tareas = df[(df.Producto == producto) & (df.Demanda == str(demanda))]
+        ultimo = tareas.loc[tareas.paso.astype(int).idxmax()]
+        
+        genoma = _mover_a_periodo_libre(individuo, str(ultimo.Maquina), int(ultimo.Start), deadline + 1)
+        individuo.cargar_genoma_compacto(genoma)
+        
+        viable = individuo.es_viable()
+        self.assertFalse(viable["produccion"]["bool"])
+        self.assertIn("deadline", [error["tipo"] for error in viable["produccion"]["lista"]])
+    
+    def test_orden_de_los_pasos(self):
+        individuo = IndividuoA(inicializar=True, random_seed=0, input_path=PATH_INPUT_TEST)
+        
+        #primer paso de un producto con mas de un paso, se mueve despues del segundo paso
+        df = individuo.dataframe()
+        df["paso"] = df.paso.astype(int)
+        for (producto, demanda), tareas in df.groupby(["Producto", "Demanda"]):
+            if len(tareas) > 1:
+                break
+        tareas = tareas.sort_values("paso")
+        primero = tareas.iloc[0]
+        
+        genoma = _mover_a_periodo_libre(individuo, str(primero.Maquina), int(primero.Start), int(tareas.iloc[1].End))
+        individuo.cargar_genoma_compacto(genoma)
+        
+        viable = individuo.es_viable()
+        self.assertFalse(viable["produccion"]["bool"])
+        errores = [
+            error for error in viable["produccion"]["lista"]
+            if (error["tipo"] == "produccion") and (error["producto"] == producto)
+        ]
+        self.assertEqual(len(errores), 1)
+        self.assertFalse(errores[0]["pasos_orden_bool"])
+
+class TestOptimizacionDeterministica(unittest.TestCase):
+
+    def test_igual_al_punto_fijo_de_mover_periodo(self):
+        #aplicar mover_periodo_task_mode completo hacia la izquierda en el inicio de cada task
+        #hasta que ningun task se mueva debe dar el mismo cromosoma que optimizacion_deterministica
+        for semilla in SEMILLAS:
+            individuo = IndividuoA(inicializar=True, random_seed=semilla, input_path=PATH_INPUT_TEST)
+            referencia = individuo.clone()
+            
+            individuo.optimizacion_deterministica()
+            
+            cambios = True
+            while cambios:
+                cambios = False
+                inicios = sorted(
+                    (inicio, maquina)
+                    for maquina, (inicios_maquina, _) in referencia.task_modes_por_maquina().items()
+                    for inicio in inicios_maquina
+                )
+                for inicio, maquina in inicios:
+                    _, periodo, _, array = referencia.mover_periodo_task_mode(
+                        maquina=maquina, periodo=inicio, tipo_movimiento=-1, completa=True
+                    )
+                    if periodo != inicio:
+                        referencia.cromosoma = array
+                        cambios = True
+            
+            np.testing.assert_array_equal(individuo.cromosoma, referencia.cromosoma)
+            self.assertTrue(individuo.es_viable()["todo"]["bool"], semilla)
+
+class TestMutacion(unittest.TestCase):
+
+    def test_cada_operador_se_aplica(self):
+        #con el peso de un solo operador, mutacion debe aplicar ese operador
+        for pesos in ({"peso_mover_periodo" : 1, "peso_cambiar_task" : 0}
+                , {"peso_mover_periodo" : 0, "peso_cambiar_task" : 1}):
+            aplicadas = 0
+            for semilla in range(10):
+                individuo = IndividuoA(inicializar=True, random_seed=semilla, input_path=PATH_INPUT_TEST)
+                inicial = individuo.cromosoma.copy()
+                
+                if individuo.mutacion(**pesos):
+                    aplicadas += 1
+                    self.assertFalse(np.array_equal(individuo.cromosoma, inicial), pesos)
+                    self.assertTrue(individuo.es_viable()["todo"]["bool"], pesos)
+                else:
+                    np.testing.assert_array_equal(individuo.cromosoma, inicial)
+            
+            self.assertGreater(aplicadas, 0, pesos)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import os
+import tempfile
+from Carga_Datos import PATH_INPUT_TEST
+from genetico.Islas import Islas
+
+def _islas(**kwargs) -> Islas:
+    """
+    _islas -
+    
+    Tres islas pequeñas de la instancia de prueba con semilla fija.
+    """
+    parametros_isla = dict(
+        n=6
+        , probabilidad_mutacion=0.5
+        , intentos_mutacion=2
+    )
+    parametros = dict(
+        parametros=[
+            dict(parametros_isla)
+            , dict(parametros_isla, ciclo={"makespan" : 1, "energia" : 2})
+            , dict(parametros_isla, ciclo={"makespan" : 2, "energia" : 1}, iniciar_makespan=False)
+        ]
+        , generaciones=5
+        , generaciones_migracion=2
+        , tiempo=None
+        , id_nombre="prueba"
+        , random_seed=1
+        , input_path=PATH_INPUT_TEST
+    )
+    parametros.update(kwargs)
+    return Islas(**parametros)
+
+class TestIslas(unittest.TestCase):
+    
+    def test_calcular_solucion(self):
+        for topologia in ("anillo", "aleatoria"):
+            islas = _islas(topologia=topologia)
+            
+            with tempfile.TemporaryDirectory() as carpeta:
+                islas.calcular_solucion(path=carpeta)
+                
+                for i in range(len(islas.islas)):
+                    self.assertTrue(os.path.exists(os.path.join(carpeta, f"prueba_isla_{i}.txt")), topologia)
+                
+                islas.guardar(path=carpeta)
+                self.assertTrue(os.path.exists(os.path.join(carpeta, "prueba.txt")), topologia)
+            
+            #migraciones en las generaciones 2 y 4, y el final en la 5
+            self.assertEqual([generacion for generacion, _, _, _ in islas.historial], [2, 4, 5], topologia)
+            aptitudes = [aptitud for _, _, aptitud, _ in islas.historial]
+            self.assertEqual(aptitudes, sorted(aptitudes, reverse=True), topologia)
+            self.assertEqual(islas.incumbente().aptitud(), islas.aptitud_incumbente, topologia)
+    
+    def test_guardar_sin_calcular_solucion(self):
+        islas = _islas()
+        with tempfile.TemporaryDirectory() as carpeta:
+            with self.assertRaises(ValueError):
+                islas.guardar(path=carpeta)
+
+if __name__ == "__main__":
+    unittest.main()
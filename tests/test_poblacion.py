@@ -0,0 +1,113 @@
+import unittest
+from unittest import mock
+import os
+import tempfile
+import numpy as np
+from Carga_Datos import PATH_INPUT_TEST
+from genetico.Poblacion import Poblacion
+
+def _poblacion(**kwargs) -> Poblacion:
+    """
+    _poblacion -
+    
+    Población pequeña de la instancia de prueba con semilla fija.
+    """
+    parametros = dict(
+        n=6
+        , generaciones=4
+        , tiempo=None
+        , random_seed=1
+        , probabilidad_mutacion=0.5
+        , intentos_mutacion=2
+        , id_nombre="prueba"
+        , input_path=PATH_INPUT_TEST
+    )
+    parametros.update(kwargs)
+    return Poblacion(**parametros)
+
+class TestProcesos(unittest.TestCase):
+
+    def test_mismo_resultado_con_varios_procesos(self):
+        ciclo = {"makespan" : 1, "energia" : 2}
+        
+        serial = _poblacion(procesos=1)
+        serial.calcular_solucion(ciclo=ciclo)
+        
+        paralelo = _poblacion(procesos=2)
+        paralelo.calcular_solucion(ciclo=ciclo)
+        
+        self.assertEqual(serial.aptitudes, paralelo.aptitudes)
+        self.assertEqual(serial.makespan, paralelo.makespan)
+        self.assertEqual(serial.costo, paralelo.costo)
+        np.testing.assert_array_equal(serial.genomas, paralelo.genomas)
+        self.assertEqual(serial.operadores_mutacion.probabilidades, paralelo.operadores_mutacion.probabilidades)
+        for nombre, estadistica in serial.operadores_mutacion.estadisticas.items():
+            self.assertEqual(
+                estadistica["intentos"], paralelo.operadores_mutacion.estadisticas[nombre]["intentos"]
+            )
+
+class TestCheckpoint(unittest.TestCase):
+
+    def test_reanudar_igual_a_la_simulacion_completa(self):
+        kwargs_poblacion = dict(
+            generaciones=8
+            , generaciones_sin_mejora=2
+            , accion_convergencia="reiniciar"
+            , seleccion="torneo"
+            , reemplazo="elitista"
+        )
+        ciclo = {"makespan" : 2, "energia" : 3}
+        
+        completa = _poblacion(**kwargs_poblacion)
+        completa.calcular_solucion(ciclo=ciclo, iniciar_makespan=False)
+        
+        with tempfile.TemporaryDirectory() as carpeta:
+            checkpoint = os.path.join(carpeta, "prueba.npz")
+            
+            #la simulacion se interrumpe al crear la sexta generacion, el ultimo checkpoint es de la cuarta
+            interrumpida = _poblacion(**kwargs_poblacion)
+            crear_generacion = Poblacion.crear_generacion
+            llamadas = []
+            def crear_generacion_falla(poblacion, *args, **kwargs):
+                llamadas.append(None)
+                if len(llamadas) == 6:
+                    raise RuntimeError("falla simulada")
+                return crear_generacion(poblacion, *args, **kwargs)
+            
+            with mock.patch.object(Poblacion, "crear_generacion", crear_generacion_falla):
+                with self.assertRaises(RuntimeError):
+                    interrumpida.calcular_solucion(
+                        ciclo=ciclo, iniciar_makespan=False
+                        , checkpoint=checkpoint, generaciones_checkpoint=2
+                    )
+            
+            self.assertFalse(os.path.exists(f"{checkpoint}.tmp"))
+            
+            #sin generaciones_checkpoint se conserva el intervalo de calcular_solucion
+            guardar_checkpoint = Poblacion._Poblacion__guardar_checkpoint
+            generaciones_guardadas = []
+            def guardar_checkpoint_registro(poblacion, path):
+                #medida_busqueda incluye la poblacion inicial
+                generaciones_guardadas.append(len(poblacion.medida_busqueda) - 1)
+                return guardar_checkpoint(poblacion, path)
+            
+            with mock.patch.object(Poblacion, "_Poblacion__guardar_checkpoint", guardar_checkpoint_registro):
+                reanudada = Poblacion.reanudar(checkpoint)
+        
+        self.assertEqual(generaciones_guardadas, [6, 8])
+        self.assertEqual(completa.aptitudes, reanudada.aptitudes)
+        self.assertEqual(completa.makespan, reanudada.makespan)
+        self.assertEqual(completa.costo, reanudada.costo)
+        self.assertEqual(completa.medida_busqueda, reanudada.medida_busqueda)
+        self.assertEqual(completa.eventos_convergencia, reanudada.eventos_convergencia)
+        self.assertEqual(completa.evaluaciones, reanudada.evaluaciones)
+        np.testing.assert_array_equal(completa.genomas, reanudada.genomas)
+        #el tiempo medido de las mutaciones no se compara
+        self.assertEqual(completa.operadores_mutacion.probabilidades, reanudada.operadores_mutacion.probabilidades)
+        self.assertEqual(completa.operadores_mutacion.calidades, reanudada.operadores_mutacion.calidades)
+        for nombre, estadistica in completa.operadores_mutacion.estadisticas.items():
+            for llave in ("intentos", "exitos", "mejora"):
+                self.assertEqual(estadistica[llave], reanudada.operadores_mutacion.estadisticas[nombre][llave])
+
+if __name__ == "__main__":
+    unittest.main()